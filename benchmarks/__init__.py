@@ -0,0 +1,5 @@
+"""
+Benchmarks for `slotted`.
+
+Run with ``python -m benchmarks`` from the repository root.
+"""
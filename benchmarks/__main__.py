@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from tippo import List, Optional
+
+from . import (  # noqa
+    bench_abc,
+    bench_classes,
+    bench_copy,
+    bench_import,
+    bench_instances,
+    bench_pickle,
+    bench_threads,
+)
+from ._runner import compare, dump, load, run
+
+
+def main(argv=None):
+    # type: (Optional[List[str]]) -> None
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run slotted benchmarks."
+    )
+    parser.add_argument("pattern", nargs="?", help="only run matching benchmarks")
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument("-c", "--compare", help="compare with a baseline JSON file")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timed runs")
+    parser.add_argument(
+        "-t", "--min-time", type=float, default=0.1, help="minimum run duration"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, repeat=args.repeat, min_time=args.min_time)
+    if args.output:
+        dump(results, args.output)
+    if args.compare:
+        for line in compare(load(args.compare), results):
+            print(line)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import collections
+import json
+import platform
+import sys
+import time
+
+import six
+from tippo import Any, Callable, Dict, List, Optional
+
+__all__ = ["benchmark", "BENCHMARKS", "run", "dump", "load", "compare"]
+
+
+# Benchmark name -> (time function, fixed number of loops or None to calibrate).
+BENCHMARKS = collections.OrderedDict()  # type: Dict[str, Any]
+
+_perf_counter = getattr(time, "perf_counter", time.time)
+
+
+def benchmark(name, loops=None):
+    # type: (str, Optional[int]) -> Callable[[Callable[[int], float]], Any]
+    """
+    Register a time function, which takes a number of loops and returns the elapsed
+    time in seconds (same as :meth:`pyperf.Runner.bench_time_func`).
+
+    :param name: Benchmark name.
+    :param loops: Fixed number of loops (calibrated automatically if None).
+    :return: Decorator.
+    """
+
+    def decorator(func):
+        # type: (Callable[[int], float]) -> Callable[[int], float]
+        if name in BENCHMARKS:
+            error = "benchmark {!r} is already registered".format(name)
+            raise ValueError(error)
+        BENCHMARKS[name] = (func, loops)
+        return func
+
+    return decorator
+
+
+def timer(func, loops):
+    # type: (Callable[[], Any], int) -> float
+    """Time calling a function with no arguments a number of times."""
+    loop_range = six.moves.range(loops)
+    start = _perf_counter()
+    for _ in loop_range:
+        func()
+    return _perf_counter() - start
+
+
+def _calibrate(func, min_time):
+    # type: (Callable[[int], float], float) -> int
+    loops = 1
+    while func(loops) < min_time:
+        loops *= 2
+    return loops
+
+
+def run(pattern=None, repeat=5, min_time=0.1):
+    # type: (Optional[str], int, float) -> Dict[str, Any]
+    """
+    Run the registered benchmarks.
+
+    :param pattern: Only run benchmarks whose name contain this pattern.
+    :param repeat: Number of timed runs for each benchmark.
+    :param min_time: Minimum duration of each run when calibrating loops.
+    :return: Results in the pyperf JSON layout.
+    """
+    results = []  # type: List[Dict[str, Any]]
+    for name, (func, loops) in six.iteritems(BENCHMARKS):
+        if pattern is not None and pattern not in name:
+            continue
+        if loops is None:
+            loops = _calibrate(func, min_time)
+        values = [func(loops) / loops for _ in six.moves.range(repeat)]
+        results.append(
+            {
+                "metadata": {"name": name, "loops": loops, "unit": "second"},
+                "runs": [{"values": values}],
+            }
+        )
+        sys.stderr.write("{}: {}\n".format(name, _format_time(_mean(values))))
+    return {
+        "version": "1.0",
+        "metadata": {
+            "python_implementation": platform.python_implementation(),
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "benchmarks": results,
+    }
+
+
+def dump(results, path):
+    # type: (Dict[str, Any], str) -> None
+    """Write results to a JSON file."""
+    with open(path, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+
+
+def load(path):
+    # type: (str) -> Dict[str, Any]
+    """Read results from a JSON file."""
+    with open(path, "r") as fp:
+        return json.load(fp)  # type: ignore
+
+
+def _mean(values):
+    # type: (List[float]) -> float
+    return sum(values) / len(values)
+
+
+def _means(results):
+    # type: (Dict[str, Any]) -> Dict[str, float]
+    means = {}
+    for bench in results["benchmarks"]:
+        values = [v for r in bench["runs"] for v in r["values"]]
+        means[bench["metadata"]["name"]] = _mean(values)
+    return means
+
+
+def _format_time(seconds):
+    # type: (float) -> str
+    for unit, scale in (("s", 1.0), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1.0:
+            return "{:.2f} {}".format(seconds * scale, unit)
+    return "{:.1f} ns".format(seconds * 1e9)
+
+
+def compare(baseline, results):
+    # type: (Dict[str, Any], Dict[str, Any]) -> List[str]
+    """
+    Compare results against a baseline.
+
+    :param baseline: Baseline results.
+    :param results: Current results.
+    :return: Report lines.
+    """
+    baseline_means = _means(baseline)
+    lines = []
+    for name, mean in six.iteritems(_means(results)):
+        if name not in baseline_means:
+            lines.append("{}: {} (not in baseline)".format(name, _format_time(mean)))
+            continue
+        base = baseline_means[name]
+        if mean <= base:
+            change = "{:.2f}x faster".format(base / mean)
+        else:
+            change = "{:.2f}x slower".format(mean / base)
+        lines.append(
+            "{}: {} -> {}: {}".format(
+                name, _format_time(base), _format_time(mean), change
+            )
+        )
+    return lines
@@ -0,0 +1,74 @@
+from six.moves import collections_abc
+
+from slotted import SlottedMapping, SlottedSequence
+
+from ._runner import benchmark, timer
+
+
+class MyMapping(SlottedMapping):  # type: ignore
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+
+def _isinstance(obj, cls, loops):
+    # type: (object, type, int) -> float
+    return timer(lambda: isinstance(obj, cls), loops)
+
+
+def _issubclass(subclass, cls, loops):
+    # type: (type, type, int) -> float
+    return timer(lambda: issubclass(subclass, cls), loops)
+
+
+@benchmark("isinstance/Mapping")
+def bench_isinstance_mapping(loops):
+    # type: (int) -> float
+    return _isinstance(MyMapping(), collections_abc.Mapping, loops)
+
+
+@benchmark("isinstance/SlottedMapping")
+def bench_isinstance_slotted_mapping(loops):
+    # type: (int) -> float
+    return _isinstance(MyMapping(), SlottedMapping, loops)
+
+
+@benchmark("isinstance/Sequence/negative")
+def bench_isinstance_sequence_negative(loops):
+    # type: (int) -> float
+    return _isinstance(MyMapping(), collections_abc.Sequence, loops)
+
+
+@benchmark("isinstance/SlottedSequence/negative")
+def bench_isinstance_slotted_sequence_negative(loops):
+    # type: (int) -> float
+    return _isinstance(MyMapping(), SlottedSequence, loops)
+
+
+@benchmark("issubclass/Mapping")
+def bench_issubclass_mapping(loops):
+    # type: (int) -> float
+    return _issubclass(MyMapping, collections_abc.Mapping, loops)
+
+
+@benchmark("issubclass/SlottedMapping")
+def bench_issubclass_slotted_mapping(loops):
+    # type: (int) -> float
+    return _issubclass(MyMapping, SlottedMapping, loops)
+
+
+@benchmark("issubclass/Sequence/negative")
+def bench_issubclass_sequence_negative(loops):
+    # type: (int) -> float
+    return _issubclass(tuple, collections_abc.Sequence, loops)
+
+
+@benchmark("issubclass/SlottedSequence/negative")
+def bench_issubclass_slotted_sequence_negative(loops):
+    # type: (int) -> float
+    return _issubclass(tuple, SlottedSequence, loops)
@@ -0,0 +1,48 @@
+import abc
+
+from slotted import SlottedABCMeta, SlottedMeta, make_class
+
+from ._runner import benchmark, timer
+
+
+def _make_creator(meta):
+    # type: (type) -> object
+    base = meta("Base", (object,), {"__slots__": ("a", "b")})
+    bases = (base,)
+
+    def create():
+        meta("Class", bases, {"__slots__": ("c", "d")})
+
+    return create
+
+
+@benchmark("class_creation/type")
+def bench_type(loops):
+    # type: (int) -> float
+    return timer(_make_creator(type), loops)
+
+
+@benchmark("class_creation/SlottedMeta")
+def bench_slotted_meta(loops):
+    # type: (int) -> float
+    return timer(_make_creator(SlottedMeta), loops)
+
+
+@benchmark("class_creation/ABCMeta")
+def bench_abc_meta(loops):
+    # type: (int) -> float
+    return timer(_make_creator(abc.ABCMeta), loops)
+
+
+@benchmark("class_creation/SlottedABCMeta")
+def bench_slotted_abc_meta(loops):
+    # type: (int) -> float
+    return timer(_make_creator(SlottedABCMeta), loops)
+
+
+@benchmark("make_class/cached")
+def bench_make_class_cached(loops):
+    # type: (int) -> float
+    slots = ("a", "b", "c")
+    make_class("Row", slots, init=True)
+    return timer(lambda: make_class("Row", slots, init=True), loops)
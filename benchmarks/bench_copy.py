@@ -0,0 +1,71 @@
+import copy
+
+from slotted import Slotted
+
+from ._runner import benchmark, timer
+
+
+class DefaultRecord(Slotted):
+    __slots__ = ("id", "name", "value", "tags")
+
+    def __init__(self, id_, name, value, tags):
+        self.id = id_
+        self.name = name
+        self.value = value
+        self.tags = tags
+
+
+class CopyRecord(DefaultRecord, copy=True):
+    pass
+
+
+def _record(cls):
+    # type: (type) -> DefaultRecord
+    return cls(1, "record", 0.5, ("a", "b"))
+
+
+@benchmark("copy/default")
+def bench_copy_default(loops):
+    # type: (int) -> float
+    record = _record(DefaultRecord)
+    return timer(lambda: copy.copy(record), loops)
+
+
+@benchmark("copy/generated")
+def bench_copy_generated(loops):
+    # type: (int) -> float
+    record = _record(CopyRecord)
+    return timer(lambda: copy.copy(record), loops)
+
+
+@benchmark("deepcopy/default")
+def bench_deepcopy_default(loops):
+    # type: (int) -> float
+    record = _record(DefaultRecord)
+    return timer(lambda: copy.deepcopy(record), loops)
+
+
+@benchmark("deepcopy/generated")
+def bench_deepcopy_generated(loops):
+    # type: (int) -> float
+    record = _record(CopyRecord)
+    return timer(lambda: copy.deepcopy(record), loops)
+
+
+@benchmark("replace/copy_and_set")
+def bench_copy_and_set(loops):
+    # type: (int) -> float
+    record = _record(DefaultRecord)
+
+    def copy_and_set():
+        new = copy.copy(record)
+        new.value = 1.0
+
+    return timer(copy_and_set, loops)
+
+
+@benchmark("replace/generated")
+def bench_replace_generated(loops):
+    # type: (int) -> float
+    record = _record(CopyRecord)
+    return timer(lambda: record.replace(value=1.0), loops)
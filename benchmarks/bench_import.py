@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+from ._runner import benchmark
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CODE = "\n".join(
+    (
+        "import time",
+        "perf_counter = getattr(time, 'perf_counter', time.time)",
+        "start = perf_counter()",
+        "import {module}",
+        "print(repr(perf_counter() - start))",
+    )
+)
+
+
+def _cold_import(module, loops):
+    # type: (str, int) -> float
+    elapsed = 0.0
+    for _ in range(loops):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _CODE.format(module=module)], cwd=_ROOT
+        )
+        elapsed += float(output.decode("ascii").strip())
+    return elapsed
+
+
+@benchmark("import/slotted", loops=20)
+def bench_import_slotted(loops):
+    # type: (int) -> float
+    return _cold_import("slotted", loops)
+
+
+@benchmark("import/slotted._abc", loops=20)
+def bench_import_slotted_abc(loops):
+    # type: (int) -> float
+    return _cold_import("slotted._abc", loops)
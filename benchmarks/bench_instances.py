@@ -0,0 +1,335 @@
+import math
+import random
+
+from slotted import (
+    Slotted,
+    as_dict,
+    as_dicts,
+    cached_slot_property,
+    from_dict,
+    from_rows,
+    release,
+)
+
+try:
+    from functools import cached_property
+except ImportError:  # Python < 3.8, compare with a plain property instead
+    cached_property = property  # type: ignore
+
+from ._runner import benchmark, timer
+
+
+class DictPoint(object):
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class SlottedPoint(Slotted):
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class GeneratedPoint(Slotted, init=True):
+    __slots__ = ("x", "y", "z")
+
+
+class PooledPoint(Slotted, init=True, pool=16):
+    __slots__ = ("x", "y", "z")
+
+
+class TrackedPoint(Slotted, init=True, track_instances=True):
+    __slots__ = ("x", "y", "z")
+
+
+class HashedPoint(Slotted, init=True):
+    __slots__ = ("x", "y", "z")
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+
+class FrozenPoint(Slotted, init=True, frozen=True):
+    __slots__ = ("x", "y", "z")
+
+
+class TupleRecord(Slotted, init=True):
+    __slots__ = ("x", "y", "z")
+
+    def __lt__(self, other):
+        return (self.x, self.y, self.z) < (other.x, other.y, other.z)
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join("{}={!r}".format(n, getattr(self, n)) for n in self.__slots__),
+        )
+
+
+class OrderedRecord(Slotted, init=True, order=True, repr=True):
+    __slots__ = ("x", "y", "z")
+
+
+class DictNormPoint(DictPoint):
+    @cached_property
+    def norm(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+
+class PropertyNormPoint(SlottedPoint):
+    @property
+    def norm(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+
+class CachedNormPoint(SlottedPoint):
+    @cached_slot_property
+    def norm(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+
+def _sort(cls, loops):
+    # type: (type, int) -> float
+    rng = random.Random(0)
+    records = [cls(rng.randint(0, 9), rng.randint(0, 9), i) for i in range(1000)]
+    rng.shuffle(records)
+    return timer(lambda: sorted(records), loops)
+
+
+def _rows():
+    # type: () -> list
+    return [(i, i + 1, i + 2) for i in range(1000)]
+
+
+def _instantiate(cls, loops):
+    # type: (type, int) -> float
+    return timer(lambda: cls(1, 2, 3), loops)
+
+
+def _lookup(cls, loops):
+    # type: (type, int) -> float
+    table = {cls(1, 2, 3): None}
+    point = cls(1, 2, 3)
+    return timer(lambda: point in table, loops)
+
+
+def _get(cls, loops):
+    # type: (type, int) -> float
+    point = cls(1, 2, 3)
+    return timer(lambda: point.x, loops)
+
+
+def _set(cls, loops):
+    # type: (type, int) -> float
+    point = cls(1, 2, 3)
+
+    def set_x():
+        point.x = 4
+
+    return timer(set_x, loops)
+
+
+@benchmark("instantiate/dict")
+def bench_instantiate_dict(loops):
+    # type: (int) -> float
+    return _instantiate(DictPoint, loops)
+
+
+@benchmark("instantiate/Slotted")
+def bench_instantiate_slotted(loops):
+    # type: (int) -> float
+    return _instantiate(SlottedPoint, loops)
+
+
+@benchmark("instantiate/Slotted(init=True)")
+def bench_instantiate_generated(loops):
+    # type: (int) -> float
+    return _instantiate(GeneratedPoint, loops)
+
+
+@benchmark("instantiate/Slotted(init=True, track_instances=True)")
+def bench_instantiate_tracked(loops):
+    # type: (int) -> float
+    return _instantiate(TrackedPoint, loops)
+
+
+@benchmark("instantiate_release/Slotted(init=True)")
+def bench_instantiate_discard(loops):
+    # type: (int) -> float
+    return _instantiate(GeneratedPoint, loops)
+
+
+@benchmark("instantiate_release/Slotted(init=True, pool=16)")
+def bench_instantiate_release_pooled(loops):
+    # type: (int) -> float
+    return timer(lambda: release(PooledPoint(1, 2, 3)), loops)
+
+
+@benchmark("instantiate/Slotted(init=True, frozen=True)")
+def bench_instantiate_frozen(loops):
+    # type: (int) -> float
+    return _instantiate(FrozenPoint, loops)
+
+
+@benchmark("hash/hash(tuple)")
+def bench_hash_hashed(loops):
+    # type: (int) -> float
+    point = HashedPoint(1, 2, 3)
+    return timer(lambda: hash(point), loops)
+
+
+@benchmark("hash/Slotted(frozen=True)")
+def bench_hash_frozen(loops):
+    # type: (int) -> float
+    point = FrozenPoint(1, 2, 3)
+    return timer(lambda: hash(point), loops)
+
+
+@benchmark("dict_lookup/hash(tuple)")
+def bench_dict_lookup_hashed(loops):
+    # type: (int) -> float
+    return _lookup(HashedPoint, loops)
+
+
+@benchmark("dict_lookup/Slotted(frozen=True)")
+def bench_dict_lookup_frozen(loops):
+    # type: (int) -> float
+    return _lookup(FrozenPoint, loops)
+
+
+@benchmark("getattr/dict")
+def bench_get_dict(loops):
+    # type: (int) -> float
+    return _get(DictPoint, loops)
+
+
+@benchmark("getattr/Slotted")
+def bench_get_slotted(loops):
+    # type: (int) -> float
+    return _get(SlottedPoint, loops)
+
+
+@benchmark("setattr/dict")
+def bench_set_dict(loops):
+    # type: (int) -> float
+    return _set(DictPoint, loops)
+
+
+@benchmark("setattr/Slotted")
+def bench_set_slotted(loops):
+    # type: (int) -> float
+    return _set(SlottedPoint, loops)
+
+
+@benchmark("sort_1000/tuple")
+def bench_sort_tuple(loops):
+    # type: (int) -> float
+    return _sort(TupleRecord, loops)
+
+
+@benchmark("sort_1000/Slotted(order=True)")
+def bench_sort_ordered(loops):
+    # type: (int) -> float
+    return _sort(OrderedRecord, loops)
+
+
+@benchmark("repr/getattr")
+def bench_repr_getattr(loops):
+    # type: (int) -> float
+    record = TupleRecord(1, 2, 3)
+    return timer(lambda: repr(record), loops)
+
+
+@benchmark("repr/Slotted(repr=True)")
+def bench_repr_generated(loops):
+    # type: (int) -> float
+    record = OrderedRecord(1, 2, 3)
+    return timer(lambda: repr(record), loops)
+
+
+@benchmark("rows_1000/[cls(*r) for r in rows]")
+def bench_rows_init(loops):
+    # type: (int) -> float
+    rows = _rows()
+    return timer(lambda: [GeneratedPoint(*r) for r in rows], loops)
+
+
+@benchmark("rows_1000/from_rows")
+def bench_rows_from_rows(loops):
+    # type: (int) -> float
+    rows = _rows()
+    return timer(lambda: from_rows(GeneratedPoint, rows), loops)
+
+
+@benchmark("rows_1000/from_rows/generator")
+def bench_rows_from_rows_generator(loops):
+    # type: (int) -> float
+    rows = _rows()
+    return timer(lambda: from_rows(GeneratedPoint, (r for r in rows)), loops)
+
+
+@benchmark("as_dict/getattr")
+def bench_as_dict_getattr(loops):
+    # type: (int) -> float
+    point = GeneratedPoint(1, 2, 3)
+    names = GeneratedPoint.__slots__
+    return timer(lambda: dict((n, getattr(point, n)) for n in names), loops)
+
+
+@benchmark("as_dict/as_dict")
+def bench_as_dict(loops):
+    # type: (int) -> float
+    point = GeneratedPoint(1, 2, 3)
+    return timer(lambda: as_dict(point), loops)
+
+
+@benchmark("as_dict_1000/as_dicts")
+def bench_as_dicts(loops):
+    # type: (int) -> float
+    points = [GeneratedPoint(*r) for r in _rows()]
+    return timer(lambda: as_dicts(points), loops)
+
+
+@benchmark("from_dict/cls(**dct)")
+def bench_from_dict_init(loops):
+    # type: (int) -> float
+    dct = {"x": 1, "y": 2, "z": 3}
+    return timer(lambda: GeneratedPoint(**dct), loops)
+
+
+@benchmark("from_dict/from_dict")
+def bench_from_dict(loops):
+    # type: (int) -> float
+    dct = {"x": 1, "y": 2, "z": 3}
+    return timer(lambda: from_dict(GeneratedPoint, dct), loops)
+
+
+@benchmark("cached_property/dict(functools.cached_property)")
+def bench_cached_property_dict(loops):
+    # type: (int) -> float
+    point = DictNormPoint(1, 2, 3)
+    return timer(lambda: point.norm, loops)
+
+
+@benchmark("cached_property/Slotted(property)")
+def bench_cached_property_property(loops):
+    # type: (int) -> float
+    point = PropertyNormPoint(1, 2, 3)
+    return timer(lambda: point.norm, loops)
+
+
+@benchmark("cached_property/Slotted(cached_slot_property)")
+def bench_cached_property_slotted(loops):
+    # type: (int) -> float
+    point = CachedNormPoint(1, 2, 3)
+    return timer(lambda: point.norm, loops)
@@ -0,0 +1,156 @@
+import pickle
+
+from slotted import SharedBatch, Slotted, SlottedStruct
+
+from ._runner import benchmark, timer
+
+_COUNT = 1000
+_BATCH_COUNT = 10000
+
+
+class DefaultRecord(Slotted):
+    __slots__ = ("id", "name", "value", "payload")
+
+    def __init__(self, id_, name, value, payload):
+        self.id = id_
+        self.name = name
+        self.value = value
+        self.payload = payload
+
+
+class ReduceRecord(DefaultRecord, reduce=True):
+    pass
+
+
+class TypedRecord(Slotted, init=True, reduce=True):
+    __slots__ = ("id", "value", "valid")
+    id: int
+    value: float
+    valid: bool
+
+
+def _typed_batch(count=_COUNT):
+    # type: (int) -> list
+    return [TypedRecord(i, i * 0.5, i % 2 == 0) for i in range(count)]
+
+
+def _batch(cls, count=_COUNT):
+    # type: (type, int) -> list
+    return [cls(i, "record", i * 0.5, b"payload") for i in range(count)]
+
+
+def _dumps(cls, loops):
+    # type: (type, int) -> float
+    batch = _batch(cls)
+    return timer(lambda: pickle.dumps(batch, pickle.HIGHEST_PROTOCOL), loops)
+
+
+def _loads(cls, loops):
+    # type: (type, int) -> float
+    data = pickle.dumps(_batch(cls), pickle.HIGHEST_PROTOCOL)
+    return timer(lambda: pickle.loads(data), loops)
+
+
+@benchmark("pickle/dumps/default")
+def bench_dumps_default(loops):
+    # type: (int) -> float
+    return _dumps(DefaultRecord, loops)
+
+
+@benchmark("pickle/dumps/reduce")
+def bench_dumps_reduce(loops):
+    # type: (int) -> float
+    return _dumps(ReduceRecord, loops)
+
+
+@benchmark("pickle/loads/default")
+def bench_loads_default(loops):
+    # type: (int) -> float
+    return _loads(DefaultRecord, loops)
+
+
+@benchmark("pickle/loads/reduce")
+def bench_loads_reduce(loops):
+    # type: (int) -> float
+    return _loads(ReduceRecord, loops)
+
+
+@benchmark("records/dumps/pickle")
+def bench_records_dumps_pickle(loops):
+    # type: (int) -> float
+    batch = _typed_batch()
+    return timer(lambda: pickle.dumps(batch, pickle.HIGHEST_PROTOCOL), loops)
+
+
+@benchmark("records/dumps/SlottedStruct")
+def bench_records_dumps_struct(loops):
+    # type: (int) -> float
+    batch = _typed_batch()
+    records = SlottedStruct(TypedRecord)
+    return timer(lambda: records.pack_many(batch), loops)
+
+
+@benchmark("records/loads/pickle")
+def bench_records_loads_pickle(loops):
+    # type: (int) -> float
+    data = pickle.dumps(_typed_batch(), pickle.HIGHEST_PROTOCOL)
+    return timer(lambda: pickle.loads(data), loops)
+
+
+@benchmark("records/loads/SlottedStruct")
+def bench_records_loads_struct(loops):
+    # type: (int) -> float
+    records = SlottedStruct(TypedRecord)
+    data = memoryview(records.pack_many(_typed_batch()))
+    return timer(lambda: records.unpack_many(data), loops)
+
+
+@benchmark("records/field/SlottedStruct.views")
+def bench_records_field_struct(loops):
+    # type: (int) -> float
+    records = SlottedStruct(TypedRecord)
+    data = memoryview(records.pack_many(_typed_batch()))
+    return timer(lambda: sum(v.id for v in records.views(data)), loops)
+
+
+def _pickle_roundtrip(batch, loops):
+    # type: (list, int) -> float
+    """Send a batch to another process (pickled by the sender, loaded by the worker)."""
+    return timer(
+        lambda: pickle.loads(pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)), loops
+    )
+
+
+def _shared_roundtrip(cls, batch, loops):
+    # type: (type, list, int) -> float
+    """Send a batch through shared memory (only the handle is pickled)."""
+
+    def roundtrip():
+        with SharedBatch(cls, batch) as shared:
+            pickle.loads(pickle.dumps(shared, pickle.HIGHEST_PROTOCOL)).load()
+
+    return timer(roundtrip, loops)
+
+
+@benchmark("batch_10000/typed/pickle")
+def bench_batch_typed_pickle(loops):
+    # type: (int) -> float
+    return _pickle_roundtrip(_typed_batch(_BATCH_COUNT), loops)
+
+
+@benchmark("batch_10000/typed/SharedBatch")
+def bench_batch_typed_shared(loops):
+    # type: (int) -> float
+    return _shared_roundtrip(TypedRecord, _typed_batch(_BATCH_COUNT), loops)
+
+
+@benchmark("batch_10000/untyped/pickle")
+def bench_batch_untyped_pickle(loops):
+    # type: (int) -> float
+    return _pickle_roundtrip(_batch(DefaultRecord, _BATCH_COUNT), loops)
+
+
+@benchmark("batch_10000/untyped/SharedBatch")
+def bench_batch_untyped_shared(loops):
+    # type: (int) -> float
+    return _shared_roundtrip(DefaultRecord, _batch(DefaultRecord, _BATCH_COUNT), loops)
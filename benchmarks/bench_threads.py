@@ -0,0 +1,82 @@
+"""
+Class creation and conversion spread across threads. The time per class only goes down
+with more threads on builds without the GIL (for example, CPython 3.13t).
+"""
+
+import abc
+import threading
+
+import six
+from tippo import Callable, List
+
+from slotted import SlottedABCMeta, SlottedMeta, convert
+
+from ._runner import _perf_counter, benchmark
+
+# Numbers of threads that class creation is spread across.
+_THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def _threaded(work, threads, loops):
+    # type: (Callable[[int], None], int, int) -> float
+    """Time running a total number of loops split across threads started together."""
+    start_event = threading.Event()
+    per_thread = [loops // threads] * threads
+    per_thread[0] += loops - sum(per_thread)
+
+    def target(count):
+        # type: (int) -> None
+        start_event.wait()
+        work(count)
+
+    workers = [
+        threading.Thread(target=target, args=(count,)) for count in per_thread
+    ]  # type: List[threading.Thread]
+    for worker in workers:
+        worker.start()
+    start = _perf_counter()
+    start_event.set()
+    for worker in workers:
+        worker.join()
+    return _perf_counter() - start
+
+
+def _make_creator(meta):
+    # type: (type) -> Callable[[int], None]
+    base = meta("Base", (object,), {"__slots__": ("a", "b")})
+    bases = (base,)
+
+    def create(count):
+        # type: (int) -> None
+        for _ in six.moves.range(count):
+            meta("Class", bases, {"__slots__": ("c", "d")})
+
+    return create
+
+
+def _make_converter():
+    # type: () -> Callable[[int], None]
+    base = abc.ABCMeta("Base", (object,), {"__slots__": ()})
+
+    def create(count):
+        # type: (int) -> None
+        for _ in six.moves.range(count):
+            convert(abc.ABCMeta("Class", (base,), {"__slots__": ()}))
+
+    return create
+
+
+def _register(name, make_work):
+    # type: (str, Callable[[], Callable[[int], None]]) -> None
+    for threads in _THREAD_COUNTS:
+
+        def time_func(loops, threads=threads):
+            # type: (int, int) -> float
+            return _threaded(make_work(), threads, loops)
+
+        benchmark("{}/threads-{}".format(name, threads))(time_func)
+
+
+_register("class_creation/SlottedMeta", lambda: _make_creator(SlottedMeta))
+_register("class_creation/SlottedABCMeta", lambda: _make_creator(SlottedABCMeta))
+_register("convert", _make_converter)
@@ -1,32 +1,49 @@
-from ._abc import (
-    SlottedABC,
-    SlottedABCGenericMeta,
-    SlottedABCMeta,
-    SlottedCallable,
-    SlottedCollection,
-    SlottedContainer,
-    SlottedHashable,
-    SlottedItemsView,
-    SlottedIterable,
-    SlottedIterator,
-    SlottedKeysView,
-    SlottedMapping,
-    SlottedMappingView,
-    SlottedMutableMapping,
-    SlottedMutableSequence,
-    SlottedMutableSet,
-    SlottedReversible,
-    SlottedSequence,
-    SlottedSet,
-    SlottedSized,
-    SlottedValuesView,
+from ._array import SlottedArray
+from ._cached import cached_slot_property
+from ._census import CensusEntry, census
+from ._factory import make_class
+from ._memory import LayoutReport, MemoryReport, layout_report, memory_report
+from ._packing import SlottedStruct
+from ._pool import SlottedPool, get_pool, pooled, release
+from ._rows import (
+    as_dict,
+    as_dicts,
+    as_tuple,
+    as_tuples,
+    from_dict,
+    from_dicts,
+    from_rows,
 )
-from ._slotted import Slotted, SlottedMeta, slots
+from ._slotted import SlotInfo, Slotted, SlottedMeta, slot_layout, slots
 
 __all__ = [
     "SlottedMeta",
     "Slotted",
     "slots",
+    "slot_layout",
+    "SlotInfo",
+    "cached_slot_property",
+    "make_class",
+    "from_rows",
+    "as_tuple",
+    "as_tuples",
+    "as_dict",
+    "as_dicts",
+    "from_dict",
+    "from_dicts",
+    "memory_report",
+    "MemoryReport",
+    "layout_report",
+    "LayoutReport",
+    "SlottedArray",
+    "SlottedStruct",
+    "SharedBatch",
+    "SlottedPool",
+    "get_pool",
+    "release",
+    "pooled",
+    "census",
+    "CensusEntry",
     "SlottedABCMeta",
     "SlottedABCGenericMeta",
     "SlottedABC",
@@ -48,4 +65,60 @@ __all__ = [
     "SlottedSized",
     "SlottedValuesView",
     "SlottedCollection",
+    "convert",
 ]
+
+# The 'abc' classes are only imported (and converted) when first accessed, and so is
+# 'SharedBatch' (which imports multiprocessing).
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import List
+
+    from ._abc import (
+        SlottedABC,
+        SlottedABCGenericMeta,
+        SlottedABCMeta,
+        SlottedCallable,
+        SlottedCollection,
+        SlottedContainer,
+        SlottedHashable,
+        SlottedItemsView,
+        SlottedIterable,
+        SlottedIterator,
+        SlottedKeysView,
+        SlottedMapping,
+        SlottedMappingView,
+        SlottedMutableMapping,
+        SlottedMutableSequence,
+        SlottedMutableSet,
+        SlottedReversible,
+        SlottedSequence,
+        SlottedSet,
+        SlottedSized,
+        SlottedValuesView,
+        convert,
+    )
+    from ._shared import SharedBatch
+
+
+def __getattr__(name):
+    # type: (str) -> object
+    if name == "SharedBatch":
+        from . import _shared
+
+        value = getattr(_shared, name)
+        globals()[name] = value
+        return value
+    if name in __all__:
+        from . import _abc
+
+        value = getattr(_abc, name)
+        globals()[name] = value
+        return value
+    error = "module {!r} has no attribute {!r}".format(__name__, name)
+    raise AttributeError(error)
+
+
+def __dir__():
+    # type: () -> List[str]
+    return sorted(set(globals()).union(__all__))
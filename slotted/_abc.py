@@ -1,5 +1,7 @@
 import abc
+import threading
 import types
+import weakref
 
 import six
 import tippo
@@ -10,7 +12,8 @@ from tippo import (
     Generic,
     GenericMeta,
     List,
-    Set,
+    MutableMapping,
+    Optional,
     Tuple,
     Type,
     TypeVar,
@@ -41,6 +44,7 @@ __all__ = [
     "SlottedSized",
     "SlottedValuesView",
     "SlottedCollection",
+    "convert",
 ]
 
 _ABC_ALL = [
@@ -85,22 +89,27 @@ _ABC_GENERIC = [
 ]
 
 
-SlottedCallable = tippo.Callable  # type: ignore
-SlottedContainer = tippo.Container
-SlottedHashable = tippo.Hashable
-SlottedItemsView = tippo.ItemsView
-SlottedIterable = tippo.Iterable
-SlottedIterator = tippo.Iterator
-SlottedKeysView = tippo.KeysView
-SlottedMapping = tippo.Mapping
-SlottedMappingView = tippo.MappingView
-SlottedMutableMapping = tippo.MutableMapping
-SlottedMutableSequence = tippo.MutableSequence
-SlottedMutableSet = tippo.MutableSet
-SlottedSequence = tippo.Sequence
-SlottedSet = tippo.AbstractSet
-SlottedSized = tippo.Sized
-SlottedValuesView = tippo.ValuesView
+# Static placeholders, the actual classes are converted lazily (see '__getattr__').
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    SlottedCallable = tippo.Callable  # type: ignore
+    SlottedContainer = tippo.Container
+    SlottedHashable = tippo.Hashable
+    SlottedItemsView = tippo.ItemsView
+    SlottedIterable = tippo.Iterable
+    SlottedIterator = tippo.Iterator
+    SlottedKeysView = tippo.KeysView
+    SlottedMapping = tippo.Mapping
+    SlottedMappingView = tippo.MappingView
+    SlottedMutableMapping = tippo.MutableMapping
+    SlottedMutableSequence = tippo.MutableSequence
+    SlottedMutableSet = tippo.MutableSet
+    SlottedSequence = tippo.Sequence
+    SlottedSet = tippo.AbstractSet
+    SlottedSized = tippo.Sized
+    SlottedValuesView = tippo.ValuesView
+    SlottedCollection = tippo.Collection
+    SlottedReversible = tippo.Reversible
 
 
 # Make missing types if they are not available.
@@ -117,12 +126,7 @@ def _mangle(name, owner_name):
     return name
 
 
-try:
-    getattr(collections_abc, "Collection")
-    SlottedCollection = tippo.Collection
-except AttributeError:
-    assert not hasattr(collections_abc, "Collection")
-
+if not hasattr(collections_abc, "Collection"):
     # noinspection PyAbstractClass
     class Collection(
         collections_abc.Sized,
@@ -132,24 +136,17 @@ except AttributeError:
         __slots__ = ()
 
     Collection.__module__ = collections_abc.__name__
-    SlottedCollection = Collection  # type: ignore
 
     _ABC_ALL.append("Collection")
     _MISSING_TYPES["Collection"] = Collection
 
 
-try:
-    getattr(collections_abc, "Reversible")
-    SlottedReversible = tippo.Reversible
-except AttributeError:
-    assert not hasattr(collections_abc, "Reversible")
-
+if not hasattr(collections_abc, "Reversible"):
     # noinspection PyAbstractClass
     class Reversible(collections_abc.Iterable):  # type: ignore
         __slots__ = ()
 
     Reversible.__module__ = collections_abc.__name__
-    SlottedReversible = Reversible  # type: ignore
 
     _ABC_ALL.append("Reversible")
     _MISSING_TYPES["Reversible"] = Reversible
@@ -181,7 +178,8 @@ else:
     ABC.register(SlottedABC)  # noqa
 
 
-_CLASSES = set()  # type: Set[Type[Any]]
+# Map public names to the classes they are converted from.
+_SOURCES = {}  # type: Dict[str, Type[Any]]
 for cls_name in _ABC_ALL:
     try:
         cls = getattr(collections_abc, cls_name)
@@ -192,14 +190,36 @@ for cls_name in _ABC_ALL:
             continue
     if not isinstance(cls, abc.ABCMeta) or not issubclass(cls, object):
         continue
-    _CLASSES.add(cls)
+    _SOURCES["Slotted{}".format(cls_name)] = cls
 
 
-_CACHE = {
+# Classes that all conversions end at.
+_ROOTS = {
     object: SlottedABC,
     abc.ABCMeta: SlottedABCMeta,
 }  # type: Dict[Type[Any], Union[SlottedABCMeta, Type[SlottedABCMeta]]]
 
+# Converted classes, weakly referenced on both ends so dynamic conversions don't leak.
+_CACHE = (
+    weakref.WeakKeyDictionary()
+)  # type: MutableMapping[Type[Any], weakref.ref[Any]]
+
+# Serializes conversions, cached results are published only when complete so they
+# can be read without holding the lock.
+_LOCK = threading.RLock()
+
+
+def _get_cached(source):
+    # type: (Type[Any]) -> Optional[Type[Any]]
+    try:
+        return _ROOTS[source]
+    except KeyError:
+        pass
+    ref = _CACHE.get(source)
+    if ref is None:
+        return None
+    return ref()
+
 
 def extract_dict(base):
     # type: (Type[Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]
@@ -217,17 +237,21 @@ def extract_dict(base):
     return base_dict, overrides
 
 
-def convert_meta(source):
+def _convert_meta(source):
     # type: (Type[Any]) -> Type[Any]
     """Convert an ABCMeta-based metaclass to a SlottedABCMeta-based metaclass."""
-    try:
-        return _CACHE[source]
-    except KeyError:
-        pass
+    if issubclass(source, SlottedABCMeta):
+        return source
+    target = _get_cached(source)
+    if target is not None:
+        return target
 
+    # Metaclass bases that are not ABCMeta-based are kept as they are.
     target_bases_list = []  # type: List[Union[SlottedABCMeta, Type[SlottedABCMeta]]]
     for source_base in source.__bases__:
-        target_bases_list.append(tippo.cast(SlottedABCMeta, convert_meta(source_base)))
+        if issubclass(source_base, abc.ABCMeta):
+            source_base = _convert_meta(source_base)
+        target_bases_list.append(tippo.cast(SlottedABCMeta, source_base))
 
     source_name = source.__name__
     target_name = "Slotted{}".format(source_name)
@@ -253,52 +277,57 @@ def convert_meta(source):
         )
     )
 
-    if hasattr(types, "new_class"):
-
-        def exec_body(ns):
-            # type: (Dict[str, Any]) -> Dict[str, Any]
-            for k, v in six.iteritems(target_dct):
-                ns[k] = v
-            return ns
-
-        target = tippo.cast(
-            "SlottedABCMeta",
-            types.new_class(  # noqa
-                target_name,
-                target_bases,
-                {"metaclass": SlottedABCMeta},
-                exec_body,
-            ),
-        )
-    else:
-        target = SlottedABCMeta(target_name, target_bases, target_dct)
+    def exec_body(ns):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        for k, v in six.iteritems(target_dct):
+            ns[k] = v
+        return ns
+
+    target = tippo.cast(
+        "SlottedABCMeta",
+        types.new_class(  # noqa
+            target_name,
+            target_bases,
+            {"metaclass": type(source)},
+            exec_body,
+        ),
+    )
 
     for name, value in six.iteritems(overrides):
         type.__setattr__(tippo.cast(type, target), name, value)
-    _CACHE[source] = target
+    _CACHE[source] = weakref.ref(target)
 
     return target
 
 
-def convert(source):
+def _convert(source):
     # type: (abc.ABCMeta) -> Union[SlottedABCMeta, Type[SlottedABCMeta]]
     """Convert an ABC-based class to an SlottedABC-based class."""
-    try:
-        return _CACHE[source]
-    except KeyError:
-        pass
+    if isinstance(source, SlottedABCMeta):
+        return source
+    target = _get_cached(source)
+    if target is not None:
+        return target
 
-    meta = convert_meta(type(source))
+    meta = _convert_meta(type(source))
 
+    # Bases that are not ABCs are kept as they are (they still have to be slotted).
     target_bases_list = []  # type: List[Union[SlottedABCMeta, Type[SlottedABCMeta]]]
     for source_base in source.__bases__:
-        target_bases_list.append(convert(tippo.cast(abc.ABCMeta, source_base)))
+        if source_base is object or isinstance(source_base, abc.ABCMeta):
+            source_base = _convert(tippo.cast(abc.ABCMeta, source_base))
+        target_bases_list.append(tippo.cast(SlottedABCMeta, source_base))
 
     source_name = source.__name__
     target_name = "Slotted{}".format(source_name)
     target_bases = tuple(target_bases_list)
     target_dct, overrides = extract_dict(source)
-    target_dct.pop("__dict__", None)
+    for name in ("__dict__", "__weakref__"):
+        target_dct.pop(name, None)
+        overrides.pop(name, None)
+
+    # Annotations are set after the class is created, so they don't become slots.
+    annotations = target_dct.pop("__annotations__", None)
     target_dct["__module__"] = __name__
     target_dct["__doc__"] = "".join(
         (
@@ -321,50 +350,83 @@ def convert(source):
         )
     )
 
-    if hasattr(types, "new_class"):
-
-        def exec_body(ns):
-            # type: (Dict[str, Any]) -> Dict[str, Any]
-            for k, v in six.iteritems(target_dct):
-                ns[k] = v
-            return ns
-
-        target = types.new_class(  # noqa
-            target_name,
-            target_bases,
-            {"metaclass": meta},
-            exec_body,
-        )
-    else:
-        target = meta(target_name, target_bases, target_dct)
+    def exec_body(ns):
+        # type: (Dict[str, Any]) -> Dict[str, Any]
+        for k, v in six.iteritems(target_dct):
+            ns[k] = v
+        return ns
+
+    target = types.new_class(  # noqa
+        target_name,
+        target_bases,
+        {"metaclass": meta},
+        exec_body,
+    )
 
     for name, value in six.iteritems(overrides):
         type.__setattr__(target, name, value)
-    _CACHE[source] = target
+    if annotations is not None:
+        type.__setattr__(target, "__annotations__", annotations)
 
     if target.__dict__.get("__dict__") is not None:
         error = "class {!r} has a '__dict__'".format(target_name)
         raise AssertionError(error)
 
     source.register(target)
+    _CACHE[source] = weakref.ref(target)
     return target
 
 
-# Convert all classes.
-for original in _CLASSES:
-    converted = convert(tippo.cast(abc.ABCMeta, original))
-    globals()[converted.__name__] = converted
-
-
-_CONVERTED_CLASSES = {
-    o: c for o, c in six.iteritems(_CACHE) if not issubclass(o, type)
-}  # type: Dict[Type[Any], Type[Any]]
-for original, converted in _CONVERTED_CLASSES.items():
+def convert(source):
+    # type: (Type[_T]) -> Type[_T]
+    """
+    Get a slotted version of an ABC (for example, from :mod:`numbers`), so it can be
+    subclassed without adding a `__dict__` to the instances.
+
+    The bases that are ABCs are converted as well, the converted class is registered as
+    a virtual subclass of the original, and conversions are cached (weakly) so
+    converting the same class returns the same result while it's alive.
+
+    :param source: Class with an :class:`abc.ABCMeta`-based metaclass.
+    :return: Slotted class with a :class:`slotted.SlottedABCMeta`-based metaclass.
+    :raises TypeError: Not an ABC, or has a base that is not slotted.
+    """
+    if not isinstance(source, abc.ABCMeta):
+        error = "{!r} is not an ABC".format(source)
+        raise TypeError(error)
+    for name, original in six.iteritems(_SOURCES):
+        if original is source:
+            return tippo.cast("Type[_T]", _load(name))
+    target = _get_cached(source)
+    if target is None:
+        with _LOCK:
+            target = _convert(source)
+    return tippo.cast("Type[_T]", target)
+
+
+def _load(name):
+    # type: (str) -> Type[Any]
+    """Convert and publish a public class on first access."""
+    loaded = globals().get(name)  # type: Optional[Type[Any]]
+    if loaded is not None:
+        return loaded
+    with _LOCK:
+        loaded = globals().get(name)
+        if loaded is None:
+            original = _SOURCES[name]
+            converted = _convert(tippo.cast(abc.ABCMeta, original))
+            loaded = _make_generic(original, converted)
+            globals()[name] = loaded
+        return loaded
+
+
+def _make_generic(original, converted):
+    # type: (Type[Any], Type[Any]) -> Type[Any]
     assert not issubclass(converted, type)
 
     # Skip unsupported for now.
     if original.__name__ not in _ABC_GENERIC:
-        continue
+        return converted
 
     # Skip if already generic.
     if (
@@ -373,7 +435,7 @@ for original, converted in _CONVERTED_CLASSES.items():
         or hasattr(converted, "__class_getitem__")
         or hasattr(type(converted), "__getitem__")
     ):
-        continue
+        return converted
 
     # Get generic original.
     try:
@@ -390,24 +452,25 @@ for original, converted in _CONVERTED_CLASSES.items():
         )
 
     # Convert to generic.
-    if hasattr(generic_original, "__parameters__"):
-        parameters = generic_original.__parameters__
-        new_class_args = (
-            converted.__name__,
-            (
-                six.with_metaclass(
-                    SlottedABCGenericMeta,
-                    converted,
-                    Generic[parameters],  # type: ignore
-                ),
+    if not hasattr(generic_original, "__parameters__"):
+        return converted
+    parameters = generic_original.__parameters__
+    new_class_args = (
+        converted.__name__,
+        (
+            six.with_metaclass(
+                SlottedABCGenericMeta,
+                converted,
+                Generic[parameters],  # type: ignore
             ),
-        )
+        ),
+    )
+    return types.new_class(*new_class_args)
 
-        if hasattr(types, "new_class"):
-            generic_converted = types.new_class(*new_class_args)
-        else:
-            new_class_args += ({},)  # type: ignore
-            generic_converted = type(*new_class_args)  # type: ignore
 
-        # Replace class.
-        globals()[converted.__name__] = generic_converted
+def __getattr__(name):
+    # type: (str) -> Any
+    if name in _SOURCES:
+        return _load(name)
+    error = "module {!r} has no attribute {!r}".format(__name__, name)
+    raise AttributeError(error)
@@ -0,0 +1,302 @@
+import array
+
+import six
+
+from ._census import allocator
+from ._generate import UNSET, is_special_slot, parameter_name, slot_annotation
+from ._slotted import Slotted, SlottedMeta, slot_layout
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+__all__ = ["SlottedArray", "make_view_class"]
+
+
+# Array type codes for primitive annotations.
+_TYPECODES = {
+    int: "q",
+    float: "d",
+    bool: "b",
+    "int": "q",
+    "float": "d",
+    "bool": "b",
+}  # type: Dict[Any, str]
+
+
+def typecode(annotation):
+    # type: (Any) -> Optional[str]
+    """Get the array type code for a primitive annotation (or None)."""
+    try:
+        return _TYPECODES.get(annotation)
+    except TypeError:  # unhashable annotation
+        return None
+
+
+def _column_getter(index, is_bool):
+    # type: (int, bool) -> Any
+    if is_bool:
+
+        def getter(self):
+            # type: (Any) -> Any
+            return bool(self.__slotted_columns__[index][self.__slotted_index__])
+
+    else:
+
+        def getter(self):
+            # type: (Any) -> Any
+            value = self.__slotted_columns__[index][self.__slotted_index__]
+            if value is UNSET:
+                raise AttributeError("slot value is not set")
+            return value
+
+    return getter
+
+
+def _column_setter(index):
+    # type: (int) -> Any
+    def setter(self, value):
+        # type: (Any, Any) -> None
+        self.__slotted_columns__[index][self.__slotted_index__] = value
+
+    return setter
+
+
+def _column_deleter(index, typed):
+    # type: (int, bool) -> Any
+    def deleter(self):
+        # type: (Any) -> None
+        if typed:
+            raise TypeError("can't delete a value from a typed column")
+        self.__slotted_columns__[index][self.__slotted_index__] = UNSET
+
+    return deleter
+
+
+class SlottedArray(Slotted):
+    """
+    Columnar (struct-of-arrays) storage for instances of a slotted class.
+
+    Slots annotated with `int`, `float` or `bool` are stored in :class:`array.array`
+    columns (unboxed, and exposed through the buffer protocol, so they can be wrapped
+    by `numpy` without copying), other slots are stored in lists.
+
+    Items are lightweight views: instances of a generated subclass of the element
+    class whose slot attributes read and write the columns directly.
+
+    :param cls: Element class.
+    :param capacity: Number of rows to preallocate.
+    """
+
+    __slots__ = (
+        "__cls",
+        "__infos",
+        "__names",
+        "__typecodes",
+        "__columns",
+        "__length",
+        "__view_cls",
+        "__new_view",
+        "__new_obj",
+        "__set_columns",
+        "__set_index",
+    )
+
+    def __init__(self, cls, capacity=0):
+        # type: (Type[Any], int) -> None
+        infos = [i for i in slot_layout(cls) if not is_special_slot(i.name)]
+        typecodes = [typecode(slot_annotation(i)) for i in infos]
+
+        self.__cls = cls
+        self.__infos = tuple(infos)
+        self.__names = dict((parameter_name(i), c) for c, i in enumerate(infos))
+        self.__typecodes = tuple(typecodes)
+        self.__columns = tuple(
+            _empty_column(t, capacity) for t in typecodes
+        )  # type: Tuple[Any, ...]
+        self.__length = 0
+        self.__view_cls = _view_class(cls, self.__infos, self.__typecodes)
+        self.__new_view = allocator(self.__view_cls)
+        self.__new_obj = allocator(cls)
+        self.__set_columns = self.__view_cls.__dict__["__slotted_columns__"].__set__
+        self.__set_index = self.__view_cls.__dict__["__slotted_index__"].__set__
+
+    def __len__(self):
+        # type: () -> int
+        return self.__length
+
+    def __getitem__(self, index):
+        # type: (int) -> Any
+        view = self.__new_view()
+        self.__set_columns(view, self.__columns)
+        self.__set_index(view, self.__index(index))
+        return view
+
+    def __iter__(self):
+        # type: () -> Iterator[Any]
+        for index in six.moves.range(self.__length):
+            yield self[index]
+
+    def __repr__(self):
+        # type: () -> str
+        return "<{} of {} {!r} rows>".format(
+            type(self).__name__, self.__length, self.__cls.__name__
+        )
+
+    def __index(self, index):
+        # type: (int) -> int
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError("index out of range")
+        return index
+
+    def __reserve(self, capacity):
+        # type: (int) -> None
+        # Growing a typed column fails while a view of it is exported, so the columns
+        # can be left with different sizes and are grown up to the same capacity.
+        current = min(len(c) for c in self.__columns) if self.__columns else capacity
+        if capacity <= current:
+            return
+        capacity = max(capacity, current * 2)
+        for column, typecode_ in zip(self.__columns, self.__typecodes):
+            if len(column) < capacity:
+                column.extend(_empty_column(typecode_, capacity - len(column)))
+
+    def append(self, obj):
+        # type: (Any) -> None
+        """
+        Append the slot values of an instance.
+
+        :param obj: Instance.
+        :raises TypeError: Instance has an unset slot that is stored in a typed column.
+        :raises BufferError: A view returned by :meth:`column` was not released.
+        """
+        values = []  # type: List[Any]
+        for info, typecode_ in zip(self.__infos, self.__typecodes):
+            try:
+                values.append(getattr(obj, info.mangled_name))
+            except AttributeError:
+                if typecode_ is not None:
+                    error = "slot {!r} is unset and has a typed column".format(
+                        info.name
+                    )
+                    raise TypeError(error)
+                values.append(UNSET)
+
+        self.__reserve(self.__length + 1)
+        for column, value in zip(self.__columns, values):
+            column[self.__length] = value
+        self.__length += 1
+
+    def extend(self, objs):
+        # type: (Iterable[Any]) -> None
+        """
+        Append the slot values of multiple instances.
+
+        :param objs: Instances.
+        """
+        for obj in objs:
+            self.append(obj)
+
+    def column(self, name):
+        # type: (str) -> Any
+        """
+        Get the values of a slot for all rows.
+
+        Typed columns are returned as a :class:`memoryview` over the column itself
+        (without copying it), which has to be released (for example, by using it as a
+        context manager) before appending rows.
+
+        :param name: Slot name (private slots without leading underscores).
+        :return: A :class:`memoryview` over typed columns, a list otherwise.
+        """
+        index = self.__names[name]
+        column = self.__columns[index]
+        if self.__typecodes[index] is None:
+            return column[: self.__length]
+        return memoryview(column)[: self.__length]
+
+    def materialize(self, index):
+        # type: (int) -> Any
+        """
+        Make an actual instance of the element class from a row.
+
+        :param index: Row index.
+        :return: Instance.
+        """
+        index = self.__index(index)
+        obj = self.__new_obj()
+        for info, column, typecode_ in zip(
+            self.__infos, self.__columns, self.__typecodes
+        ):
+            value = column[index]
+            if typecode_ == "b":
+                value = bool(value)
+            if value is not UNSET:
+                object.__setattr__(obj, info.mangled_name, value)
+        return obj
+
+    @property
+    def cls(self):
+        # type: () -> Type[Any]
+        """Element class."""
+        return self.__cls
+
+
+def _empty_column(typecode_, size):
+    # type: (Optional[str], int) -> Any
+    if typecode_ is None:
+        return [UNSET] * size
+    return array.array(typecode_, [0]) * size
+
+
+def make_view_class(cls, name, slots, properties):
+    # type: (Type[Any], str, Tuple[str, ...], Dict[str, property]) -> Type[Any]
+    """
+    Make a subclass of a class whose instances are views: their slot attributes are
+    properties that read the values from somewhere else (such as array columns).
+
+    The internal slots of the views are left out of the methods generated by
+    `SlottedMeta` (so views compare, hash and show their values like instances do),
+    and the subclass has no pool or census counters of its own (views of a tracked
+    class are counted as its instances). Views are allocated with
+    :func:`allocator`.
+
+    :param cls: Class.
+    :param name: Name of the subclass.
+    :param slots: Internal slots of the views.
+    :param properties: Properties, keyed by mangled slot name.
+    :return: Subclass.
+    """
+    dct = dict(properties)  # type: Dict[str, Any]
+    dct.update(
+        {
+            "__slots__": slots,
+            "__module__": cls.__module__,
+            "__doc__": "View of :class:`{}`.".format(cls.__name__),
+        }
+    )
+    metaclass = type(cls)  # type: Any
+    if not isinstance(cls, SlottedMeta):
+        return metaclass(name, (cls,), dct)  # type: ignore
+    return metaclass(  # type: ignore
+        name, (cls,), dct, pool=None, track_instances=False, exclude=slots
+    )
+
+
+def _view_class(cls, infos, typecodes):
+    # type: (Type[Any], Tuple[Any, ...], Tuple[Optional[str], ...]) -> Type[Any]
+    properties = {}  # type: Dict[str, property]
+    for index, (info, typecode_) in enumerate(zip(infos, typecodes)):
+        properties[info.mangled_name] = property(
+            _column_getter(index, typecode_ == "b"),
+            _column_setter(index),
+            _column_deleter(index, typecode_ is not None),
+        )
+    return make_view_class(
+        cls,
+        "{}View".format(cls.__name__),
+        ("__slotted_columns__", "__slotted_index__"),
+        properties,
+    )
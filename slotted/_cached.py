@@ -0,0 +1,31 @@
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Callable, Optional, Type
+
+__all__ = ["cached_slot_property"]
+
+
+class cached_slot_property(object):
+    """
+    Like :func:`functools.cached_property`, but stores the value in a hidden slot
+    instead of the instance `__dict__`, so it works with :class:`SlottedMeta`.
+
+    When the class is created, the hidden slot is added (see :func:`slots` with
+    `hidden=True`) and this decorator is replaced with a :class:`property` whose getter
+    returns the slot value, computing and storing it on first access. Deleting the
+    attribute clears the cached value, and assigning it replaces the cached value.
+
+    :param func: Function that computes the value.
+    """
+
+    def __init__(self, func):
+        # type: (Callable[[Any], Any]) -> None
+        self.func = func
+        self.__doc__ = getattr(func, "__doc__", None)
+
+    def __get__(self, obj, cls=None):
+        # type: (Any, Optional[Type[Any]]) -> Any
+        if obj is None:
+            return self
+        error = "cached_slot_property requires a class created by SlottedMeta"
+        raise TypeError(error)
@@ -0,0 +1,177 @@
+import collections
+import functools
+import threading
+import weakref
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Callable, List, MutableMapping, Optional, Type
+
+__all__ = ["CensusEntry", "census", "track_instances", "allocator"]
+
+
+class CensusEntry(
+    collections.namedtuple("CensusEntry", ("cls", "live", "peak", "created"))
+):
+    """
+    Instance counters of a class created with `SlottedMeta(track_instances=True)`.
+
+    :param cls: Class.
+    :param live: Number of instances currently alive.
+    :param peak: Maximum number of instances alive at the same time.
+    :param created: Total number of instances created.
+    """
+
+    __slots__ = ()
+
+
+class _Counters(object):
+    """
+    Instance counters of a class.
+
+    The counters are plain integers guarded by a lock, so they stay exact when
+    instances are created and deleted from several threads (including builds without
+    the GIL). The lock is reentrant since `__del__` can run from the garbage collector
+    while the same thread is updating the counters.
+    """
+
+    __slots__ = ("created", "deleted", "peak", "lock")
+
+    def __init__(self):
+        # type: () -> None
+        self.created = 0
+        self.deleted = 0
+        self.peak = 0
+        self.lock = threading.RLock()
+
+
+# Tracked classes and their counters.
+_COUNTERS = weakref.WeakKeyDictionary()  # type: MutableMapping[type, _Counters]
+_COUNTERS_LOCK = threading.Lock()
+
+
+def _unwrap(method):
+    # type: (Any) -> Any
+    while hasattr(method, "__slotted_original__"):
+        method = getattr(method, "__slotted_original__")
+    return method
+
+
+def _make_new(cls, counters, original):
+    # type: (Type[Any], _Counters, Callable[..., Any]) -> Callable[..., Any]
+    lock = counters.lock
+
+    if original is object.__new__:
+
+        def __new__(cls, *args, **kwargs):
+            # type: (Type[Any], *Any, **Any) -> Any
+            obj = original(cls)
+            with lock:
+                counters.created += 1
+                live = counters.created - counters.deleted
+                if live > counters.peak:
+                    counters.peak = live
+            return obj
+
+    else:
+
+        def __new__(cls, *args, **kwargs):
+            # type: (Type[Any], *Any, **Any) -> Any
+            obj = original(cls, *args, **kwargs)
+            with lock:
+                counters.created += 1
+                live = counters.created - counters.deleted
+                if live > counters.peak:
+                    counters.peak = live
+            return obj
+
+    __new__.__module__ = cls.__module__
+    __new__.__qualname__ = "{}.__new__".format(
+        getattr(cls, "__qualname__", cls.__name__)
+    )
+    setattr(__new__, "__slotted_original__", original)
+    setattr(__new__, "__slotted_counters__", counters)
+    return __new__
+
+
+def _make_del(cls, counters, original):
+    # type: (Type[Any], _Counters, Optional[Callable[[Any], None]]) -> Any
+    lock = counters.lock
+
+    if original is None:
+
+        def __del__(self):
+            # type: (Any) -> None
+            with lock:
+                counters.deleted += 1
+
+    else:
+
+        def __del__(self):
+            # type: (Any) -> None
+            with lock:
+                counters.deleted += 1
+            original(self)
+
+    __del__.__module__ = cls.__module__
+    __del__.__qualname__ = "{}.__del__".format(
+        getattr(cls, "__qualname__", cls.__name__)
+    )
+    setattr(__del__, "__slotted_original__", original)
+    return __del__
+
+
+def track_instances(cls):
+    # type: (Type[Any]) -> None
+    """
+    Wrap the `__new__` and `__del__` methods of a class (defined or inherited) so they
+    update its instance counters. Methods generated for the bases are skipped.
+
+    :param cls: Class.
+    """
+    counters = _Counters()
+    with _COUNTERS_LOCK:
+        _COUNTERS[cls] = counters
+    new = _unwrap(getattr(cls, "__new__"))
+    delete = _unwrap(getattr(cls, "__del__", None))
+    type.__setattr__(cls, "__new__", staticmethod(_make_new(cls, counters, new)))
+    type.__setattr__(cls, "__del__", _make_del(cls, counters, delete))
+
+
+def allocator(cls):
+    # type: (Type[Any]) -> Callable[[], Any]
+    """
+    Get a function that allocates instances of a class without calling `__init__`,
+    skipping the `__new__` methods made by `SlottedMeta` except for the one that
+    counts instances (so the census stays balanced when they are deleted).
+
+    :param cls: Class.
+    :return: Function that takes no arguments and returns a new instance.
+    """
+    new = getattr(cls, "__new__")
+    while hasattr(new, "__slotted_original__") and not hasattr(
+        new, "__slotted_counters__"
+    ):
+        new = getattr(new, "__slotted_original__")
+    return functools.partial(new, cls)
+
+
+def census():
+    # type: () -> List[CensusEntry]
+    """
+    Get a snapshot of the instance counters of the classes created with
+    `SlottedMeta(track_instances=True)`.
+
+    :return: Census entries, sorted by number of live instances (descending).
+    """
+    entries = []  # type: List[CensusEntry]
+    with _COUNTERS_LOCK:
+        items = list(_COUNTERS.items())
+    for cls, counters in items:
+        with counters.lock:
+            created = counters.created
+            live = created - counters.deleted
+            peak = counters.peak
+        entries.append(CensusEntry(cls=cls, live=live, peak=peak, created=created))
+    entries.sort(key=lambda e: -e.live)
+    return entries
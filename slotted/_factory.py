@@ -0,0 +1,111 @@
+import collections
+import sys
+import threading
+import types
+import weakref
+
+import six
+
+from ._slotted import Slotted, SlottedMeta
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Hashable, Iterable, MutableMapping, Optional, Tuple, Type
+
+__all__ = ["make_class"]
+
+
+# Maximum number of classes kept alive by the cache.
+_CLASS_CACHE_SIZE = 256
+
+# Most recently used classes (strong) and all live ones (weak).
+_CLASS_LRU = collections.OrderedDict()  # type: collections.OrderedDict[Any, Any]
+_CLASS_WEAK = weakref.WeakValueDictionary()  # type: MutableMapping[Any, Any]
+_CLASS_LOCK = threading.Lock()
+
+
+def _freeze(value):
+    # type: (Any) -> Hashable
+    """Get a hashable version of a class keyword argument."""
+    if isinstance(value, dict):
+        return dict, tuple(sorted((k, _freeze(v)) for k, v in six.iteritems(value)))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value), tuple(_freeze(v) for v in value)
+
+    # Values that compare equal can have different types (for example, 0 and False).
+    hash(value)
+    return type(value), value
+
+
+def _remember(key, cls):
+    # type: (Any, Type[Any]) -> None
+    _CLASS_LRU.pop(key, None)
+    _CLASS_LRU[key] = cls
+    while len(_CLASS_LRU) > _CLASS_CACHE_SIZE:
+        _CLASS_LRU.popitem(last=False)
+
+
+def _create(name, slots, bases, module, kwargs):
+    # type: (str, Tuple[str, ...], Tuple[Type[Any], ...], str, Any) -> Type[Any]
+    dct = {"__slots__": slots, "__module__": module}
+
+    def exec_body(ns):
+        # type: (MutableMapping[str, Any]) -> None
+        ns.update(dct)
+
+    return types.new_class(name, bases, kwargs, exec_body)
+
+
+def make_class(
+    name,  # type: str
+    slots,  # type: Iterable[str]
+    bases=(),  # type: Tuple[Type[Any], ...]
+    module=None,  # type: Optional[str]
+    **kwargs  # type: Any
+):
+    # type: (...) -> Type[Any]
+    """
+    Make a slotted class at runtime.
+
+    Classes are cached by name, slots, bases, module and keyword arguments, so making
+    the same class again returns the same object. The most recently used classes are
+    kept alive, the others are only cached while they are alive.
+
+    :param name: Class name.
+    :param slots: Slot names.
+    :param bases: Base classes (:class:`slotted.Slotted` is added if needed).
+    :param module: Module name (defaults to the caller's module).
+    :param kwargs: Class keyword arguments (for example, `init=True`).
+    :return: Slotted class.
+    """
+    if isinstance(slots, six.string_types):
+        slots = (slots,)
+    slots = tuple(slots)
+    bases = tuple(bases)
+    if not any(isinstance(b, SlottedMeta) for b in bases):
+        bases += (Slotted,)
+    if module is None:
+        try:
+            module = sys._getframe(1).f_globals.get("__name__", "__main__")
+        except (AttributeError, ValueError):
+            module = __name__
+
+    try:
+        key = (name, slots, bases, module, _freeze(kwargs))
+        with _CLASS_LOCK:
+            try:
+                cls = _CLASS_LRU[key]
+            except KeyError:
+                cls = _CLASS_WEAK[key]
+            _remember(key, cls)
+            return cls  # type: ignore
+    except KeyError:
+        pass
+    except TypeError:  # unhashable keyword arguments
+        return _create(name, slots, bases, module, kwargs)
+
+    cls = _create(name, slots, bases, module, kwargs)
+    with _CLASS_LOCK:
+        cls = _CLASS_WEAK.setdefault(key, cls)
+        _remember(key, cls)
+    return cls  # type: ignore
@@ -0,0 +1,967 @@
+import copy
+import threading
+import types
+
+import six
+from six.moves import copyreg, reprlib
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import (
+        Any,
+        Callable,
+        Dict,
+        Iterable,
+        List,
+        Mapping,
+        Optional,
+        Sequence,
+        Tuple,
+        Type,
+    )
+
+    from ._slotted import SlotInfo
+
+__all__ = [
+    "HASH_SLOT",
+    "HIDDEN_SLOTS",
+    "SPECIAL_SLOTS",
+    "UNSET",
+    "cached_slot_name",
+    "is_cached_slot",
+    "is_hidden_slot",
+    "is_special_slot",
+    "compile_code",
+    "compile_function",
+    "parameter_name",
+    "slot_annotation",
+    "make_init",
+    "make_defaults_new",
+    "make_cached_property",
+    "make_reduce",
+    "make_copy",
+    "make_clear",
+    "make_from_rows",
+    "make_as_tuple",
+    "make_as_dict",
+    "make_from_dict",
+    "make_frozen",
+    "make_eq",
+    "make_order",
+    "make_repr",
+    "make_hash",
+]
+
+
+# Slot that caches the hash of frozen instances.
+HASH_SLOT = "__slotted_hash__"
+
+# Slots added internally, hidden from `slots()` unless asked.
+HIDDEN_SLOTS = frozenset((HASH_SLOT,))
+
+# Slots that do not hold attribute values.
+SPECIAL_SLOTS = frozenset(("__dict__", "__weakref__")).union(HIDDEN_SLOTS)
+
+# Name format of the hidden slots that back cached slot properties.
+_CACHED_SLOT_FORMAT = "__slotted_cached_{}__"
+
+
+def cached_slot_name(name):
+    # type: (str) -> str
+    """Get the name of the hidden slot that backs a cached slot property."""
+    return _CACHED_SLOT_FORMAT.format(name)
+
+
+def is_cached_slot(name):
+    # type: (str) -> bool
+    """Whether a slot backs a cached slot property."""
+    return name.startswith("__slotted_cached_") and name.endswith("__")
+
+
+def is_hidden_slot(name):
+    # type: (str) -> bool
+    """Whether a slot was added internally (see :data:`HIDDEN_SLOTS`)."""
+    return name in HIDDEN_SLOTS or is_cached_slot(name)
+
+
+def is_special_slot(name):
+    # type: (str) -> bool
+    """Whether a slot does not hold an attribute value (see :data:`SPECIAL_SLOTS`)."""
+    return name in SPECIAL_SLOTS or is_hidden_slot(name)
+
+
+# Types that are not copied by `copy.deepcopy`.
+_ATOMIC_TYPES = frozenset(
+    (type(None), bool, int, float, complex, str, bytes, type)
+    + six.integer_types
+    + six.string_types
+)
+
+# Types that are pickled as out-of-band buffers (protocol 5).
+_BUFFER_TYPES = frozenset((bytes, bytearray))
+
+
+def _unbuffer(value):
+    # type: (Any) -> Any
+    """Convert a buffer loaded out-of-band back to `bytes` or `bytearray`."""
+    with memoryview(value) as view:
+        if view.readonly:
+            return view.tobytes()
+        return bytearray(view)
+
+
+class _Unset(object):
+    """Sentinel for slots that have no value."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        # type: () -> str
+        return "UNSET"
+
+    def __reduce__(self):
+        # type: () -> str
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+# Compiled code objects, keyed by source (same shapes share the same code).
+_CODE_CACHE = {}  # type: Dict[str, Any]
+_CODE_CACHE_LOCK = threading.Lock()
+
+
+def compile_code(source, name):
+    # type: (str, str) -> Any
+    """
+    Compile source code, reusing the code object compiled for the same source.
+
+    :param source: Source code.
+    :param name: Name used in the file name of the code object.
+    :return: Code object.
+    """
+    try:
+        return _CODE_CACHE[source]
+    except KeyError:
+        code = compile(source, "<slotted {}>".format(name), "exec")
+        with _CODE_CACHE_LOCK:
+            return _CODE_CACHE.setdefault(source, code)
+
+
+def compile_function(source, name, namespace):
+    # type: (str, str, Dict[str, Any]) -> Callable[..., Any]
+    """
+    Compile the source code of a single function.
+
+    :param source: Function source code.
+    :param name: Function name.
+    :param namespace: Globals available to the function.
+    :return: Function.
+    """
+    code = compile_code(source, name)
+    scope = {}  # type: Dict[str, Any]
+    exec(code, namespace, scope)
+    return scope[name]  # type: ignore
+
+
+def _finalize(func, cls, name):
+    # type: (Callable[..., Any], Type[Any], str) -> Callable[..., Any]
+    func.__name__ = name
+    func.__module__ = cls.__module__
+    func.__qualname__ = "{}.{}".format(getattr(cls, "__qualname__", cls.__name__), name)
+    return func
+
+
+def parameter_name(info):
+    # type: (SlotInfo) -> str
+    """Get the parameter name for a slot (private slots drop their underscores)."""
+    name = info.name  # type: str
+    if info.mangled_name != name:
+        return name.lstrip("_")
+    return name
+
+
+def slot_annotation(info):
+    # type: (SlotInfo) -> Any
+    """Get the annotation declared for a slot by its owner (or None)."""
+    annotations = info.owner.__dict__.get("__annotations__", {})
+    # Annotations of private names are mangled in class bodies.
+    return annotations.get(info.mangled_name, annotations.get(info.name))
+
+
+def make_init(cls, infos, defaults):
+    # type: (Type[Any], Sequence[SlotInfo], Mapping[str, Any]) -> Callable[..., None]
+    """
+    Make an `__init__` method that sets slots from its arguments.
+
+    :param cls: Class.
+    :param infos: Slot infos, in parameter order.
+    :param defaults: Default values, keyed by mangled slot name.
+    :return: Method.
+    :raises TypeError: Invalid parameters.
+    """
+    namespace = {}  # type: Dict[str, Any]
+    bypass = _bypass(cls)
+    has_defaults = False
+    parameters = []  # type: List[str]
+    lines = []  # type: List[str]
+    seen = {}  # type: Dict[str, str]
+    for info in infos:
+        name = parameter_name(info)
+        if name in seen or name == "self":
+            error = "parameter name {!r} for slot {!r} is already in use".format(
+                name, info.mangled_name
+            )
+            raise TypeError(error)
+        seen[name] = info.mangled_name
+
+        if info.mangled_name in defaults:
+            default_name = "_default_{}".format(len(parameters))
+            namespace[default_name] = defaults[info.mangled_name]
+            parameters.append("{}={}".format(name, default_name))
+            has_defaults = True
+        elif has_defaults:
+            error = "non-default argument {!r} follows default argument".format(name)
+            raise TypeError(error)
+        else:
+            parameters.append(name)
+        lines.append("    " + assign(info, name, namespace, bypass))
+
+    source = "def __init__({}):\n{}\n".format(
+        ", ".join(["self"] + parameters), "\n".join(lines or ["    pass"])
+    )
+    return _finalize(compile_function(source, "__init__", namespace), cls, "__init__")
+
+
+def make_defaults_new(
+    cls,  # type: Type[Any]
+    infos,  # type: Sequence[SlotInfo]
+    defaults,  # type: Mapping[str, Any]
+    original,  # type: Callable[..., Any]
+):
+    # type: (...) -> Callable[..., Any]
+    """
+    Make a `__new__` method that sets default values through the slot descriptors.
+
+    :param cls: Class.
+    :param infos: Slot infos of the slots with default values.
+    :param defaults: Default values, keyed by mangled slot name.
+    :param original: Original `__new__` (defined or inherited).
+    :return: Method.
+    """
+    namespace = {"_original": original}  # type: Dict[str, Any]
+    if original is object.__new__:
+        lines = ["    self = _original(cls)"]
+    else:
+        lines = ["    self = _original(cls, *args, **kwargs)"]
+    for i, info in enumerate(infos):
+        default_name = "_default_{}".format(i)
+        namespace[default_name] = defaults[info.mangled_name]
+        lines.append("    " + assign(info, default_name, namespace, True))
+    lines.append("    return self")
+    source = "def __new__(cls, *args, **kwargs):\n{}\n".format("\n".join(lines))
+    return _finalize(compile_function(source, "__new__", namespace), cls, "__new__")
+
+
+def make_set_defaults(cls, infos, defaults):
+    # type: (Type[Any], Sequence[SlotInfo], Mapping[str, Any]) -> Callable[[Any], None]
+    """
+    Make a function that sets default values through the slot descriptors (for
+    instances reused by a pool, which don't go through `__new__` again).
+
+    :param cls: Class.
+    :param infos: Slot infos of the slots with default values.
+    :param defaults: Default values, keyed by mangled slot name.
+    :return: Function.
+    """
+    namespace = {}  # type: Dict[str, Any]
+    lines = []  # type: List[str]
+    for i, info in enumerate(infos):
+        default_name = "_default_{}".format(i)
+        namespace[default_name] = defaults[info.mangled_name]
+        lines.append("    " + assign(info, default_name, namespace, True))
+    lines.append("    return None")
+    source = "def set_defaults(self):\n{}\n".format("\n".join(lines))
+    return _finalize(
+        compile_function(source, "set_defaults", namespace), cls, "set_defaults"
+    )
+
+
+def make_cached_property(cls, name, func, info):
+    # type: (Type[Any], str, Callable[[Any], Any], SlotInfo) -> property
+    """
+    Make a property that caches the value computed by a function in a hidden slot.
+
+    Values are stored and deleted through the slot descriptor directly, so frozen
+    instances can cache them too.
+
+    :param cls: Class.
+    :param name: Property name.
+    :param func: Function that computes the value.
+    :param info: Info of the hidden slot.
+    :return: Property.
+    """
+    namespace = {"_func": func}  # type: Dict[str, Any]
+    source = "\n".join(
+        (
+            "def getter(self):",
+            "    try:",
+            "        return self.{}".format(info.mangled_name),
+            "    except AttributeError:",
+            "        pass",
+            "    value = _func(self)",
+            "    {}".format(assign(info, "value", namespace, True)),
+            "    return value",
+            "",
+        )
+    )
+    getter = _finalize(compile_function(source, "getter", namespace), cls, name)
+    descriptor = info.descriptor
+    return property(
+        getter, descriptor.__set__, descriptor.__delete__, getattr(func, "__doc__")
+    )
+
+
+def _setter(info, namespace):
+    # type: (SlotInfo, Dict[str, Any]) -> str
+    setter_name = "_set_{}".format(info.mangled_name)
+    if isinstance(info.descriptor, types.MemberDescriptorType):
+        namespace[setter_name] = info.descriptor.__set__
+    else:
+        namespace[setter_name] = lambda obj, value, _name=info.mangled_name: (
+            object.__setattr__(obj, _name, value)
+        )
+    return setter_name
+
+
+def assign(info, value, namespace, bypass=False, target="self"):
+    # type: (SlotInfo, str, Dict[str, Any], bool, str) -> str
+    """
+    Get the statement that assigns a value to a slot.
+
+    :param info: Slot info.
+    :param value: Value expression.
+    :param namespace: Globals available to the function (setters are added to it).
+    :param bypass: Whether to bypass `__setattr__` by using the slot descriptor.
+    :param target: Name of the object to assign to.
+    :return: Statement.
+    """
+    if bypass:
+        return "{}({}, {})".format(_setter(info, namespace), target, value)
+    return "{}.{} = {}".format(target, info.mangled_name, value)
+
+
+def _bypass(cls):
+    # type: (Type[Any]) -> bool
+    return getattr(cls, "__setattr__") is not object.__setattr__
+
+
+def _new(cls, namespace):
+    # type: (Type[Any], Dict[str, Any]) -> str
+    if getattr(cls, "__new__") is object.__new__:
+        namespace["_object_new"] = object.__new__
+        return "_object_new(cls)"
+    return "cls.__new__(cls)"
+
+
+def make_reduce(cls, infos):
+    # type: (Type[Any], Sequence[SlotInfo]) -> Tuple[Callable[..., Any], ...]
+    """
+    Make `__reduce_ex__` and `__setstate__` methods that pickle the slots as a tuple.
+
+    Unset slots are stored as :data:`UNSET`. Bytes-like values are stored as
+    :class:`pickle.PickleBuffer` for protocol 5 and above, so they can be pickled
+    out-of-band. Buffers loaded out-of-band are converted back to `bytes` (when
+    read-only) or `bytearray`.
+
+    :param cls: Class.
+    :param infos: Slot infos, in state order.
+    :return: `__reduce_ex__` and `__setstate__` methods.
+    """
+    try:
+        from pickle import PickleBuffer
+    except ImportError:  # pragma: no cover
+        PickleBuffer = None  # type: ignore
+
+    namespace = {
+        "UNSET": UNSET,
+        "_newobj": copyreg.__newobj__,  # type: ignore
+        "_PickleBuffer": PickleBuffer,
+        "_BUFFER_TYPES": _BUFFER_TYPES,
+        "_LOADED_BUFFER_TYPES": (PickleBuffer, memoryview),
+        "_unbuffer": _unbuffer,
+    }  # type: Dict[str, Any]
+    bypass = _bypass(cls)
+
+    reduce_lines = []  # type: List[str]
+    setstate_lines = []  # type: List[str]
+    values = []  # type: List[str]
+    for i, info in enumerate(infos):
+        value = "v{}".format(i)
+        values.append(value)
+        reduce_lines.extend(
+            (
+                "    try:",
+                "        {} = self.{}".format(value, info.mangled_name),
+                "    except AttributeError:",
+                "        {} = UNSET".format(value),
+            )
+        )
+        if PickleBuffer is not None:
+            setstate_lines.extend(
+                (
+                    "    if {}.__class__ in _LOADED_BUFFER_TYPES:".format(value),
+                    "        {0} = _unbuffer({0})".format(value),
+                )
+            )
+        setstate_lines.extend(
+            (
+                "    if {} is not UNSET:".format(value),
+                "        {}".format(assign(info, value, namespace, bypass)),
+            )
+        )
+
+    if values and PickleBuffer is not None:
+        reduce_lines.append("    if protocol >= 5:")
+        for value in values:
+            reduce_lines.extend(
+                (
+                    "        if {}.__class__ in _BUFFER_TYPES:".format(value),
+                    "            {0} = _PickleBuffer({0})".format(value),
+                )
+            )
+    state = "({},)".format(", ".join(values)) if values else "()"
+    reduce_lines.append("    state = {}".format(state))
+    reduce_lines.append("    return _newobj, (self.__class__,), state")
+    reduce_source = "def __reduce_ex__(self, protocol):\n{}\n".format(
+        "\n".join(reduce_lines)
+    )
+
+    if values:
+        setstate_lines.insert(0, "    {}, = state".format(", ".join(values)))
+    else:
+        setstate_lines.append("    pass")
+    setstate_source = "def __setstate__(self, state):\n{}\n".format(
+        "\n".join(setstate_lines)
+    )
+
+    return (
+        _finalize(
+            compile_function(reduce_source, "__reduce_ex__", namespace),
+            cls,
+            "__reduce_ex__",
+        ),
+        _finalize(
+            compile_function(setstate_source, "__setstate__", namespace),
+            cls,
+            "__setstate__",
+        ),
+    )
+
+
+def make_copy(
+    cls,  # type: Type[Any]
+    infos,  # type: Sequence[SlotInfo]
+    cached_infos=(),  # type: Sequence[SlotInfo]
+):
+    # type: (...) -> Tuple[Callable[..., Any], ...]
+    """
+    Make `__copy__`, `__deepcopy__` and `replace` methods that copy slot by slot.
+
+    Unset slots are left unset in the copies. Cached values are copied too, except by
+    `replace`, whose copies are computed from different values.
+
+    :param cls: Class.
+    :param infos: Slot infos.
+    :param cached_infos: Infos of the slots that back cached slot properties.
+    :return: `__copy__`, `__deepcopy__` and `replace` methods.
+    """
+    namespace = {
+        "UNSET": UNSET,
+        "_deepcopy": copy.deepcopy,
+        "_ATOMIC_TYPES": _ATOMIC_TYPES,
+    }  # type: Dict[str, Any]
+    bypass = _bypass(cls)
+    new = _new(cls, namespace)
+
+    copy_lines = ["    cls = self.__class__", "    new = {}".format(new)]
+    deepcopy_lines = copy_lines + ["    memo[id(self)] = new"]
+    replace_lines = list(copy_lines)
+    for info in tuple(infos) + tuple(cached_infos):
+        get_lines = [
+            "    try:",
+            "        value = self.{}".format(info.mangled_name),
+            "    except AttributeError:",
+            "        pass",
+            "    else:",
+        ]
+        copy_lines.extend(get_lines)
+        copy_lines.append("        " + assign(info, "value", namespace, bypass, "new"))
+        deepcopy_lines.extend(get_lines)
+        deepcopy_lines.extend(
+            (
+                "        if value.__class__ not in _ATOMIC_TYPES:",
+                "            value = _deepcopy(value, memo)",
+                "        " + assign(info, "value", namespace, bypass, "new"),
+            )
+        )
+        if info in cached_infos:
+            continue
+        replace_lines.extend(
+            (
+                "    value = changes.pop({!r}, UNSET)".format(parameter_name(info)),
+                "    if value is UNSET:",
+                "        try:",
+                "            value = self.{}".format(info.mangled_name),
+                "        except AttributeError:",
+                "            pass",
+                "    if value is not UNSET:",
+                "        " + assign(info, "value", namespace, bypass, "new"),
+            )
+        )
+    replace_lines.extend(
+        (
+            "    if changes:",
+            "        error = 'invalid field name(s) {}'.format(', '.join(changes))",
+            "        raise TypeError(error)",
+        )
+    )
+    for lines in (copy_lines, deepcopy_lines, replace_lines):
+        lines.append("    return new")
+
+    methods = []  # type: List[Callable[..., Any]]
+    for name, signature, lines in (
+        ("__copy__", "self", copy_lines),
+        ("__deepcopy__", "self, memo", deepcopy_lines),
+        ("replace", "self, **changes", replace_lines),
+    ):
+        source = "def {}({}):\n{}\n".format(name, signature, "\n".join(lines))
+        methods.append(_finalize(compile_function(source, name, namespace), cls, name))
+    return tuple(methods)
+
+
+def make_clear(cls, infos):
+    # type: (Type[Any], Sequence[SlotInfo]) -> Callable[[Any], None]
+    """
+    Make a function that deletes the values of all slots of an instance.
+
+    Each slot is set to `None` before being deleted, so unset slots don't raise (and
+    catching the errors would cost more than the assignments). Slot descriptors are
+    used directly if the class overrides `__setattr__` or `__delattr__`.
+
+    :param cls: Class.
+    :param infos: Slot infos.
+    :return: Function.
+    """
+    namespace = {}  # type: Dict[str, Any]
+    bypass = (
+        getattr(cls, "__setattr__") is not object.__setattr__
+        or getattr(cls, "__delattr__") is not object.__delattr__
+    )
+    lines = []  # type: List[str]
+    for info in infos:
+        if not bypass:
+            lines.append("    self.{0} = None; del self.{0}".format(info.mangled_name))
+            continue
+        setter_name = "_set_{}".format(info.mangled_name)
+        deleter_name = "_del_{}".format(info.mangled_name)
+        if isinstance(info.descriptor, types.MemberDescriptorType):
+            namespace[setter_name] = info.descriptor.__set__
+            namespace[deleter_name] = info.descriptor.__delete__
+        else:
+            namespace[setter_name] = lambda obj, value, _name=info.mangled_name: (
+                object.__setattr__(obj, _name, value)
+            )
+            namespace[deleter_name] = lambda obj, _name=info.mangled_name: (
+                object.__delattr__(obj, _name)
+            )
+        lines.append("    {}(self, None); {}(self)".format(setter_name, deleter_name))
+    source = "def clear(self):\n{}\n".format("\n".join(lines or ["    pass"]))
+    return _finalize(compile_function(source, "clear", namespace), cls, "clear")
+
+
+def make_from_rows(cls, infos):
+    # type: (Type[Any], Sequence[SlotInfo]) -> Callable[[Iterable[Any]], List[Any]]
+    """
+    Make a function that creates instances from rows of slot values, without calling
+    `__init__` (slot descriptors are used directly if the class overrides
+    `__setattr__`).
+
+    :param cls: Class.
+    :param infos: Slot infos, in row order.
+    :return: Function that takes an iterable of rows and returns a list of instances.
+    """
+    namespace = {"cls": cls}  # type: Dict[str, Any]
+    bypass = _bypass(cls)
+    new = _new(cls, namespace)
+    values = ["v{}".format(i) for i in six.moves.range(len(infos))]
+    lines = [
+        "    result = []",
+        "    append = result.append",
+        "    for {} in rows:".format("".join(v + ", " for v in values) or "_"),
+        "        obj = {}".format(new),
+    ]
+    for info, value in zip(infos, values):
+        lines.append("        " + assign(info, value, namespace, bypass, "obj"))
+    lines.extend(("        append(obj)", "    return result"))
+    source = "def from_rows(rows):\n{}\n".format("\n".join(lines))
+    return _finalize(compile_function(source, "from_rows", namespace), cls, "from_rows")
+
+
+def make_as_tuple(
+    cls,  # type: Type[Any]
+    infos,  # type: Sequence[SlotInfo]
+    convert=None,  # type: Optional[Callable[[Any], Any]]
+    fallback=None,  # type: Optional[Callable[[Any], Any]]
+):
+    # type: (...) -> Tuple[Callable[..., Any], ...]
+    """
+    Make functions that get the slot values of instances as tuples.
+
+    :param cls: Class.
+    :param infos: Slot infos, in tuple order.
+    :param convert: Function that converts each value (or None).
+    :param fallback: Function used by the bulk version for instances of other classes.
+    :return: Function that takes an instance, and its bulk version that takes an
+        iterable of instances and returns a list.
+    """
+    namespace = {"cls": cls, "_convert": convert, "_fallback": fallback}
+    template = "_convert(obj.{})" if convert is not None else "obj.{}"
+    values = "({})".format(
+        "".join(template.format(i.mangled_name) + ", " for i in infos)
+    )
+    lines = ["def as_tuple(obj):", "    return {}".format(values)]
+    lines.extend(_bulk_lines("as_tuples", "obj", values))
+    return _compile_pair(cls, lines, ("as_tuple", "as_tuples"), namespace)
+
+
+def make_as_dict(
+    cls,  # type: Type[Any]
+    infos,  # type: Sequence[SlotInfo]
+    convert=None,  # type: Optional[Callable[[Any], Any]]
+    fallback=None,  # type: Optional[Callable[[Any], Any]]
+    omit_unset=False,  # type: bool
+):
+    # type: (...) -> Tuple[Callable[..., Any], ...]
+    """
+    Make functions that get the slot values of instances as dictionaries, keyed by
+    parameter name.
+
+    :param cls: Class.
+    :param infos: Slot infos, in key order.
+    :param convert: Function that converts each value (or None).
+    :param fallback: Function used by the bulk version for instances of other classes.
+    :param omit_unset: Whether to leave unset slots out (instead of raising).
+    :return: Function that takes an instance, and its bulk version that takes an
+        iterable of instances and returns a list.
+    """
+    namespace = {"cls": cls, "_convert": convert, "_fallback": fallback}
+    if omit_unset:
+        lines = ["def as_dict(obj):", "    result = {}"]
+        for info in infos:
+            value = "_convert(value)" if convert is not None else "value"
+            lines.extend(
+                (
+                    "    try:",
+                    "        value = obj.{}".format(info.mangled_name),
+                    "    except AttributeError:",
+                    "        pass",
+                    "    else:",
+                    "        result[{!r}] = {}".format(parameter_name(info), value),
+                )
+            )
+        lines.append("    return result")
+        values = "as_dict(obj)"
+    else:
+        template = "{!r}: _convert(obj.{})" if convert is not None else "{!r}: obj.{}"
+        values = "{{{}}}".format(
+            ", ".join(template.format(parameter_name(i), i.mangled_name) for i in infos)
+        )
+        lines = ["def as_dict(obj):", "    return {}".format(values)]
+    lines.extend(_bulk_lines("as_dicts", "obj", values))
+    return _compile_pair(cls, lines, ("as_dict", "as_dicts"), namespace)
+
+
+def make_from_dict(cls, infos):
+    # type: (Type[Any], Sequence[SlotInfo]) -> Tuple[Callable[..., Any], ...]
+    """
+    Make functions that create instances from dictionaries keyed by parameter name,
+    without calling `__init__`. Missing keys leave their slots unset.
+
+    :param cls: Class.
+    :param infos: Slot infos.
+    :return: Function that takes a dictionary, and its bulk version that takes an
+        iterable of dictionaries and returns a list. Both raise :class:`TypeError` for
+        keys that are not parameter names.
+    """
+    namespace = {"cls": cls}  # type: Dict[str, Any]
+    bypass = _bypass(cls)
+    new = _new(cls, namespace)
+    namespace["_names"] = frozenset(parameter_name(i) for i in infos)
+    lines = ["def from_dict(dct):", "    obj = {}".format(new), "    found = 0"]
+    for info in infos:
+        lines.extend(
+            (
+                "    try:",
+                "        value = dct[{!r}]".format(parameter_name(info)),
+                "    except KeyError:",
+                "        pass",
+                "    else:",
+                "        " + assign(info, "value", namespace, bypass, "obj"),
+                "        found += 1",
+            )
+        )
+    lines.extend(
+        (
+            "    if found != len(dct):",
+            "        invalid = sorted(repr(k) for k in dct if k not in _names)",
+            "        error = 'invalid field name(s) {} for {!r}'.format(",
+            "            ', '.join(invalid), cls.__name__",
+            "        )",
+            "        raise TypeError(error)",
+            "    return obj",
+            "def from_dicts(dcts):",
+            "    return [from_dict(dct) for dct in dcts]",
+        )
+    )
+    return _compile_pair(cls, lines, ("from_dict", "from_dicts"), namespace)
+
+
+def _bulk_lines(name, target, expression):
+    # type: (str, str, str) -> Tuple[str, ...]
+    """Get the lines of a function that maps an expression over an iterable."""
+    return (
+        "def {}({}s):".format(name, target),
+        "    return [",
+        "        {} if {}.__class__ is cls else _fallback({})".format(
+            expression, target, target
+        ),
+        "        for {0} in {0}s".format(target),
+        "    ]",
+    )
+
+
+def _compile_pair(cls, lines, names, namespace):
+    # type: (Type[Any], List[str], Tuple[str, str], Dict[str, Any]) -> Tuple[Any, ...]
+    """Compile a function and its bulk version, which calls it by name."""
+    code = compile_code("\n".join(lines) + "\n", names[0])
+    scope = {}  # type: Dict[str, Any]
+    exec(code, namespace, scope)
+    namespace.update(scope)
+    return tuple(_finalize(scope[n], cls, n) for n in names)
+
+
+def make_frozen(cls):
+    # type: (Type[Any]) -> Tuple[Callable[..., Any], ...]
+    """
+    Make `__setattr__` and `__delattr__` methods that always raise, and a
+    `__setstate__` method that restores the default pickled state (used by
+    :mod:`pickle` and :mod:`copy`) through the slot descriptors instead. The cached
+    hash is not restored, since hashes can differ between processes.
+
+    :param cls: Class.
+    :return: `__setattr__`, `__delattr__` and `__setstate__` methods.
+    """
+
+    def __setattr__(self, name, value):
+        # type: (Any, str, Any) -> None
+        error = "can't set attribute {!r} of frozen {!r} instance".format(
+            name, type(self).__name__
+        )
+        raise AttributeError(error)
+
+    def __delattr__(self, name):
+        # type: (Any, str) -> None
+        error = "can't delete attribute {!r} of frozen {!r} instance".format(
+            name, type(self).__name__
+        )
+        raise AttributeError(error)
+
+    def __setstate__(self, state):
+        # type: (Any, Any) -> None
+        if isinstance(state, tuple) and len(state) == 2:
+            state, slot_state = state
+        else:
+            slot_state = None
+        for values in (state, slot_state):
+            for name, value in six.iteritems(values or {}):
+                if name != HASH_SLOT:
+                    object.__setattr__(self, name, value)
+
+    return (
+        _finalize(__setattr__, cls, "__setattr__"),
+        _finalize(__delattr__, cls, "__delattr__"),
+        _finalize(__setstate__, cls, "__setstate__"),
+    )
+
+
+def _values(infos, namespace):
+    # type: (Sequence[SlotInfo], Dict[str, Any]) -> str
+    """Add a function that gets the slot values of an instance as a tuple."""
+    namespace["UNSET"] = UNSET
+    lines = []  # type: List[str]
+    values = []  # type: List[str]
+    for i, info in enumerate(infos):
+        value = "v{}".format(i)
+        values.append(value)
+        lines.extend(
+            (
+                "    try:",
+                "        {} = self.{}".format(value, info.mangled_name),
+                "    except AttributeError:",
+                "        {} = UNSET".format(value),
+            )
+        )
+    lines.append("    return ({})".format("".join(v + ", " for v in values)))
+    source = "def _values(self):\n{}\n".format("\n".join(lines))
+    namespace["_values"] = compile_function(source, "_values", namespace)
+    return "_values"
+
+
+def make_eq(cls, infos):
+    # type: (Type[Any], Sequence[SlotInfo]) -> Tuple[Callable[..., Any], ...]
+    """
+    Make `__eq__` and `__ne__` methods that compare the slot values of instances of
+    the exact same class, one by one. An instance is always equal to itself (like
+    tuples, even if it holds values that are not equal to themselves, such as NaN).
+
+    :param cls: Class.
+    :param infos: Slot infos, in comparison order.
+    :return: `__eq__` and `__ne__` methods.
+    """
+    namespace = {}  # type: Dict[str, Any]
+    values = _values(infos, namespace)
+    methods = []  # type: List[Callable[..., Any]]
+    for name, operator, joiner, empty, identical in (
+        ("__eq__", "==", " and ", "True", "True"),
+        ("__ne__", "!=", " or ", "False", "False"),
+    ):
+        expression = joiner.join(
+            "self.{0} {1} other.{0}".format(i.mangled_name, operator) for i in infos
+        )
+
+        # Compare the values directly, unless some slots are unset.
+        source = "\n".join(
+            (
+                "def {}(self, other):".format(name),
+                "    if other is self:",
+                "        return {}".format(identical),
+                "    if other.__class__ is not self.__class__:",
+                "        return NotImplemented",
+                "    try:",
+                "        return {}".format(expression or empty),
+                "    except AttributeError:",
+                "        return {0}(self) {1} {0}(other)".format(values, operator),
+                "",
+            )
+        )
+        methods.append(_finalize(compile_function(source, name, namespace), cls, name))
+    return tuple(methods)
+
+
+def make_order(cls, infos):
+    # type: (Type[Any], Sequence[SlotInfo]) -> Tuple[Callable[..., Any], ...]
+    """
+    Make `__lt__`, `__le__`, `__gt__` and `__ge__` methods that compare the slot
+    values of instances of the exact same class lexicographically (like tuples),
+    without building temporary tuples.
+
+    :param cls: Class.
+    :param infos: Slot infos, in comparison order.
+    :return: `__lt__`, `__le__`, `__gt__` and `__ge__` methods.
+    """
+    namespace = {}  # type: Dict[str, Any]
+    methods = []  # type: List[Callable[..., Any]]
+    for name, operator, empty in (
+        ("__lt__", "<", "False"),
+        ("__le__", "<=", "True"),
+        ("__gt__", ">", "False"),
+        ("__ge__", ">=", "True"),
+    ):
+        lines = [
+            "def {}(self, other):".format(name),
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+        ]
+        for i, info in enumerate(infos):
+            lines.append(
+                "    a, b = self.{0}, other.{0}".format(info.mangled_name),
+            )
+            if i == len(infos) - 1:
+                lines.append("    return a {} b".format(operator))
+            else:
+                lines.extend(
+                    (
+                        "    if a is not b and a != b:",
+                        "        return a {} b".format(operator),
+                    )
+                )
+        if not infos:
+            lines.append("    return {}".format(empty))
+        source = "\n".join(lines) + "\n"
+        methods.append(_finalize(compile_function(source, name, namespace), cls, name))
+    return tuple(methods)
+
+
+def make_repr(cls, infos):
+    # type: (Type[Any], Sequence[SlotInfo]) -> Callable[..., str]
+    """
+    Make a `__repr__` method that shows the slot values as keyword arguments.
+
+    Unset slots are shown as :data:`UNSET`, and instances that contain themselves are
+    shown as `...` where they recur.
+
+    :param cls: Class.
+    :param infos: Slot infos, in display order.
+    :return: Method.
+    """
+    namespace = {}  # type: Dict[str, Any]
+    values = _values(infos, namespace)
+    template = "%s({})".format(
+        ", ".join("{}=%r".format(parameter_name(i)) for i in infos)
+    )
+    arguments = "".join("self.{}, ".format(i.mangled_name) for i in infos)
+    source = "\n".join(
+        (
+            "def __repr__(self):",
+            "    try:",
+            "        return {!r} % (self.__class__.__name__, {})".format(
+                template, arguments
+            ),
+            "    except AttributeError:",
+            "        return {!r} % ((self.__class__.__name__,) + {}(self))".format(
+                template, values
+            ),
+            "",
+        )
+    )
+    method = reprlib.recursive_repr()(compile_function(source, "__repr__", namespace))
+    return _finalize(method, cls, "__repr__")
+
+
+def make_hash(cls, infos, hash_info):
+    # type: (Type[Any], Sequence[SlotInfo], SlotInfo) -> Callable[..., int]
+    """
+    Make a `__hash__` method that hashes the slot values and caches the result.
+
+    :param cls: Class.
+    :param infos: Slot infos.
+    :param hash_info: Info of the slot that caches the hash.
+    :return: Method.
+    """
+    namespace = {}  # type: Dict[str, Any]
+    values = _values(infos, namespace)
+    source = "\n".join(
+        (
+            "def __hash__(self):",
+            "    try:",
+            "        return self.{}".format(hash_info.mangled_name),
+            "    except AttributeError:",
+            "        pass",
+            "    result = hash({}(self))".format(values),
+            "    {}".format(assign(hash_info, "result", namespace, True)),
+            "    return result",
+            "",
+        )
+    )
+    return _finalize(compile_function(source, "__hash__", namespace), cls, "__hash__")
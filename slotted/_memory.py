@@ -0,0 +1,221 @@
+import collections
+import sys
+
+import six
+
+from ._census import allocator
+from ._generate import is_special_slot
+from ._slotted import _hidden_slots, _redundant_slots, slot_layout
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Callable, Iterable, List, Tuple, Union
+
+__all__ = ["MemoryReport", "memory_report", "LayoutReport", "layout_report"]
+
+
+# Number of instances allocated when measuring the size of a single instance.
+_PROBE_COUNT = 1000
+
+
+class MemoryReport(
+    collections.namedtuple(
+        "MemoryReport",
+        (
+            "cls",
+            "basicsize",
+            "slot_counts",
+            "instance_size",
+            "dict_instance_size",
+            "saved_per_instance",
+            "instance_count",
+            "estimated_total_size",
+        ),
+    )
+):
+    """
+    Memory footprint of a class, compared with an equivalent `__dict__` class.
+
+    Sizes are measured with :mod:`tracemalloc` when available (falling back to
+    :func:`sys.getsizeof`) on instances allocated without calling `__init__`, and
+    only account for the instances themselves, not for the values stored in them.
+
+    :param cls: Class.
+    :param basicsize: Instance basic size (`__basicsize__`).
+    :param slot_counts: Number of slots per declaring class, as `(owner, count)`.
+    :param instance_size: Bytes allocated per instance.
+    :param dict_instance_size: Bytes allocated per equivalent `__dict__` instance.
+    :param saved_per_instance: Bytes saved per instance.
+    :param instance_count: Number of instances in the sample.
+    :param estimated_total_size: Estimated bytes allocated for all instances in the
+        sample (`instance_size * instance_count`, see :meth:`estimate`).
+    """
+
+    __slots__ = ()
+
+    def estimate(self, count):
+        # type: (int) -> int
+        """
+        Estimate the bytes allocated for a number of instances.
+
+        :param count: Number of instances.
+        :return: Bytes.
+        """
+        instance_size = self.instance_size  # type: int
+        return instance_size * count
+
+
+def _traced_size(factory):
+    # type: (Callable[[], Any]) -> int
+    objs = [None] * _PROBE_COUNT  # type: List[Any]
+    try:
+        import tracemalloc
+    except ImportError:  # pragma: no cover
+        obj = objs[0] = factory()
+        return sys.getsizeof(obj) + sys.getsizeof(getattr(obj, "__dict__", None))
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in six.moves.range(_PROBE_COUNT):
+            objs[i] = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if started:
+            tracemalloc.stop()
+    return max(after - before, 0) // _PROBE_COUNT
+
+
+def _attribute_names(cls):
+    # type: (type) -> List[str]
+    return [i.mangled_name for i in slot_layout(cls) if not is_special_slot(i.name)]
+
+
+def _slotted_factory(cls):
+    # type: (type) -> Callable[[], Any]
+    names = _attribute_names(cls)
+    allocate = allocator(cls)
+
+    def factory():
+        # type: () -> Any
+        obj = allocate()
+        for name in names:
+            object.__setattr__(obj, name, None)
+        return obj
+
+    return factory
+
+
+def _dict_factory(cls):
+    # type: (type) -> Callable[[], Any]
+    names = _attribute_names(cls)
+    dict_cls = type(cls.__name__, (object,), {})
+
+    def factory():
+        # type: () -> Any
+        obj = dict_cls()
+        for name in names:
+            setattr(obj, name, None)
+        return obj
+
+    return factory
+
+
+def memory_report(cls_or_instances):
+    # type: (Union[type, Iterable[Any]]) -> MemoryReport
+    """
+    Report the memory footprint of a class.
+
+    :param cls_or_instances: Class or sample of live instances of the same class.
+    :return: Memory report.
+    :raises TypeError: Instances are not all of the same class.
+    """
+    if isinstance(cls_or_instances, type):
+        cls = cls_or_instances
+        instance_count = 0
+    else:
+        classes = set()
+        instance_count = 0
+        for instance in cls_or_instances:
+            classes.add(type(instance))
+            instance_count += 1
+        if len(classes) != 1:
+            error = "expected instances of a single class, got {}".format(len(classes))
+            raise TypeError(error)
+        cls = classes.pop()
+
+    slot_counts = collections.OrderedDict()  # type: collections.OrderedDict[type, int]
+    for info in slot_layout(cls):
+        slot_counts[info.owner] = slot_counts.get(info.owner, 0) + 1
+
+    instance_size = _traced_size(_slotted_factory(cls))
+    dict_instance_size = _traced_size(_dict_factory(cls))
+    return MemoryReport(
+        cls=cls,
+        basicsize=cls.__basicsize__,
+        slot_counts=tuple(slot_counts.items()),
+        instance_size=instance_size,
+        dict_instance_size=dict_instance_size,
+        saved_per_instance=dict_instance_size - instance_size,
+        instance_count=instance_count,
+        estimated_total_size=instance_size * instance_count,
+    )
+
+
+class LayoutReport(
+    collections.namedtuple(
+        "LayoutReport",
+        (
+            "cls",
+            "basicsize",
+            "base_basicsize",
+            "added_size",
+            "dict_offset",
+            "weakref_offset",
+            "redundant_slots",
+            "hidden_slots",
+        ),
+    )
+):
+    """
+    Low-level instance layout of a class, read from the type object (no instances are
+    created, so it is cheap enough to assert a per-class memory budget in tests).
+
+    :param cls: Class.
+    :param basicsize: Instance basic size (`__basicsize__`).
+    :param base_basicsize: Instance basic size of the base whose layout is extended.
+    :param added_size: Bytes added to the instances by the class itself.
+    :param dict_offset: Offset of the `__dict__` pointer (`__dictoffset__`, 0 if none).
+    :param weakref_offset: Offset of the `__weakref__` pointer (`__weakrefoffset__`,
+        0 if none).
+    :param redundant_slots: Slots declared more than once in the MRO (mangled names),
+        each wasting a pointer per instance.
+    :param hidden_slots: Special slots (`__dict__` or `__weakref__`) that instances
+        have although no class in the MRO declares them in `__slots__`.
+    """
+
+    __slots__ = ()
+
+
+def layout_report(cls):
+    # type: (type) -> LayoutReport
+    """
+    Report the instance layout of a class.
+
+    :param cls: Class.
+    :return: Layout report.
+    """
+    base = cls.__base__
+    base_basicsize = base.__basicsize__ if base is not None else 0
+    return LayoutReport(
+        cls=cls,
+        basicsize=cls.__basicsize__,
+        base_basicsize=base_basicsize,
+        added_size=cls.__basicsize__ - base_basicsize,
+        dict_offset=cls.__dictoffset__,
+        weakref_offset=cls.__weakrefoffset__,
+        redundant_slots=_redundant_slots(cls),
+        hidden_slots=_hidden_slots(cls),
+    )
@@ -0,0 +1,247 @@
+import struct
+from itertools import chain
+
+import six
+
+from ._array import make_view_class, typecode
+from ._census import allocator
+from ._generate import is_special_slot, slot_annotation
+from ._rows import as_tuple, as_tuples, from_rows
+from ._slotted import Slotted, slot_layout
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Dict, Iterable, Iterator, List, Tuple, Type
+
+__all__ = ["SlottedStruct"]
+
+
+# Struct format characters for array type codes (standard sizes, no padding).
+_FORMATS = {"q": "q", "d": "d", "b": "?"}  # type: Dict[str, str]
+
+# Number of records packed by a single struct call.
+_CHUNK_SIZE = 256
+
+
+def _field_getter(field_struct, field_offset):
+    # type: (struct.Struct, int) -> Any
+    unpack_from = field_struct.unpack_from
+
+    def getter(self):
+        # type: (Any) -> Any
+        return unpack_from(
+            self.__slotted_buffer__, self.__slotted_offset__ + field_offset
+        )[0]
+
+    return getter
+
+
+class SlottedStruct(Slotted):
+    """
+    Fixed-size binary records for instances of a slotted class whose slots are all
+    annotated with `int`, `float` or `bool` (packed little-endian as 64-bit integers,
+    doubles and single bytes, without padding).
+
+    Records are decoded from any bytes-like object without copying it, either into
+    actual instances or into lightweight views: instances of a generated subclass of
+    the class whose slot attributes unpack their field from the buffer on access.
+
+    :param cls: Record class.
+    :raises TypeError: Slot does not have a primitive annotation.
+    """
+
+    __slots__ = (
+        "__cls",
+        "__struct",
+        "__chunk_struct",
+        "__view_cls",
+        "__new_view",
+        "__set_buffer",
+        "__set_offset",
+    )
+
+    def __init__(self, cls):
+        # type: (Type[Any]) -> None
+        infos = [i for i in slot_layout(cls) if not is_special_slot(i.name)]
+        formats = []  # type: List[str]
+        for info in infos:
+            typecode_ = typecode(slot_annotation(info))
+            if typecode_ is None:
+                error = "slot {!r} of {!r} is not annotated with {}".format(
+                    info.name, cls.__name__, "int, float or bool"
+                )
+                raise TypeError(error)
+            formats.append(_FORMATS[typecode_])
+
+        self.__cls = cls
+        self.__struct = struct.Struct("<" + "".join(formats))
+        self.__chunk_struct = struct.Struct("<" + "".join(formats) * _CHUNK_SIZE)
+        self.__view_cls = _view_class(cls, infos, formats)
+        self.__new_view = allocator(self.__view_cls)
+        self.__set_buffer = self.__view_cls.__dict__["__slotted_buffer__"].__set__
+        self.__set_offset = self.__view_cls.__dict__["__slotted_offset__"].__set__
+
+    def __repr__(self):
+        # type: () -> str
+        return "<{} {!r} for {!r}>".format(
+            type(self).__name__, self.__struct.format, self.__cls.__name__
+        )
+
+    def count(self, buffer):
+        # type: (Any) -> int
+        """
+        Get the number of records in a buffer.
+
+        :param buffer: Bytes-like object.
+        :return: Number of records.
+        :raises ValueError: Buffer size is not a multiple of the record size.
+        """
+        nbytes = memoryview(buffer).nbytes
+        if nbytes % self.__struct.size:
+            error = "buffer size {} is not a multiple of the record size {}".format(
+                nbytes, self.__struct.size
+            )
+            raise ValueError(error)
+        return nbytes // self.__struct.size
+
+    def pack(self, obj):
+        # type: (Any) -> bytes
+        """
+        Pack an instance into a record.
+
+        :param obj: Instance.
+        :return: Record.
+        :raises AttributeError: Slot is unset.
+        """
+        return self.__struct.pack(*as_tuple(obj))
+
+    def pack_many(self, objs):
+        # type: (Iterable[Any]) -> bytearray
+        """
+        Pack multiple instances into a contiguous buffer of records.
+
+        :param objs: Instances.
+        :return: Records.
+        :raises AttributeError: Slot is unset.
+        """
+        rows = as_tuples(objs)
+        size = self.__struct.size
+        buffer = bytearray(size * len(rows))
+
+        # Records are packed in chunks, with one call to a repeated struct for each.
+        chunk_struct = self.__chunk_struct
+        chunk_size = _CHUNK_SIZE
+        for start in six.moves.range(0, len(rows) - chunk_size + 1, chunk_size):
+            values = chain.from_iterable(rows[start : start + chunk_size])
+            chunk_struct.pack_into(buffer, start * size, *values)
+        pack_into = self.__struct.pack_into
+        for index in six.moves.range(len(rows) - len(rows) % chunk_size, len(rows)):
+            pack_into(buffer, index * size, *rows[index])
+        return buffer
+
+    def unpack(self, buffer, index=0):
+        # type: (Any, int) -> Any
+        """
+        Make an instance from a record.
+
+        :param buffer: Bytes-like object.
+        :param index: Record index.
+        :return: Instance.
+        """
+        offset = self.__offset(buffer, index)
+        return from_rows(self.__cls, (self.__struct.unpack_from(buffer, offset),))[0]
+
+    def unpack_many(self, buffer):
+        # type: (Any) -> List[Any]
+        """
+        Make instances from all records in a buffer.
+
+        :param buffer: Bytes-like object.
+        :return: Instances.
+        :raises ValueError: Buffer size is not a multiple of the record size.
+        """
+        self.count(buffer)
+        return from_rows(self.__cls, self.__struct.iter_unpack(buffer))
+
+    def view(self, buffer, index=0):
+        # type: (Any, int) -> Any
+        """
+        Get a lazy view of a record, which unpacks its fields on access.
+
+        :param buffer: Bytes-like object (kept alive by the view).
+        :param index: Record index.
+        :return: View (an instance of a subclass of the record class).
+        """
+        view = self.__new_view()
+        self.__set_buffer(view, buffer)
+        self.__set_offset(view, self.__offset(buffer, index))
+        return view
+
+    def views(self, buffer):
+        # type: (Any) -> Iterator[Any]
+        """
+        Iterate over lazy views of all records in a buffer.
+
+        :param buffer: Bytes-like object (kept alive by the views).
+        :return: Views.
+        :raises ValueError: Buffer size is not a multiple of the record size.
+        """
+        count = self.count(buffer)
+        new_view = self.__new_view
+        set_buffer = self.__set_buffer
+        set_offset = self.__set_offset
+        size = self.__struct.size
+
+        def iterate():
+            # type: () -> Iterator[Any]
+            for index in six.moves.range(count):
+                view = new_view()
+                set_buffer(view, buffer)
+                set_offset(view, index * size)
+                yield view
+
+        return iterate()
+
+    def __offset(self, buffer, index):
+        # type: (Any, int) -> int
+        count = self.count(buffer)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("index out of range")
+        return index * self.__struct.size
+
+    @property
+    def cls(self):
+        # type: () -> Type[Any]
+        """Record class."""
+        return self.__cls
+
+    @property
+    def format(self):
+        # type: () -> str
+        """Struct format of a record."""
+        return self.__struct.format
+
+    @property
+    def size(self):
+        # type: () -> int
+        """Size of a record, in bytes."""
+        return self.__struct.size
+
+
+def _view_class(cls, infos, formats):
+    # type: (Type[Any], List[Any], List[str]) -> Type[Any]
+    properties = {}  # type: Dict[str, property]
+    for index, info in enumerate(infos):
+        field_offset = struct.calcsize("<" + "".join(formats[:index]))
+        field_struct = struct.Struct("<" + formats[index])
+        properties[info.mangled_name] = property(
+            _field_getter(field_struct, field_offset)
+        )
+    return make_view_class(
+        cls,
+        "{}View".format(cls.__name__),
+        ("__slotted_buffer__", "__slotted_offset__"),
+        properties,
+    )
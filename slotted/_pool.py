@@ -0,0 +1,278 @@
+import contextlib
+import sys
+import threading
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Callable, Dict, Iterator, Optional, Type
+
+__all__ = ["SlottedPool", "get_pool", "release", "pooled"]
+
+
+# Whether threads run in parallel (free-threaded builds, see PEP 703).
+_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class SlottedPool(object):
+    """
+    Bounded free list of released instances of a class created with
+    `SlottedMeta(pool=size)`.
+
+    Released instances are kept in a dict keyed by their id (which also detects double
+    releases). With the GIL, single dict operations are atomic and the pool doesn't
+    lock, the free list is only guarded by a lock on free-threaded builds.
+
+    :param cls: Class.
+    :param size: Maximum number of released instances kept for reuse.
+    :param new: Original `__new__` of the class.
+    :param clear: Function that deletes the slot values of an instance.
+    :param reset: Function that sets the default values of a reused instance.
+    """
+
+    __slots__ = (
+        "__cls",
+        "__size",
+        "__new",
+        "__clear",
+        "__reset",
+        "__free",
+        "__lock",
+        "__released",
+        "__misses",
+    )
+
+    def __init__(
+        self,
+        cls,  # type: Type[Any]
+        size,  # type: int
+        new,  # type: Callable[..., Any]
+        clear,  # type: Callable[[Any], None]
+        reset=None,  # type: Optional[Callable[[Any], None]]
+    ):
+        # type: (...) -> None
+        if size < 1:
+            error = "pool size must be at least 1, got {}".format(size)
+            raise ValueError(error)
+        self.__cls = cls
+        self.__size = size
+        self.__new = new
+        self.__clear = clear
+        self.__reset = reset
+        self.__free = {}  # type: Dict[int, Any]
+        self.__lock = threading.Lock() if _FREE_THREADED else None
+        self.__released = 0
+        self.__misses = 0
+
+    def __len__(self):
+        # type: () -> int
+        """Number of released instances available for reuse."""
+        return len(self.__free)
+
+    def __repr__(self):
+        # type: () -> str
+        return "<{} for {!r}: {}/{} free, {} hits, {} misses>".format(
+            type(self).__name__,
+            self.__cls.__name__,
+            len(self.__free),
+            self.__size,
+            self.hits,
+            self.__misses,
+        )
+
+    def acquire(self):
+        # type: () -> Any
+        """
+        Get a released instance (with the default values declared in the class body
+        set again), or allocate a new one if the pool is empty.
+
+        :return: Instance (not initialized).
+        """
+        if self.__lock is None:
+            obj = self.__take()
+        else:
+            with self.__lock:
+                obj = self.__take()
+        if obj is None:
+            return self.__new(self.__cls)
+        if self.__reset is not None:
+            self.__reset(obj)
+        return obj
+
+    def __take(self):
+        # type: () -> Any
+        free = self.__free
+        if free:
+            try:
+                return free.popitem()[1]
+            except KeyError:  # taken by another thread
+                pass
+        self.__misses += 1
+        return None
+
+    def release(self, obj):
+        # type: (Any) -> None
+        """
+        Delete the slot values of an instance and keep it for reuse (if the pool is
+        not full). The instance must not be used after being released.
+
+        :param obj: Instance.
+        :raises TypeError: Instance is not of the pool's class.
+        :raises ValueError: Instance was already released (and is still in the pool).
+        """
+        if type(obj) is not self.__cls:
+            error = "expected an instance of {!r}, got {!r}".format(
+                self.__cls.__name__, type(obj).__name__
+            )
+            raise TypeError(error)
+        if self.__lock is None:
+            self.__put(obj)
+        else:
+            with self.__lock:
+                self.__put(obj)
+
+    def __put(self, obj):
+        # type: (Any) -> None
+        free = self.__free
+        obj_id = id(obj)
+        if obj_id in free:
+            raise ValueError("instance was already released")
+        self.__clear(obj)
+        if len(free) < self.__size:
+            free[obj_id] = obj
+            self.__released += 1
+
+    def clear(self):
+        # type: () -> None
+        """Drop all released instances and reset the counters."""
+        if self.__lock is None:
+            self.__reset_counters()
+        else:
+            with self.__lock:
+                self.__reset_counters()
+
+    def __reset_counters(self):
+        # type: () -> None
+        self.__free.clear()
+        self.__released = 0
+        self.__misses = 0
+
+    @property
+    def cls(self):
+        # type: () -> Type[Any]
+        """Class."""
+        return self.__cls
+
+    @property
+    def size(self):
+        # type: () -> int
+        """Maximum number of released instances kept for reuse."""
+        return self.__size
+
+    @property
+    def hits(self):
+        # type: () -> int
+        """Number of instances that were reused."""
+        # Reused instances are the released ones that left the free list.
+        return self.__released - len(self.__free)
+
+    @property
+    def misses(self):
+        # type: () -> int
+        """Number of instances that were allocated because the pool was empty."""
+        return self.__misses
+
+
+def original_new(cls):
+    # type: (Type[Any]) -> Callable[..., Any]
+    """Get the `__new__` method of a class, skipping the ones made by `SlottedMeta`."""
+    new = getattr(cls, "__new__")
+    while hasattr(new, "__slotted_original__"):
+        new = getattr(new, "__slotted_original__")
+    return new  # type: ignore
+
+
+def make_pool_new(cls, pool, original):
+    # type: (Type[Any], SlottedPool, Callable[..., Any]) -> Callable[..., Any]
+    """Make a `__new__` method that acquires instances from a pool."""
+    acquire = pool.acquire
+
+    lock = getattr(pool, "_SlottedPool__lock")
+    reset = getattr(pool, "_SlottedPool__reset")
+    if lock is None and reset is None:
+        # Take instances from the free list directly (without calling the pool).
+        free = getattr(pool, "_SlottedPool__free")  # type: Dict[int, Any]
+        popitem = free.popitem
+
+        def __new__(cls, *args, **kwargs):
+            # type: (Type[Any], *Any, **Any) -> Any
+            if free:
+                try:
+                    return popitem()[1]
+                except KeyError:  # taken by another thread
+                    pass
+            return acquire()
+
+    else:
+
+        def __new__(cls, *args, **kwargs):
+            # type: (Type[Any], *Any, **Any) -> Any
+            return acquire()
+
+    __new__.__module__ = cls.__module__
+    __new__.__qualname__ = "{}.__new__".format(
+        getattr(cls, "__qualname__", cls.__name__)
+    )
+    setattr(__new__, "__slotted_original__", original)
+    return __new__
+
+
+def get_pool(cls):
+    # type: (Type[Any]) -> SlottedPool
+    """
+    Get the instance pool of a class created with `SlottedMeta(pool=size)`.
+
+    :param cls: Class.
+    :return: Pool.
+    :raises TypeError: Class has no pool.
+    """
+    try:
+        return cls.__dict__["__slotted_pool__"]  # type: ignore
+    except KeyError:
+        error = "class {!r} has no instance pool".format(cls.__name__)
+        raise TypeError(error)
+
+
+def release(obj):
+    # type: (Any) -> None
+    """
+    Release an instance back to the pool of its class.
+
+    :param obj: Instance.
+    :raises TypeError: Class has no pool.
+    :raises ValueError: Instance was already released.
+    """
+    try:
+        release_ = type(obj).__slotted_release__
+    except AttributeError:
+        error = "class {!r} has no instance pool".format(type(obj).__name__)
+        raise TypeError(error)
+    release_(obj)
+
+
+@contextlib.contextmanager
+def pooled(cls, *args, **kwargs):
+    # type: (Type[Any], *Any, **Any) -> Iterator[Any]
+    """
+    Context manager that creates an instance and releases it on exit.
+
+    :param cls: Class created with `SlottedMeta(pool=size)`.
+    :param args: Arguments for the class.
+    :param kwargs: Keyword arguments for the class.
+    :return: Instance.
+    """
+    pool = get_pool(cls)
+    obj = cls(*args, **kwargs)
+    try:
+        yield obj
+    finally:
+        pool.release(obj)
@@ -0,0 +1,258 @@
+import threading
+
+import six
+
+from ._generate import (
+    is_special_slot,
+    make_as_dict,
+    make_as_tuple,
+    make_from_dict,
+    make_from_rows,
+    parameter_name,
+)
+from ._slotted import SlottedMeta, slot_layout
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import (
+        Any,
+        Callable,
+        Dict,
+        Hashable,
+        Iterable,
+        List,
+        Mapping,
+        Optional,
+        Sequence,
+        Tuple,
+        Type,
+        TypeVar,
+    )
+
+    T = TypeVar("T")
+
+__all__ = [
+    "from_rows",
+    "as_tuple",
+    "as_tuples",
+    "as_dict",
+    "as_dicts",
+    "from_dict",
+    "from_dicts",
+]
+
+
+# Guards the creation of the per-class function caches.
+_LOCK = threading.Lock()
+
+
+def _get_functions(cls, key, make, *args):
+    # type: (Type[Any], Hashable, Callable[..., Any], *Any) -> Any
+    """
+    Get generated functions by kind and options, making them on first use. They are
+    cached in the class itself, since they reference it (so both are collected
+    together).
+    """
+    functions = cls.__dict__.get("__slotted_functions__")
+    if functions is None:
+        with _LOCK:
+            functions = cls.__dict__.get("__slotted_functions__")
+            if functions is None:
+                functions = {}
+                type.__setattr__(cls, "__slotted_functions__", functions)
+    try:
+        return functions[key]
+    except KeyError:
+        # Concurrent builds are equivalent, publish whichever one gets there first.
+        return functions.setdefault(key, make(cls, *args))
+
+
+def _infos(cls):
+    # type: (Type[Any]) -> List[Any]
+    return [i for i in slot_layout(cls) if not is_special_slot(i.name)]
+
+
+def _convert_value(value, convert):
+    # type: (Any, Callable[[Any], Any]) -> Any
+    """Convert slotted values, including the ones in lists, tuples and dicts."""
+    if isinstance(type(value), SlottedMeta):
+        return convert(value)
+    if type(value) in (list, tuple):
+        return type(value)(_convert_value(v, convert) for v in value)
+    if type(value) is dict:
+        return dict((k, _convert_value(v, convert)) for k, v in six.iteritems(value))
+    return value
+
+
+def _make_as_tuple(cls, recurse):
+    # type: (Type[Any], bool) -> Tuple[Callable[..., Any], ...]
+    def fallback(obj):
+        # type: (Any) -> Any
+        return as_tuple(obj, recurse)
+
+    convert = None  # type: Optional[Callable[[Any], Any]]
+    if recurse:
+        convert = lambda v: _convert_value(v, fallback)
+    return make_as_tuple(cls, _infos(cls), convert, fallback)
+
+
+def _make_as_dict(cls, recurse, omit_unset):
+    # type: (Type[Any], bool, bool) -> Tuple[Callable[..., Any], ...]
+    def fallback(obj):
+        # type: (Any) -> Any
+        return as_dict(obj, recurse, omit_unset)
+
+    convert = None  # type: Optional[Callable[[Any], Any]]
+    if recurse:
+        convert = lambda v: _convert_value(v, fallback)
+    return make_as_dict(cls, _infos(cls), convert, fallback, omit_unset)
+
+
+def _make_from_dict(cls):
+    # type: (Type[Any]) -> Tuple[Callable[..., Any], ...]
+    return make_from_dict(cls, _infos(cls))
+
+
+def _make_from_rows(cls, fields):
+    # type: (Type[Any], Optional[Tuple[str, ...]]) -> Callable[..., Any]
+    infos = _infos(cls)
+    if fields is not None:
+        names = dict((parameter_name(i), i) for i in infos)
+        invalid = [f for f in fields if f not in names]
+        if invalid:
+            error = "invalid field name(s) {} for {!r}".format(
+                ", ".join(invalid), cls.__name__
+            )
+            raise TypeError(error)
+        infos = [names[f] for f in fields]
+    return make_from_rows(cls, infos)
+
+
+def from_rows(cls, rows, fields=None):
+    # type: (Type[T], Iterable[Sequence[Any]], Optional[Iterable[str]]) -> List[T]
+    """
+    Create instances of a slotted class from rows of values (for example, from a
+    :mod:`csv` reader or a DB-API cursor), without calling `__init__`.
+
+    Rows are consumed one at a time, so they can come from a generator. Values are set
+    directly through the slot descriptors by a function generated (and cached) for the
+    class and fields.
+
+    :param cls: Class.
+    :param rows: Iterable of rows, each with one value per field.
+    :param fields: Slot names (private slots without leading underscores) in row order
+        (defaults to all slots, in layout order).
+    :return: Instances.
+    :raises TypeError: Invalid field names.
+    :raises ValueError: Row has the wrong number of values.
+    """
+    if fields is not None:
+        if isinstance(fields, six.string_types):
+            fields = (fields,)
+        fields = tuple(fields)
+    functions = _get_functions(cls, ("from_rows", fields), _make_from_rows, fields)
+    return functions(rows)  # type: ignore
+
+
+def as_tuple(obj, recurse=False):
+    # type: (Any, bool) -> Tuple[Any, ...]
+    """
+    Get the slot values of an instance as a tuple, in layout order.
+
+    :param obj: Instance.
+    :param recurse: Whether to also convert slotted values (including the ones in
+        lists, tuples and dicts).
+    :return: Slot values.
+    :raises AttributeError: Slot is unset.
+    """
+    cls = type(obj)
+    functions = _get_functions(cls, ("as_tuple", recurse), _make_as_tuple, recurse)
+    return functions[0](obj)  # type: ignore
+
+
+def as_tuples(objs, recurse=False):
+    # type: (Iterable[Any], bool) -> List[Tuple[Any, ...]]
+    """
+    Get the slot values of multiple instances as tuples (see :func:`as_tuple`).
+
+    The function generated for the class of the first instance converts all of them,
+    so lists of instances of the same class have little per-instance overhead.
+
+    :param objs: Instances.
+    :param recurse: Whether to also convert slotted values.
+    :return: Slot values of each instance.
+    :raises AttributeError: Slot is unset.
+    """
+    objs = objs if isinstance(objs, (list, tuple)) else list(objs)
+    if not objs:
+        return []
+    cls = type(objs[0])
+    functions = _get_functions(cls, ("as_tuple", recurse), _make_as_tuple, recurse)
+    return functions[1](objs)  # type: ignore
+
+
+def as_dict(obj, recurse=False, omit_unset=False):
+    # type: (Any, bool, bool) -> Dict[str, Any]
+    """
+    Get the slot values of an instance as a dictionary, keyed by slot name (private
+    slots without leading underscores), in layout order.
+
+    :param obj: Instance.
+    :param recurse: Whether to also convert slotted values (including the ones in
+        lists, tuples and dicts).
+    :param omit_unset: Whether to leave unset slots out.
+    :return: Slot values.
+    :raises AttributeError: Slot is unset and `omit_unset` is False.
+    """
+    key = ("as_dict", recurse, omit_unset)
+    functions = _get_functions(type(obj), key, _make_as_dict, recurse, omit_unset)
+    return functions[0](obj)  # type: ignore
+
+
+def as_dicts(objs, recurse=False, omit_unset=False):
+    # type: (Iterable[Any], bool, bool) -> List[Dict[str, Any]]
+    """
+    Get the slot values of multiple instances as dictionaries (see :func:`as_dict`).
+
+    The function generated for the class of the first instance converts all of them,
+    so lists of instances of the same class have little per-instance overhead.
+
+    :param objs: Instances.
+    :param recurse: Whether to also convert slotted values.
+    :param omit_unset: Whether to leave unset slots out.
+    :return: Slot values of each instance.
+    :raises AttributeError: Slot is unset and `omit_unset` is False.
+    """
+    objs = objs if isinstance(objs, (list, tuple)) else list(objs)
+    if not objs:
+        return []
+    key = ("as_dict", recurse, omit_unset)
+    functions = _get_functions(type(objs[0]), key, _make_as_dict, recurse, omit_unset)
+    return functions[1](objs)  # type: ignore
+
+
+def from_dict(cls, dct):
+    # type: (Type[T], Mapping[str, Any]) -> T
+    """
+    Create an instance of a slotted class from a dictionary of slot values (see
+    :func:`as_dict`), without calling `__init__`. Missing keys leave their slots unset.
+
+    :param cls: Class.
+    :param dct: Slot values, keyed by slot name.
+    :return: Instance.
+    :raises TypeError: Invalid slot names.
+    """
+    return _get_functions(cls, "from_dict", _make_from_dict)[0](dct)  # type: ignore
+
+
+def from_dicts(cls, dcts):
+    # type: (Type[T], Iterable[Mapping[str, Any]]) -> List[T]
+    """
+    Create instances of a slotted class from dictionaries (see :func:`from_dict`).
+
+    :param cls: Class.
+    :param dcts: Slot values of each instance, keyed by slot name.
+    :return: Instances.
+    :raises TypeError: Invalid slot names.
+    """
+    return _get_functions(cls, "from_dict", _make_from_dict)[1](dcts)  # type: ignore
@@ -0,0 +1,374 @@
+import array
+import contextlib
+import os
+import pickle
+import sys
+import weakref
+
+import six
+
+from ._array import _view_class, typecode
+from ._census import allocator
+from ._generate import is_special_slot, parameter_name, slot_annotation
+from ._rows import as_tuples, from_rows
+from ._slotted import Slotted, slot_layout
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import (
+        Any,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Sequence,
+        Tuple,
+        Type,
+    )
+
+__all__ = ["SharedBatch"]
+
+
+# Number of values of an object column pickled together.
+_CHUNK_SIZE = 4096
+
+# Typed columns are aligned to their item size (at most 8 bytes).
+_ALIGNMENT = 8
+
+# Memoryview formats for array type codes (bools are stored as single bytes).
+_FORMATS = {"q": "q", "d": "d", "b": "?"}  # type: Dict[str, Any]
+
+# Exact types of the values stored in typed columns (other values are pickled).
+_TYPES = {"q": int, "d": float, "b": bool}  # type: Dict[str, type]
+
+# Process that started its own resource tracker when attaching to a block.
+_PRIVATE_TRACKER_PID = None  # type: Optional[int]
+
+
+def _attach(name):
+    # type: (str) -> Any
+    """Attach to a shared memory block without letting this process unlink it."""
+    from multiprocessing import resource_tracker, shared_memory
+
+    if sys.version_info[:2] >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+
+    # Attaching registers the block with the resource tracker of the process, which
+    # unlinks it when the process exits. Processes started by multiprocessing share
+    # the tracker of their parent (where the registration is a duplicate), processes
+    # without a tracker start their own one and have to unregister.
+    global _PRIVATE_TRACKER_PID
+    tracker = getattr(resource_tracker, "_resource_tracker", None)
+    if getattr(tracker, "_fd", None) is None:
+        _PRIVATE_TRACKER_PID = os.getpid()
+    shm = shared_memory.SharedMemory(name)
+    if os.name == "posix" and _PRIVATE_TRACKER_PID == os.getpid():
+        resource_tracker.unregister(getattr(shm, "_name"), "shared_memory")
+    return shm
+
+
+def _destroy(shm, pid):
+    # type: (Any, int) -> None
+    """Close and unlink a shared memory block (only in the process that created it)."""
+    shm.close()
+    if os.getpid() == pid:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _open(cls, name, names, columns, start, stop):
+    # type: (Type[Any], str, Tuple[str, ...], Tuple[Any, ...], int, int) -> Any
+    """Make a handle to a range of rows of a batch (that doesn't own the block)."""
+    batch = allocator(SharedBatch)()  # type: Any
+    batch._SharedBatch__init(cls, name, names, columns, start, stop, None)
+    return batch
+
+
+class SharedBatch(Slotted):
+    """
+    Batch of instances of a slotted class, encoded column by column in a
+    :mod:`multiprocessing.shared_memory` block, so it can be sent to other processes
+    (for example, to the workers of a :class:`concurrent.futures.ProcessPoolExecutor`)
+    without pickling every instance.
+
+    Slots annotated with `int`, `float` or `bool` are stored as unboxed arrays, other
+    slots are pickled in chunks of rows. Pickling a batch only pickles a small handle
+    (the class is pickled by reference), which attaches to the block to decode it.
+
+    The batch that creates the block owns it: the block is unlinked when the owner is
+    closed (or used as a context manager), garbage collected, or when the interpreter
+    exits, so it must stay alive until the other processes are done with it.
+
+    :param cls: Class.
+    :param objs: Instances of the class (all slots must be set).
+    :raises AttributeError: Slot is unset.
+    """
+
+    __slots__ = (
+        "__cls",
+        "__name",
+        "__names",
+        "__columns",
+        "__start",
+        "__stop",
+        "__finalizer",
+        "__weakref__",
+    )
+
+    def __init__(self, cls, objs):
+        # type: (Type[Any], Iterable[Any]) -> None
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:  # pragma: no cover
+            raise RuntimeError("shared memory requires Python 3.8 or later")
+
+        infos = [i for i in slot_layout(cls) if not is_special_slot(i.name)]
+        rows = as_tuples(objs)
+        values = list(zip(*rows)) if rows else [()] * len(infos)
+
+        # Encode the columns and lay them out one after the other.
+        columns = []  # type: List[Any]
+        data = []  # type: List[Any]
+        size = 0
+        for info, column in zip(infos, values):
+            encoded, typecode_, ends = _encode(column, typecode(slot_annotation(info)))
+            size += -size % _ALIGNMENT
+            columns.append((typecode_, size, ends))
+            data.append(encoded)
+            size += len(encoded)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        finalizer = weakref.finalize(self, _destroy, shm, os.getpid())
+        buf = shm.buf  # type: Any
+        for (_, offset, _), encoded in zip(columns, data):
+            buf[offset : offset + len(encoded)] = encoded
+
+        names = tuple(parameter_name(i) for i in infos)
+        self.__init(cls, shm.name, names, tuple(columns), 0, len(rows), finalizer)
+
+    def __init(
+        self,
+        cls,  # type: Type[Any]
+        name,  # type: str
+        names,  # type: Tuple[str, ...]
+        columns,  # type: Tuple[Any, ...]
+        start,  # type: int
+        stop,  # type: int
+        finalizer,  # type: Optional[weakref.finalize[..., Any]]
+    ):
+        # type: (...) -> None
+        self.__cls = cls
+        self.__name = name
+        self.__names = names
+        self.__columns = columns
+        self.__start = start
+        self.__stop = stop
+        self.__finalizer = finalizer
+
+    def __reduce__(self):
+        # type: () -> Tuple[Any, ...]
+        return _open, (
+            self.__cls,
+            self.__name,
+            self.__names,
+            self.__columns,
+            self.__start,
+            self.__stop,
+        )
+
+    def __len__(self):
+        # type: () -> int
+        return self.__stop - self.__start
+
+    def __repr__(self):
+        # type: () -> str
+        return "<{} of {} {!r} rows in {!r}>".format(
+            type(self).__name__, len(self), self.__cls.__name__, self.__name
+        )
+
+    def __enter__(self):
+        # type: () -> SharedBatch
+        return self
+
+    def __exit__(self, *_):
+        # type: (*Any) -> None
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        """Close and unlink the block if this batch owns it (no-op for handles)."""
+        if self.__finalizer is not None:
+            self.__finalizer()
+
+    def split(self, parts):
+        # type: (int) -> List[SharedBatch]
+        """
+        Split into handles to contiguous ranges of rows, one per task.
+
+        Handles don't own the block, and only decode their own rows.
+
+        :param parts: Maximum number of handles.
+        :return: Handles (empty ranges are left out).
+        """
+        if parts < 1:
+            raise ValueError("parts must be at least 1, got {}".format(parts))
+        length = len(self)
+        bounds = [self.__start + length * p // parts for p in six.moves.range(parts)]
+        bounds.append(self.__stop)
+        return [
+            _open(
+                self.__cls,
+                self.__name,
+                self.__names,
+                self.__columns,
+                start,
+                stop,
+            )
+            for start, stop in zip(bounds, bounds[1:])
+            if stop > start
+        ]
+
+    def load(self):
+        # type: () -> List[Any]
+        """
+        Make instances from the rows (without calling `__init__`).
+
+        :return: Instances.
+        """
+        with self.__attach() as columns:
+            values = [c if isinstance(c, list) else c.tolist() for c in columns]
+        rows = zip(*values) if values else [()] * len(self)
+        return from_rows(self.__cls, rows, self.__names)
+
+    @contextlib.contextmanager
+    def open(self):
+        # type: () -> Iterator[_Rows]
+        """
+        Get lazy, read-only views of the rows (see :class:`SlottedArray`), which read
+        typed values straight from the block. Views can only be used in the context.
+
+        :return: Context manager for a sequence of views.
+        """
+        typecodes = tuple(c[0] for c in self.__columns)
+        with self.__attach() as columns:
+            yield _Rows(self.__cls, columns, typecodes, len(self))
+
+    @contextlib.contextmanager
+    def __attach(self):
+        # type: () -> Iterator[List[Any]]
+        shm = _attach(self.__name)
+        views = []  # type: List[memoryview]
+        try:
+            columns = []  # type: List[Any]
+            for typecode_, offset, ends in self.__columns:
+                if typecode_ is None:
+                    bounds = self.__start, self.__stop
+                    columns.append(_decode(shm.buf, offset, ends, bounds))
+                    continue
+                itemsize = array.array(typecode_).itemsize
+                start = offset + self.__start * itemsize
+                views.append(shm.buf[start : start + len(self) * itemsize])
+                views.append(views[-1].cast(_FORMATS[typecode_]))
+                views.append(views[-1].toreadonly())
+                columns.append(views[-1])
+            yield columns
+        finally:
+            for view in reversed(views):
+                view.release()
+            shm.close()
+
+    @property
+    def cls(self):
+        # type: () -> Type[Any]
+        """Class."""
+        return self.__cls
+
+    @property
+    def name(self):
+        # type: () -> str
+        """Name of the shared memory block."""
+        return self.__name
+
+
+class _Rows(Slotted):
+    """Read-only sequence of row views over decoded columns."""
+
+    __slots__ = (
+        "__columns",
+        "__length",
+        "__new_view",
+        "__set_columns",
+        "__set_index",
+    )
+
+    def __init__(self, cls, columns, typecodes, length):
+        # type: (Type[Any], List[Any], Tuple[Optional[str], ...], int) -> None
+        infos = tuple(i for i in slot_layout(cls) if not is_special_slot(i.name))
+        self.__columns = tuple(columns)
+        self.__length = length
+        view_cls = _view_class(cls, infos, typecodes)
+        self.__new_view = allocator(view_cls)
+        self.__set_columns = view_cls.__dict__["__slotted_columns__"].__set__
+        self.__set_index = view_cls.__dict__["__slotted_index__"].__set__
+
+    def __len__(self):
+        # type: () -> int
+        return self.__length
+
+    def __getitem__(self, index):
+        # type: (int) -> Any
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError("index out of range")
+        view = self.__new_view()
+        self.__set_columns(view, self.__columns)
+        self.__set_index(view, index)
+        return view
+
+    def __iter__(self):
+        # type: () -> Iterator[Any]
+        for index in six.moves.range(self.__length):
+            yield self[index]
+
+
+def _encode(column, typecode_):
+    # type: (Sequence[Any], Optional[str]) -> Tuple[Any, Optional[str], Tuple[int, ...]]
+    """Encode a column as an unboxed array, or as pickled chunks of values."""
+    # Values are only unboxed if they have the exact type (1.0 == 1, but isn't an int).
+    if typecode_ is not None and all(type(v) is _TYPES[typecode_] for v in column):
+        try:
+            return memoryview(array.array(typecode_, column)).cast("B"), typecode_, ()
+        except OverflowError:  # integer doesn't fit
+            pass
+    chunks = []  # type: List[bytes]
+    ends = []  # type: List[int]
+    end = 0
+    for start in six.moves.range(0, len(column), _CHUNK_SIZE):
+        chunk = pickle.dumps(
+            list(column[start : start + _CHUNK_SIZE]), pickle.HIGHEST_PROTOCOL
+        )
+        chunks.append(chunk)
+        end += len(chunk)
+        ends.append(end)
+    return b"".join(chunks), None, tuple(ends)
+
+
+def _decode(buf, offset, ends, bounds):
+    # type: (memoryview, int, Tuple[int, ...], Tuple[int, int]) -> List[Any]
+    """Unpickle the chunks of an object column that hold a range of rows."""
+    start, stop = bounds
+    if start >= stop:
+        return []
+    first = start // _CHUNK_SIZE
+    last = (stop - 1) // _CHUNK_SIZE
+    values = []  # type: List[Any]
+    for index in six.moves.range(first, last + 1):
+        chunk_start = offset + (ends[index - 1] if index else 0)
+        with buf[chunk_start : offset + ends[index]] as chunk:
+            values.extend(pickle.loads(chunk))
+    skip = start - first * _CHUNK_SIZE
+    return values[skip : skip + stop - start]
@@ -1,13 +1,411 @@
-import inspect
+import collections
+import sys
+import weakref
 
 import six
-from tippo import Any, Dict, Set, Tuple, Type, TypeVar
 
-__all__ = ["SlottedMeta", "Slotted", "slots"]
+from ._cached import cached_slot_property
+from ._census import track_instances
+from ._generate import (
+    HASH_SLOT,
+    cached_slot_name,
+    is_cached_slot,
+    is_hidden_slot,
+    is_special_slot,
+    make_cached_property,
+    make_clear,
+    make_copy,
+    make_defaults_new,
+    make_eq,
+    make_frozen,
+    make_hash,
+    make_init,
+    make_order,
+    make_reduce,
+    make_repr,
+    make_set_defaults,
+)
+from ._pool import SlottedPool, make_pool_new, original_new
+
+# Typing imports are only needed by type checkers, keep them out of import time.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import (
+        Any,
+        Dict,
+        FrozenSet,
+        Iterable,
+        List,
+        Mapping,
+        MutableMapping,
+        Optional,
+        Set,
+        Tuple,
+        Type,
+        TypeVar,
+        Union,
+    )
+
+    SM = TypeVar("SM", bound="SlottedMeta")
+
+__all__ = ["SlottedMeta", "Slotted", "SlotInfo", "slots", "slot_layout"]
+
+
+class SlotInfo(
+    collections.namedtuple("SlotInfo", ("name", "mangled_name", "owner", "descriptor"))
+):
+    """
+    Information about a single slot in a class layout.
+
+    :param name: Slot name, as declared in `__slots__`.
+    :param mangled_name: Slot name, mangled if private.
+    :param owner: Class that declared the slot.
+    :param descriptor: Descriptor stored in the owner class under the mangled name.
+    """
+
+    __slots__ = ()
+
+
+class _SlotLayout(object):
+    """Precomputed, immutable slot layout for a class."""
+
+    __slots__ = (
+        "infos",
+        "names",
+        "mangled_names",
+        "visible_names",
+        "visible_mangled_names",
+    )
+
+    def __init__(self, infos):
+        # type: (Tuple[SlotInfo, ...]) -> None
+        visible_infos = [i for i in infos if not is_hidden_slot(i.name)]
+        self.infos = infos
+        self.names = frozenset(i.name for i in infos)  # type: FrozenSet[str]
+        self.mangled_names = frozenset(
+            i.mangled_name for i in infos
+        )  # type: FrozenSet[str]
+        self.visible_names = frozenset(
+            i.name for i in visible_infos
+        )  # type: FrozenSet[str]
+        self.visible_mangled_names = frozenset(
+            i.mangled_name for i in visible_infos
+        )  # type: FrozenSet[str]
+
+
+def _mangle(name, owner_name):
+    # type: (str, str) -> str
+    if name.startswith("__") and not name.endswith("__"):
+        return "_{}{}".format(owner_name.lstrip("_"), name)
+    return name
+
+
+def _declared_slots(cls_or_dct):
+    # type: (Union[type, Mapping[str, Any]]) -> Tuple[str, ...]
+    dct = cls_or_dct.__dict__ if isinstance(cls_or_dct, type) else cls_or_dct
+    declared = dct.get("__slots__", ())
+    if isinstance(declared, six.string_types):
+        return (declared,)
+    return tuple(declared)
+
+
+def _unmangle(name, owner_name):
+    # type: (str, str) -> str
+    prefix = "_{}__".format(owner_name.lstrip("_"))
+    if name.startswith(prefix) and not name.endswith("__"):
+        return name[len(prefix) - 2 :]
+    return name
+
+
+def _get_annotations(dct):
+    # type: (Mapping[str, Any]) -> Mapping[str, Any]
+    """Get the annotations declared in a class body."""
+    annotations = dct.get("__annotations__")
+    if annotations is not None:
+        return annotations  # type: ignore
+
+    # Annotations are evaluated lazily since Python 3.14.
+    annotate = dct.get("__annotate__")
+    if annotate is None:
+        return {}
+    try:
+        import annotationlib  # type: ignore
+    except ImportError:  # pragma: no cover
+        return annotate(1)  # type: ignore
+    return annotationlib.call_annotate_function(  # type: ignore
+        annotate, annotationlib.Format.FORWARDREF
+    )
+
+
+def _is_class_var(annotation):
+    # type: (Any) -> bool
+    if isinstance(annotation, six.string_types):
+        name = annotation.split("[", 1)[0].strip()
+        return name == "ClassVar" or name.endswith(".ClassVar")
+    typing = sys.modules.get("typing")
+    if typing is None:
+        return False
+    class_var = getattr(typing, "ClassVar")
+    origin = getattr(annotation, "__origin__", None)
+    return annotation is class_var or origin is class_var
+
+
+def _prepare_namespace(
+    name,  # type: str
+    bases,  # type: Tuple[Type[Any], ...]
+    dct,  # type: Mapping[str, Any]
+):
+    # type: (...) -> Tuple[Dict[str, Any], Dict[str, Any]]
+    """
+    Derive `__slots__` from the annotations (skipping `ClassVar`) if not declared, and
+    move the class-level values of slots out of the namespace.
+
+    :return: Namespace and default values, keyed by slot name (mangled name for the
+        slots of the bases).
+    :raises ValueError: Default value is a list, dict or set, or a slot is also a
+        cached slot property.
+    """
+    dct = dict(dct)
+    annotations = _get_annotations(dct)
+    base_names = set()  # type: Set[str]
+    if annotations or "__slots__" not in dct:
+        for base in bases:
+            base_names.update(_get_layout(base).mangled_names)
+    if "__slots__" not in dct:
+        dct["__slots__"] = tuple(
+            _unmangle(n, name)
+            for n, a in six.iteritems(annotations)
+            if n not in base_names and not _is_class_var(a)
+        )
+
+    # Values of annotated slots of the bases would hide their descriptors.
+    slot_names = [(s, _mangle(s, name)) for s in _declared_slots(dct)]
+    slot_names.extend(
+        (n, n)
+        for n, a in six.iteritems(annotations)
+        if n in base_names and not _is_class_var(a)
+    )
+
+    defaults = {}  # type: Dict[str, Any]
+    for slot, mangled_name in slot_names:
+        if mangled_name in dct:
+            value = defaults[slot] = dct.pop(mangled_name)
+            if isinstance(value, cached_slot_property):
+                error = "{!r} in __slots__ conflicts with class variable".format(slot)
+                raise ValueError(error)
+
+            # Defaults are shared by all instances (like dataclasses, reject mutable).
+            if isinstance(value, (list, dict, set)):
+                error = "mutable default for slot {!r} of {!r} is not allowed".format(
+                    slot, name
+                )
+                raise ValueError(error)
+    return dct, defaults
+
+
+def _build_layout(cls):
+    # type: (type) -> _SlotLayout
+    infos = []  # type: List[SlotInfo]
+    indexes = {}  # type: Dict[str, int]
+    for base in reversed(cls.__mro__):
+        for name in _declared_slots(base):
+            mangled_name = _mangle(name, base.__name__)
+            info = SlotInfo(name, mangled_name, base, base.__dict__.get(mangled_name))
+
+            # Redeclared slots keep their position but point to the most derived.
+            if mangled_name in indexes:
+                infos[indexes[mangled_name]] = info
+            else:
+                indexes[mangled_name] = len(infos)
+                infos.append(info)
+    return _SlotLayout(tuple(infos))
+
+
+def _is_slotted(cls):
+    # type: (type) -> bool
+    """Whether a class does not add a `__dict__` to its instances."""
+    return "__dict__" not in cls.__dict__
+
+
+def _redundant_slots(cls):
+    # type: (type) -> Tuple[str, ...]
+    """Get the slots declared more than once in the MRO (each one wastes a pointer)."""
+    seen = set()  # type: Set[str]
+    redundant = []  # type: List[str]
+    for base in reversed(cls.__mro__):
+        for name in _declared_slots(base):
+            mangled_name = _mangle(name, base.__name__)
+            if mangled_name in seen and mangled_name not in redundant:
+                redundant.append(mangled_name)
+            seen.add(mangled_name)
+    return tuple(redundant)
+
+
+def _hidden_slots(cls):
+    # type: (type) -> Tuple[str, ...]
+    """Get the `__dict__`/`__weakref__` slots that no class in the MRO declares."""
+    declared = set()  # type: Set[str]
+    for base in cls.__mro__:
+        declared.update(_declared_slots(base))
+    hidden = []  # type: List[str]
+    if getattr(cls, "__dictoffset__", 0) and "__dict__" not in declared:
+        hidden.append("__dict__")
+    if getattr(cls, "__weakrefoffset__", 0) and "__weakref__" not in declared:
+        hidden.append("__weakref__")
+    return tuple(hidden)
+
+
+def _check_strict(name, bases, dct, strict):
+    # type: (str, Tuple[Type[Any], ...], Dict[str, Any], Any) -> Dict[str, Any]
+    """Validate the layout before creating a class, dropping redundant slots."""
+    for base in bases:
+        hidden = _hidden_slots(base)
+        if hidden:
+            error = "base {!r} has hidden {} slot(s)".format(
+                base.__name__, ", ".join(repr(h) for h in hidden)
+            )
+            raise TypeError(error)
+
+    base_names = set()  # type: Set[str]
+    for base in bases:
+        base_names.update(_get_layout(base).mangled_names)
+    slots = []  # type: List[str]
+    redundant = []  # type: List[str]
+    for slot in _declared_slots(dct):
+        mangled_name = _mangle(slot, name)
+        if mangled_name in base_names or slot in slots:
+            redundant.append(slot)
+        else:
+            slots.append(slot)
+    if redundant:
+        if strict != "drop":
+            error = "class {!r} redeclares slot(s) {}".format(
+                name, ", ".join(repr(r) for r in redundant)
+            )
+            raise TypeError(error)
+        dct = dict(dct)
+        dct["__slots__"] = tuple(slots)
+    return dct
+
+
+# Class keyword options that are inherited by subclasses.
+_INHERITED_OPTIONS = (
+    "reduce",
+    "copy",
+    "pool",
+    "frozen",
+    "eq",
+    "order",
+    "repr",
+    "track_instances",
+    "strict",
+)
+
+
+def _get_options(cls):
+    # type: (type) -> Dict[str, Any]
+    options = {}  # type: Dict[str, Any]
+    for base in reversed(cls.__mro__[1:]):
+        options.update(base.__dict__.get("__slotted_options__", {}))
+    return options
+
+
+def _install(cls, dct, methods, explicit):
+    # type: (type, Mapping[str, Any], Mapping[str, Any], bool) -> None
+    """Install generated methods, unless the class body already defines them."""
+    for method_name in methods:
+        if method_name in dct:
+            if explicit:
+                error = "class {!r} already defines {!r}".format(
+                    cls.__name__, method_name
+                )
+                raise TypeError(error)
+            return
+    for method_name, method in six.iteritems(methods):
+        type.__setattr__(cls, method_name, method)
+
+
+def _get_defaults(cls):
+    # type: (type) -> Mapping[str, Any]
+    defaults = {}  # type: Dict[str, Any]
+    for base in reversed(cls.__mro__):
+        defaults.update(base.__dict__.get("__slotted_defaults__", {}))
+    return defaults
+
+
+def _mangle_slot(cls, layout, name, usage):
+    # type: (type, _SlotLayout, str, str) -> str
+    mangled_name = _mangle(name, cls.__name__)
+    if mangled_name not in layout.mangled_names:
+        if name not in layout.mangled_names:
+            error = "{} {!r}, which is not a slot".format(usage, name)
+            raise TypeError(error)
+        mangled_name = name
+    return mangled_name
+
+
+def _merge_defaults(cls, layout, defaults):
+    # type: (type, _SlotLayout, Mapping[str, Any]) -> Dict[str, Any]
+    merged = dict(_get_defaults(cls))
+    for name, value in six.iteritems(defaults):
+        merged[_mangle_slot(cls, layout, name, "default for")] = value
+    return merged
+
+
+def _merge_exclude(cls, layout, exclude):
+    # type: (type, _SlotLayout, Iterable[str]) -> FrozenSet[str]
+    merged = set(_get_options(cls).get("exclude", ()))
+    for name in exclude:
+        merged.add(_mangle_slot(cls, layout, name, "excluding"))
+    return frozenset(merged)
+
+
+# Layouts for classes that were not created by `SlottedMeta`.
+_LAYOUT_CACHE = weakref.WeakKeyDictionary()  # type: MutableMapping[type, _SlotLayout]
 
 
 class SlottedMeta(type):
-    """Metaclass that enforces `__slots__`."""
+    """
+    Metaclass that enforces `__slots__`.
+
+    Classes that don't declare `__slots__` get one slot for each annotation in their
+    body (except `ClassVar` and the ones that are already slots in the bases).
+    Class-level values of slots are moved out of the class namespace and become
+    defaults, used by the generated `__init__` or set when instances are created.
+    Each :class:`cached_slot_property` gets a hidden slot to cache its value in.
+
+    Accepts the following class keyword arguments:
+
+    - `init`: Generate an `__init__` that takes the slots (including the ones from
+      the bases) as arguments, in layout order.
+    - `defaults`: Mapping of slot names to default values used by generated methods.
+      Defaults are inherited by subclasses.
+    - `reduce`: Generate `__reduce_ex__` and `__setstate__` methods that pickle the
+      slots as a tuple. Inherited by subclasses.
+    - `copy`: Generate `__copy__`, `__deepcopy__` and `replace(**changes)` methods
+      that copy the slots one by one. Inherited by subclasses.
+    - `pool`: Keep up to this many released instances (see :func:`release`) for reuse
+      by `__new__`. Inherited by subclasses, each with its own pool.
+    - `frozen`: Block setting and deleting attributes (generated methods set the slots
+      through their descriptors), and generate `__eq__`, `__ne__` and `__hash__`
+      methods that compare and hash the slot values. The hash is cached in a hidden
+      slot. Inherited by subclasses.
+    - `eq`: Generate `__eq__` and `__ne__` methods that compare the slot values (and
+      set `__hash__` to None, unless frozen). Inherited by subclasses.
+    - `order`: Generate `__lt__`, `__le__`, `__gt__` and `__ge__` methods that compare
+      the slot values in layout order. Inherited by subclasses.
+    - `repr`: Generate a `__repr__` method that shows the slot values. Inherited by
+      subclasses.
+    - `track_instances`: Count live, peak and created instances (see :func:`census`)
+      by wrapping `__new__` and `__del__`. Inherited by subclasses, each with its own
+      counters.
+    - `strict`: Raise :class:`TypeError` if a slot is declared again (already in the
+      bases or repeated), or if a base has a `__dict__` or `__weakref__` that is not
+      declared in `__slots__` (see :func:`layout_report`). With `"drop"`, redundant
+      slots are left out instead. Inherited by subclasses.
+    - `exclude`: Slot names to leave out of the methods generated by `frozen`, `eq`,
+      `order` and `repr`. Merged with the ones from the bases.
+    """
 
     @staticmethod
     def __new__(
@@ -18,25 +416,222 @@ class SlottedMeta(type):
         **kwargs  # type: Any
     ):
         # type: (...) -> SM
+        init = kwargs.pop("init", False)  # type: bool
+        defaults = kwargs.pop("defaults", None)  # type: Optional[Mapping[str, Any]]
+        exclude = kwargs.pop("exclude", ())  # type: Iterable[str]
+        options = dict(
+            (o, kwargs.pop(o)) for o in _INHERITED_OPTIONS if o in kwargs
+        )  # type: Dict[str, Any]
 
         # All bases are required to inherit from object and to have slots.
         for base in bases:
             if not issubclass(base, object):
                 error = "{!r} is not a subclass of object".format(base.__name__)
                 raise TypeError(error)
-            if "__dict__" in base.__dict__:
+            if not _is_slotted(base):
                 error = "base {!r} is not slotted".format(base.__name__)
                 raise TypeError(error)
 
-        # Force slots when constructing this class.
-        if "__slots__" not in dct:
+        # Frozen classes can't be unfrozen by subclasses.
+        frozen = any(
+            getattr(b, "__slotted_options__", {}).get("frozen") for b in bases
+        )  # type: bool
+        if "frozen" in options:
+            if frozen and not options["frozen"]:
+                error = "can't unfreeze frozen bases of {!r}".format(name)
+                raise TypeError(error)
+            frozen = options["frozen"]
+
+        # Force slots when constructing this class, class-level values are defaults.
+        dct, body_defaults = _prepare_namespace(name, bases, dct)
+        if body_defaults:
+            defaults = dict(body_defaults, **(defaults or {}))
+
+        # Validate the layout in strict mode.
+        strict = options.get(
+            "strict",
+            next(
+                (
+                    getattr(b, "__slotted_options__")["strict"]
+                    for b in bases
+                    if getattr(b, "__slotted_options__", {}).get("strict")
+                ),
+                False,
+            ),
+        )  # type: Any
+        if strict:
+            dct = _check_strict(name, bases, dct, strict)
+
+        # Add the hidden slots that back cached slot properties (unless inherited).
+        cached = dict(
+            (n, v) for n, v in six.iteritems(dct) if isinstance(v, cached_slot_property)
+        )  # type: Dict[str, cached_slot_property]
+        cached_slots = [
+            cached_slot_name(n)
+            for n in cached
+            if not any(cached_slot_name(n) in _get_layout(b).names for b in bases)
+        ]
+        if cached_slots:
+            dct = dict(dct)
+            dct["__slots__"] = _declared_slots(dct) + tuple(cached_slots)
+
+        # Add the slot that caches the hash of frozen instances.
+        if frozen and not any(HASH_SLOT in _get_layout(b).names for b in bases):
             dct = dict(dct)
-            dct["__slots__"] = ()
+            dct["__slots__"] = _declared_slots(dct) + (HASH_SLOT,)
+
+        cls = super(SlottedMeta, mcs).__new__(mcs, name, bases, dct, **kwargs)
+
+        # Precompute the slot layout once.
+        layout = _build_layout(cls)
+        type.__setattr__(cls, "__slotted_layout__", layout)
 
-        return super(SlottedMeta, mcs).__new__(mcs, name, bases, dct, **kwargs)
+        # Replace cached slot properties with properties that use their hidden slots.
+        for attrname, prop in six.iteritems(cached):
+            slot_name = cached_slot_name(attrname)
+            info = next(i for i in layout.infos if i.name == slot_name)
+            cached_property = make_cached_property(cls, attrname, prop.func, info)
+            type.__setattr__(cls, attrname, cached_property)
 
+        # Merge default values with the ones from the bases.
+        if defaults is not None:
+            type.__setattr__(
+                cls, "__slotted_defaults__", _merge_defaults(cls, layout, defaults)
+            )
 
-SM = TypeVar("SM", bound=SlottedMeta)
+        # Merge options with the ones from the bases.
+        merged_options = _get_options(cls)
+        merged_options.update(options)
+        merged_options["exclude"] = _merge_exclude(cls, layout, exclude)
+        type.__setattr__(cls, "__slotted_options__", merged_options)
+
+        # Generate methods.
+        infos = [i for i in layout.infos if not is_special_slot(i.name)]
+        cached_infos = [i for i in layout.infos if is_cached_slot(i.name)]
+        compared_infos = [
+            i for i in infos if i.mangled_name not in merged_options["exclude"]
+        ]
+        if frozen:
+            setattr_method, delattr_method, setstate_method = make_frozen(cls)
+            _install(
+                cls,
+                dct,
+                {"__setattr__": setattr_method, "__delattr__": delattr_method},
+                "frozen" in options,
+            )
+            if not merged_options.get("reduce"):
+                _install(cls, dct, {"__setstate__": setstate_method}, False)
+        if frozen or merged_options.get("eq"):
+            eq_method, ne_method = make_eq(cls, compared_infos)
+            if frozen:
+                hash_info = next(i for i in layout.infos if i.name == HASH_SLOT)
+                hash_method = make_hash(cls, compared_infos, hash_info)
+            else:
+                hash_method = None
+            eq_methods = {
+                "__eq__": eq_method,
+                "__ne__": ne_method,
+            }  # type: Dict[str, Any]
+            # Keep the hash defined by the class body (like dataclasses).
+            if "__hash__" not in dct:
+                eq_methods["__hash__"] = hash_method
+            _install(cls, dct, eq_methods, "frozen" in options or "eq" in options)
+        if merged_options.get("order"):
+            lt_method, le_method, gt_method, ge_method = make_order(cls, compared_infos)
+            _install(
+                cls,
+                dct,
+                {
+                    "__lt__": lt_method,
+                    "__le__": le_method,
+                    "__gt__": gt_method,
+                    "__ge__": ge_method,
+                },
+                "order" in options,
+            )
+        if merged_options.get("repr"):
+            _install(
+                cls,
+                dct,
+                {"__repr__": make_repr(cls, compared_infos)},
+                "repr" in options,
+            )
+        if init:
+            init_method = make_init(cls, infos, _get_defaults(cls))
+            _install(cls, dct, {"__init__": init_method}, True)
+        elif body_defaults:
+            # Set the defaults declared in the class body when creating instances.
+            default_values = cls.__dict__["__slotted_defaults__"]
+            body_names = set(_mangle(n, name) for n in body_defaults)
+            default_infos = [i for i in layout.infos if i.mangled_name in body_names]
+            # Skip the pool of the bases, it would allocate instances of the base.
+            new_method = make_defaults_new(
+                cls, default_infos, default_values, original_new(cls)
+            )
+            type.__setattr__(cls, "__new__", staticmethod(new_method))
+            type.__setattr__(
+                cls,
+                "__slotted_body_defaults__",
+                frozenset(i.mangled_name for i in default_infos),
+            )
+        if merged_options.get("track_instances"):
+            track_instances(cls)
+        if merged_options.get("pool"):
+            # Instances allocated by the pool are still tracked, reused ones are not.
+            if merged_options.get("track_instances"):
+                original = getattr(cls, "__new__")
+            else:
+                original = original_new(cls)
+            # Cached hashes and values are cleared with the slot values.
+            clear_infos = [
+                i
+                for i in layout.infos
+                if not is_special_slot(i.name) or is_hidden_slot(i.name)
+            ]
+            # Reused instances don't go through `__new__`, set the body defaults again.
+            default_names = set()  # type: Set[str]
+            for base in cls.__mro__:
+                default_names.update(base.__dict__.get("__slotted_body_defaults__", ()))
+            default_infos = [i for i in layout.infos if i.mangled_name in default_names]
+            if default_infos:
+                reset = make_set_defaults(cls, default_infos, _get_defaults(cls))
+            else:
+                reset = None
+            pool = SlottedPool(
+                cls,
+                merged_options["pool"],
+                original,
+                make_clear(cls, clear_infos),
+                reset,
+            )
+            type.__setattr__(cls, "__slotted_pool__", pool)
+            type.__setattr__(cls, "__slotted_release__", pool.release)
+            new_method = staticmethod(make_pool_new(cls, pool, original))
+            _install(cls, dct, {"__new__": new_method}, "pool" in options)
+        if merged_options.get("reduce"):
+            reduce_ex_method, setstate_method = make_reduce(cls, infos + cached_infos)
+            _install(
+                cls,
+                dct,
+                {"__reduce_ex__": reduce_ex_method, "__setstate__": setstate_method},
+                "reduce" in options,
+            )
+        if merged_options.get("copy"):
+            copy_method, deepcopy_method, replace_method = make_copy(
+                cls, infos, cached_infos
+            )
+            _install(
+                cls,
+                dct,
+                {
+                    "__copy__": copy_method,
+                    "__deepcopy__": deepcopy_method,
+                    "replace": replace_method,
+                },
+                "copy" in options,
+            )
+
+        return cls
 
 
 class Slotted(six.with_metaclass(SlottedMeta, object)):
@@ -45,26 +640,44 @@ class Slotted(six.with_metaclass(SlottedMeta, object)):
     __slots__ = ()
 
 
-def _mangle(name, owner_name):
-    # type: (str, str) -> str
-    if name.startswith("__") and not name.endswith("__"):
-        return "_{}{}".format(owner_name.lstrip("_"), name)
-    return name
+def _get_layout(cls):
+    # type: (type) -> _SlotLayout
+    layout = cls.__dict__.get("__slotted_layout__")  # type: Optional[_SlotLayout]
+    if layout is not None:
+        return layout
+    try:
+        return _LAYOUT_CACHE[cls]
+    except KeyError:
+        # Concurrent builds are equivalent, publish whichever one gets there first.
+        return _LAYOUT_CACHE.setdefault(cls, _build_layout(cls))
+
+
+def slot_layout(cls):
+    # type: (type) -> Tuple[SlotInfo, ...]
+    """
+    Get the ordered slot layout for a class.
+
+    Slots are ordered from the base-most class to the most derived one, following
+    their declaration order.
+
+    :param cls: Class.
+    :return: A tuple of :class:`SlotInfo`.
+    """
+    return _get_layout(cls).infos
 
 
-def slots(cls, mangled=False):
-    # type: (type, bool) -> Set[str]
+def slots(cls, mangled=False, hidden=False):
+    # type: (type, bool, bool) -> Set[str]
     """
     Get all slot names for a class.
 
     :param cls: Class.
     :param mangled: Whether to mangle the protected names.
-    :return: A set of slot names.
+    :param hidden: Whether to include the slots added internally (such as the one
+        that caches the hash of frozen instances).
+    :return: A new set of slot names.
     """
-    _slots = set()  # type: Set[str]
-    for base in inspect.getmro(cls):
-        _slots.update(
-            _mangle(s, base.__name__) if mangled else s
-            for s in getattr(base, "__slots__", ())
-        )
-    return _slots
+    layout = _get_layout(cls)
+    if hidden:
+        return set(layout.mangled_names if mangled else layout.names)
+    return set(layout.visible_mangled_names if mangled else layout.visible_names)
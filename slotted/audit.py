@@ -0,0 +1,320 @@
+"""
+Find classes whose instances carry a `__dict__` or a `__weakref__` in a package.
+
+Usage::
+
+    python -m slotted.audit mypackage [--json FILE]
+"""
+
+import argparse
+import collections
+import dis
+import importlib
+import inspect
+import json
+import pkgutil
+import sys
+
+import six
+
+from ._memory import _traced_size
+from ._slotted import _is_slotted
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from tippo import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+__all__ = ["AuditResult", "audit_class", "audit", "main"]
+
+
+class AuditResult(
+    collections.namedtuple(
+        "AuditResult",
+        (
+            "cls",
+            "has_dict",
+            "has_weakref",
+            "dict_bases",
+            "weakref_bases",
+            "attributes",
+            "waste",
+        ),
+    )
+):
+    """
+    Audit of a single class.
+
+    :param cls: Class.
+    :param has_dict: Whether instances have a `__dict__`.
+    :param has_weakref: Whether instances have a `__weakref__`.
+    :param dict_bases: Classes in the MRO that added the `__dict__` (not slotted).
+    :param weakref_bases: Classes in the MRO that added the `__weakref__`.
+    :param attributes: Attribute names assigned to `self` in the class methods.
+    :param waste: Estimated bytes wasted per instance, compared with a class that only
+        has slots for the attributes.
+    """
+
+    __slots__ = ()
+
+    def to_json(self):
+        # type: () -> Dict[str, Any]
+        """Get a JSON-serializable dictionary."""
+        return {
+            "class": _qualified_name(self.cls),
+            "dict": self.has_dict,
+            "weakref": self.has_weakref,
+            "dict_bases": [_qualified_name(b) for b in self.dict_bases],
+            "weakref_bases": [_qualified_name(b) for b in self.weakref_bases],
+            "attributes": list(self.attributes),
+            "waste": self.waste,
+        }
+
+
+def _qualified_name(cls):
+    # type: (type) -> str
+    return "{}.{}".format(cls.__module__, getattr(cls, "__qualname__", cls.__name__))
+
+
+def _assigned_attributes(cls):
+    # type: (type) -> Tuple[str, ...]
+    """Find attribute names assigned in the methods of the class and its bases."""
+    get_instructions = getattr(dis, "get_instructions", None)
+    if get_instructions is None:  # pragma: no cover
+        return ()
+    names = []  # type: List[str]
+    for base in reversed(cls.__mro__):
+        for member in six.itervalues(base.__dict__):
+            func = getattr(member, "__func__", member)
+            code = getattr(func, "__code__", None)
+            if code is None or not code.co_varnames:
+                continue
+            self_name = code.co_varnames[0]
+            loaded = None
+            for instruction in get_instructions(code):
+                if (
+                    instruction.opname == "STORE_ATTR"
+                    and loaded == self_name
+                    and instruction.argval not in names
+                ):
+                    names.append(instruction.argval)
+
+                # Combined instructions load multiple variables, 'self' comes last.
+                loaded = None
+                if instruction.opname.startswith("LOAD_FAST"):
+                    loaded = instruction.argval
+                    if isinstance(loaded, tuple):
+                        loaded = loaded[-1]
+    return tuple(names)
+
+
+# Estimated waste, keyed by (attribute count, has dict, has weakref).
+_WASTE_CACHE = {}  # type: Dict[Tuple[int, bool, bool], int]
+
+
+def _estimate_waste(attribute_count, has_dict, has_weakref):
+    # type: (int, bool, bool) -> int
+    key = (attribute_count, has_dict, has_weakref)
+    try:
+        return _WASTE_CACHE[key]
+    except KeyError:
+        pass
+
+    names = tuple("a{}".format(i) for i in six.moves.range(attribute_count))
+    extra = ()  # type: Tuple[str, ...]
+    if has_dict:
+        extra += ("__dict__",)
+    if has_weakref:
+        extra += ("__weakref__",)
+    slotted_cls = type("Slotted", (object,), {"__slots__": names})
+    audited_cls = type("Audited", (object,), {"__slots__": () if has_dict else names})
+    if extra:
+        audited_cls = type("Audited", (audited_cls,), {"__slots__": extra})
+
+    def factory(cls):
+        # type: (type) -> Callable[[], Any]
+        def make():
+            # type: () -> Any
+            obj = cls()
+            for name in names:
+                setattr(obj, name, None)
+            return obj
+
+        return make
+
+    waste = max(
+        _traced_size(factory(audited_cls)) - _traced_size(factory(slotted_cls)), 0
+    )
+    return _WASTE_CACHE.setdefault(key, waste)
+
+
+def audit_class(cls):
+    # type: (type) -> AuditResult
+    """
+    Audit a single class.
+
+    :param cls: Class.
+    :return: Audit result.
+    """
+    has_dict = bool(cls.__dictoffset__)
+    has_weakref = bool(cls.__weakrefoffset__)
+    dict_bases = tuple(b for b in cls.__mro__ if not _is_slotted(b))
+    weakref_bases = tuple(b for b in cls.__mro__ if "__weakref__" in b.__dict__)
+    attributes = _assigned_attributes(cls) if has_dict or has_weakref else ()
+    if has_dict or has_weakref:
+        waste = _estimate_waste(len(attributes), has_dict, has_weakref)
+    else:
+        waste = 0
+    return AuditResult(
+        cls=cls,
+        has_dict=has_dict,
+        has_weakref=has_weakref,
+        dict_bases=dict_bases,
+        weakref_bases=weakref_bases,
+        attributes=attributes,
+        waste=waste,
+    )
+
+
+def _iter_classes(namespace, module_name, seen):
+    # type: (Any, str, Set[type]) -> Any
+    for _, value in sorted(six.iteritems(vars(namespace)), key=lambda i: i[0]):
+        if (
+            inspect.isclass(value)
+            and value.__module__ == module_name
+            and value not in seen
+        ):
+            seen.add(value)
+            yield value
+            for nested in _iter_classes(value, module_name, seen):
+                yield nested
+
+
+def _import_modules(package, errors):
+    # type: (Any, Dict[str, str]) -> List[Any]
+    modules = [package]
+    path = getattr(package, "__path__", None)
+    if path is None:
+        return modules
+
+    def onerror(name):
+        # type: (str) -> None
+        errors[name] = repr(sys.exc_info()[1])
+
+    for module_info in pkgutil.walk_packages(
+        path, package.__name__ + ".", onerror=onerror
+    ):
+        name = module_info[1]
+        try:
+            modules.append(importlib.import_module(name))
+        except Exception as e:
+            errors[name] = repr(e)
+    return modules
+
+
+def audit(package, errors=None):
+    # type: (Union[str, Any], Optional[Dict[str, str]]) -> List[AuditResult]
+    """
+    Import a package (and all of its modules) and audit the classes defined in it.
+
+    :param package: Package (or module) or its name.
+    :param errors: Dictionary that receives the modules that failed to import.
+    :return: Results for the classes whose instances carry a `__dict__` or a
+        `__weakref__`.
+    """
+    if isinstance(package, six.string_types):
+        package = importlib.import_module(package)
+    if errors is None:
+        errors = {}
+
+    results = []  # type: List[AuditResult]
+    seen = set()  # type: Set[type]
+    for module in _import_modules(package, errors):
+        for cls in _iter_classes(module, module.__name__, seen):
+            result = audit_class(cls)
+            if result.has_dict or result.has_weakref:
+                results.append(result)
+    return results
+
+
+def _summary(results, errors):
+    # type: (List[AuditResult], Dict[str, str]) -> str
+    lines = []  # type: List[str]
+    for result in results:
+        carried = [
+            n
+            for n, f in (
+                ("__dict__", result.has_dict),
+                ("__weakref__", result.has_weakref),
+            )
+            if f
+        ]
+        bases = ", ".join(_qualified_name(b) for b in result.dict_bases)
+        lines.append(
+            "{}: {}{} (~{} bytes per instance)".format(
+                _qualified_name(result.cls),
+                ", ".join(carried),
+                " from {}".format(bases) if bases else "",
+                result.waste,
+            )
+        )
+    for name, error in sorted(errors.items()):
+        lines.append("{}: failed to import ({})".format(name, error))
+    lines.append(
+        "{} class(es) not fully slotted, {} module(s) failed to import".format(
+            len(results), len(errors)
+        )
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    # type: (Optional[List[str]]) -> int
+    """
+    Command-line entry point.
+
+    :param argv: Arguments (defaults to `sys.argv[1:]`).
+    :return: Exit code (1 with `--check` if anything was found, 0 otherwise).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m slotted.audit",
+        description="Find classes whose instances carry '__dict__' or '__weakref__'.",
+    )
+    parser.add_argument("packages", nargs="+", help="packages to audit")
+    parser.add_argument(
+        "--json",
+        metavar="FILE",
+        help="write JSON results to this file ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with code 1 if any class is not fully slotted or fails to import",
+    )
+    args = parser.parse_args(argv)
+
+    results = []  # type: List[AuditResult]
+    errors = {}  # type: Dict[str, str]
+    for package in args.packages:
+        results.extend(audit(package, errors))
+
+    if args.json is not None:
+        data = {
+            "results": [r.to_json() for r in results],
+            "errors": errors,
+        }
+        if args.json == "-":
+            json.dump(data, sys.stdout, indent=2, sort_keys=True)
+            sys.stdout.write("\n")
+        else:
+            with open(args.json, "w") as fp:
+                json.dump(data, fp, indent=2, sort_keys=True)
+
+    summary_stream = sys.stderr if args.json == "-" else sys.stdout
+    summary_stream.write(_summary(results, errors) + "\n")
+    if args.check and (results or errors):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@
 
 from invoke import task
 
-PATHS = "slotted setup.py tasks.py docs/source/conf.py tests"
+PATHS = "slotted setup.py tasks.py docs/source/conf.py tests benchmarks"
 
 
 @task
@@ -36,6 +36,11 @@ def tests(c):
     c.run("python -m pytest --doctest-modules -vv -rs README.rst")
 
 
+@task
+def benchmarks(c):
+    c.run("python -m benchmarks")
+
+
 @task
 def docs(c):
     c.run("sphinx-build -M html ./docs/source ./docs/build")
@@ -1,8 +1,16 @@
 # type: ignore
 
-from abc import ABCMeta
+import gc
+import io
+import numbers
+import subprocess
+import sys
+import threading
+import weakref
+from abc import ABCMeta, abstractmethod
 
 import pytest
+import six
 import tippo
 from six.moves import collections_abc
 
@@ -25,8 +33,41 @@ def test_import_abc():
         assert getattr(slotted, name)
 
 
+def test_lazy_import():
+    code = "\n".join(
+        (
+            "import sys",
+            "import slotted",
+            "assert 'slotted._abc' not in sys.modules",
+            "assert slotted.Slotted",
+            "assert 'slotted._abc' not in sys.modules",
+            "assert slotted.SlottedMapping",
+            "assert 'slotted._abc' in sys.modules",
+        )
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+def test_lazy_identity():
+    assert slotted.SlottedMapping is slotted_abc.SlottedMapping
+    assert slotted.SlottedSequence is slotted_abc.SlottedSequence
+    assert isinstance({}, collections_abc.Mapping)
+    assert not isinstance({}, slotted.SlottedMapping)
+    assert issubclass(slotted.SlottedMapping, collections_abc.Mapping)
+    if sys.version_info[:2] >= (3, 9):  # converted bases differ on older versions
+        assert issubclass(slotted.SlottedSequence, slotted.SlottedReversible)
+    with pytest.raises(AttributeError):
+        getattr(slotted, "SlottedNothing")
+    with pytest.raises(AttributeError):
+        getattr(slotted_abc, "SlottedNothing")
+
+
 def test_converted():
-    not_converted = {"SlottedABCMeta", "SlottedABC"}
+    not_converted = {
+        "SlottedABCMeta",
+        "SlottedABC",
+        "convert",
+    }
 
     for name in set(slotted_abc_all).difference(not_converted):
         assert name.startswith("Slotted")
@@ -97,5 +138,131 @@ def test_inheritance():
     assert BarGeneric
 
 
+def test_convert():
+    SlottedIntegral = slotted.convert(numbers.Integral)
+    assert slotted.convert(numbers.Integral) is SlottedIntegral
+    assert isinstance(SlottedIntegral, slotted.SlottedABCMeta)
+    assert issubclass(SlottedIntegral, numbers.Integral)
+    assert issubclass(SlottedIntegral, slotted.convert(numbers.Number))
+
+    class Integer(SlottedIntegral):
+        __slots__ = ("value",)
+
+    assert issubclass(Integer, numbers.Number)
+    assert "__dict__" not in dir(Integer)
+
+    # Public classes are returned as they are.
+    assert slotted.convert(collections_abc.Mapping) is slotted.SlottedMapping
+    assert slotted.convert(slotted.SlottedMapping) is slotted.SlottedMapping
+
+
+def test_convert_errors():
+    with pytest.raises(TypeError):
+        slotted.convert(int)
+
+    # 'io.IOBase' has a base that adds a '__dict__'.
+    with pytest.raises(TypeError):
+        slotted.convert(io.IOBase)
+
+
+def test_convert_weak():
+    class Base(six.with_metaclass(ABCMeta, object)):
+        __slots__ = ()
+
+        @abstractmethod
+        def foo(self):
+            raise NotImplementedError()
+
+    converted_ref = weakref.ref(slotted.convert(Base))
+    gc.collect()
+    assert converted_ref() is None
+
+    converted = slotted.convert(Base)
+    assert slotted.convert(Base) is converted
+    assert issubclass(converted, Base)
+    with pytest.raises(TypeError):
+        converted()
+
+    base_ref = weakref.ref(Base)
+    converted_ref = weakref.ref(converted)
+    del Base, converted
+    gc.collect()
+    assert base_ref() is None
+    assert converted_ref() is None
+
+
+def test_convert_no_slots():
+    class Base(six.with_metaclass(ABCMeta, object)):
+        pass
+
+    Base.__annotations__ = {"value": int}
+
+    converted = slotted.convert(Base)
+    assert converted.__slots__ == ()
+    assert converted.__annotations__ == {"value": int}
+    assert "__weakref__" not in converted.__dict__
+
+    obj = converted()
+    with pytest.raises(AttributeError):
+        obj.__weakref__
+
+    class Weak(converted):
+        __slots__ = ("__weakref__",)
+
+    weak = Weak()
+    ref = weakref.ref(weak)
+    assert ref() is weak
+    assert weak.__weakref__ is ref
+
+
+def test_convert_threads():
+    class Base(six.with_metaclass(ABCMeta, object)):
+        __slots__ = ()
+
+    class Sub(Base):
+        __slots__ = ()
+
+    results = []
+    barrier = threading.Barrier(8) if hasattr(threading, "Barrier") else None
+
+    def target():
+        if barrier is not None:
+            barrier.wait()
+        results.append(slotted.convert(Sub))
+
+    threads = [threading.Thread(target=target) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert len(set(results)) == 1
+    assert results[0].__bases__ == (slotted.convert(Base),)
+
+
+def test_threaded_class_creation():
+    class Base(slotted.SlottedABC):
+        pass
+
+    errors = []
+
+    def create():
+        try:
+            for _ in range(50):
+                cls = slotted.SlottedABCMeta("Class", (Base,), {})
+                Base.register(type("Virtual", (object,), {}))
+                assert issubclass(cls, Base)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
 if __name__ == "__main__":
     pytest.main()
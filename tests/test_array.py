@@ -0,0 +1,97 @@
+# type: ignore
+
+import pytest
+
+import slotted
+
+
+class Point(slotted.Slotted, init=True):
+    __slots__ = ("x", "y", "visible", "__label")
+    x: int
+    y: float
+    visible: bool
+
+    def total(self):
+        return self.x + self.y
+
+
+def test_array():
+    points = slotted.SlottedArray(Point, capacity=2)
+    points.extend(Point(i, i * 0.5, i % 2 == 0, str(i)) for i in range(5))
+    assert len(points) == 5
+    assert points.cls is Point
+
+    view = points[1]
+    assert isinstance(view, Point)
+    assert (view.x, view.y, view.visible, view._Point__label) == (1, 0.5, False, "1")
+    assert view.total() == 1.5
+    assert points[-1].x == 4
+    with pytest.raises(IndexError):
+        points[5]
+
+    view.x = 10
+    assert points.column("x").tolist() == [0, 10, 2, 3, 4]
+    assert points.column("visible").tolist() == [1, 0, 1, 0, 1]
+    assert points.column("label") == ["0", "1", "2", "3", "4"]
+    assert [v.y for v in points] == [0.0, 0.5, 1.0, 1.5, 2.0]
+
+    obj = points.materialize(1)
+    assert type(obj) is Point
+    assert (obj.x, obj.y, obj.visible, obj._Point__label) == (10, 0.5, False, "1")
+
+
+def test_array_column_view():
+    points = slotted.SlottedArray(Point, capacity=1)
+    points.append(Point(0, 0.0, True, "0"))
+
+    # Columns can't grow while a view of one of them is held.
+    with points.column("y") as ys:
+        with pytest.raises(BufferError):
+            points.append(Point(1, 0.5, False, "1"))
+        assert ys.tolist() == [0.0]
+    assert len(points) == 1
+
+    points.extend(Point(i, i * 0.5, False, str(i)) for i in range(1, 4))
+    assert len(points) == 4
+    assert points.column("x").tolist() == [0, 1, 2, 3]
+    assert points.column("y").tolist() == [0.0, 0.5, 1.0, 1.5]
+    assert points.column("label") == ["0", "1", "2", "3"]
+
+
+def test_array_unset():
+    points = slotted.SlottedArray(Point)
+    point = Point(1, 2.0, True, "label")
+    del point._Point__label
+    points.append(point)
+    assert not hasattr(points[0], "_Point__label")
+    assert not hasattr(points.materialize(0), "_Point__label")
+
+    del point.x
+    with pytest.raises(TypeError):
+        points.append(point)
+
+
+class Frozen(slotted.Slotted, frozen=True, init=True, track_instances=True):
+    __slots__ = ("x", "y")
+    x: int
+
+
+def test_array_frozen_views():
+    points = slotted.SlottedArray(Frozen)
+    points.extend((Frozen(1, "a"), Frozen(2, "b")))
+    assert hash(points[0]) == hash(points[0])
+    assert points[0] == points[0]
+    assert points[0] != points[1]
+    with pytest.raises(AttributeError):
+        points[0].x = 3
+    assert points.materialize(0) == Frozen(1, "a")
+    assert hash(points.materialize(1)) == hash(Frozen(2, "b"))
+
+    del points
+    (entry,) = [e for e in slotted.census() if e.cls is Frozen]
+    assert entry.live == 0
+    assert not [e for e in slotted.census() if e.cls.__name__ == "FrozenView"]
+
+
+if __name__ == "__main__":
+    pytest.main()
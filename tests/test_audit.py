@@ -0,0 +1,101 @@
+# type: ignore
+
+import json
+import sys
+import textwrap
+
+import pytest
+
+import slotted
+from slotted.audit import audit, audit_class, main
+
+PACKAGE = textwrap.dedent("""
+    import slotted
+
+
+    class Base(object):
+        def __init__(self):
+            self.a = 1
+            self.b = 2
+
+
+    class Child(Base):
+        __slots__ = ("c",)
+
+
+    class Fine(slotted.Slotted):
+        __slots__ = ("x",)
+
+
+    class Weak(slotted.Slotted):
+        __slots__ = ("x", "__weakref__")
+    """)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    root = tmp_path / "audited"
+    root.mkdir()
+    (root / "__init__.py").write_text(PACKAGE)
+    (root / "broken.py").write_text("raise ImportError('broken')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "audited"
+    for name in list(sys.modules):
+        if name == "audited" or name.startswith("audited."):
+            del sys.modules[name]
+
+
+def test_audit_class():
+    class Point(slotted.Slotted):
+        __slots__ = ("x", "y")
+
+    result = audit_class(Point)
+    assert not result.has_dict
+    assert not result.has_weakref
+    assert result.waste == 0
+
+
+def test_audit(package):
+    errors = {}
+    results = dict((r.cls.__name__, r) for r in audit(package, errors))
+    assert set(results) == {"Base", "Child", "Weak"}
+    assert list(errors) == ["audited.broken"]
+
+    child = results["Child"]
+    assert child.has_dict
+    assert child.dict_bases == (results["Base"].cls,)
+    assert child.attributes == ("a", "b")
+    assert child.waste > results["Weak"].waste > 0
+
+    weak = results["Weak"]
+    assert not weak.has_dict
+    assert weak.has_weakref
+    assert weak.dict_bases == ()
+    assert weak.weakref_bases == (weak.cls,)
+
+
+def test_main(package, tmp_path, capsys):
+    output = tmp_path / "audit.json"
+    assert main([package, "--json", str(output)]) == 0
+    data = json.loads(output.read_text())
+    assert [r["class"] for r in data["results"]] == [
+        "audited.Base",
+        "audited.Child",
+        "audited.Weak",
+    ]
+    assert data["results"][1]["dict_bases"] == ["audited.Base"]
+    assert "audited.broken" in data["errors"]
+
+    summary = capsys.readouterr().out
+    assert "audited.Child: __dict__, __weakref__ from audited.Base" in summary
+    assert "3 class(es) not fully slotted, 1 module(s) failed to import" in summary
+
+
+def test_main_check(package, capsys):
+    assert main([package]) == 0
+    assert main([package, "--check"]) == 1
+    assert main(["slotted._rows", "--check"]) == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,100 @@
+# type: ignore
+
+import gc
+import pickle
+import weakref
+
+import pytest
+
+import slotted
+from slotted import _factory  # noqa
+
+
+def test_make_class():
+    Row = slotted.make_class("Row", ("a", "b"), init=True, defaults={"b": 0})
+    assert isinstance(Row, slotted.SlottedMeta)
+    assert issubclass(Row, slotted.Slotted)
+    assert Row.__module__ == __name__
+    assert [i.name for i in slotted.slot_layout(Row)] == ["a", "b"]
+
+    row = Row(1)
+    assert (row.a, row.b) == (1, 0)
+    with pytest.raises(AttributeError):
+        row.c = 3
+
+    assert slotted.make_class("Row", ["a", "b"], init=True, defaults={"b": 0}) is Row
+    assert slotted.make_class("Row", ("a", "b"), init=True) is not Row
+    assert slotted.make_class("Row", ("a", "b", "c"), init=True) is not Row
+
+
+def test_make_class_bases():
+    class Base(slotted.Slotted, init=True):
+        __slots__ = ("x",)
+
+    Row = slotted.make_class("Row", ("y",), (Base,), init=True)
+    assert Row.__bases__ == (Base,)
+    row = Row(1, 2)
+    assert (row.x, row.y) == (1, 2)
+
+    class Plain(object):
+        __slots__ = ()
+
+    assert slotted.make_class("Row", (), (Plain,)).__bases__ == (Plain, slotted.Slotted)
+
+    class NotSlotted(object):
+        pass
+
+    with pytest.raises(TypeError):
+        slotted.make_class("Row", (), (NotSlotted,))
+
+
+Point = slotted.make_class("Point", ("x", "y"), init=True, reduce=True)
+
+
+def test_make_class_pickle():
+    point = pickle.loads(pickle.dumps(Point(1, 2)))
+    assert (point.x, point.y) == (1, 2)
+
+
+def test_make_class_cache():
+    def factory():
+        return slotted.make_class("Temporary", ("a",))
+
+    for i in range(_factory._CLASS_CACHE_SIZE):
+        slotted.make_class("Filler", ("a{}".format(i),))
+    assert len(_factory._CLASS_LRU) == _factory._CLASS_CACHE_SIZE
+
+    ref = weakref.ref(factory())
+    assert factory() is ref()
+    slotted.as_dicts(slotted.from_rows(factory(), [(1,)]))
+
+    # Evicted from the most recently used classes, then collected.
+    for i in range(_factory._CLASS_CACHE_SIZE):
+        slotted.make_class("Filler", ("a{}".format(i),))
+    gc.collect()
+    assert ref() is None
+    assert factory() is not None
+
+
+def test_make_class_cache_types():
+    Row = slotted.make_class("Row", ("a",), init=True, defaults={"a": False})
+    Other = slotted.make_class("Row", ("a",), init=True, defaults={"a": 0})
+    assert Other is not Row
+    assert Row().a is False
+    assert type(Other().a) is int
+
+    Row = slotted.make_class("Row", ("a",), init=True, defaults={"a": (True,)})
+    Other = slotted.make_class("Row", ("a",), init=True, defaults={"a": (1.0,)})
+    assert Other is not Row
+    assert type(Other().a[0]) is float
+
+
+def test_make_class_unhashable():
+    defaults = {"a": bytearray()}
+    Row = slotted.make_class("Row", ("a",), init=True, defaults=defaults)
+    assert Row().a is defaults["a"]
+    assert slotted.make_class("Row", ("a",), init=True, defaults=defaults) is not Row
+
+
+if __name__ == "__main__":
+    pytest.main()
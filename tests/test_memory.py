@@ -0,0 +1,90 @@
+# type: ignore
+
+import pytest
+
+import slotted
+
+
+class Point(slotted.Slotted):
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Point3D(Point):
+    __slots__ = ("z", "__w")
+
+
+def test_memory_report_class():
+    report = slotted.memory_report(Point3D)
+    assert report.cls is Point3D
+    assert report.basicsize == Point3D.__basicsize__
+    assert report.slot_counts == ((Point, 2), (Point3D, 2))
+    assert report.instance_size > 0
+    assert report.dict_instance_size > report.instance_size
+    assert report.saved_per_instance == (
+        report.dict_instance_size - report.instance_size
+    )
+    assert report.instance_count == 0
+    assert report.estimated_total_size == 0
+    assert report.estimate(10) == report.instance_size * 10
+
+
+def test_memory_report_instances():
+    report = slotted.memory_report(Point(i, i) for i in range(10))
+    assert report.cls is Point
+    assert report.instance_count == 10
+    assert report.estimated_total_size == report.instance_size * 10
+
+
+def test_memory_report_builtin_base():
+    class Pair(tuple, slotted.Slotted):
+        __slots__ = ()
+
+    report = slotted.memory_report(Pair)
+    assert report.instance_size > 0
+
+
+def test_memory_report_census():
+    class Tracked(slotted.Slotted, track_instances=True):
+        __slots__ = ("x",)
+
+    slotted.memory_report(Tracked)
+    (entry,) = [e for e in slotted.census() if e.cls is Tracked]
+    assert entry.live == 0
+    assert entry.created > 0
+
+
+def test_memory_report_mixed_instances():
+    with pytest.raises(TypeError):
+        slotted.memory_report([Point(1, 2), 3])
+
+
+def test_layout_report():
+    class Redeclared(Point):
+        __slots__ = ("x", "z")
+
+    report = slotted.layout_report(Point3D)
+    assert report.cls is Point3D
+    assert report.basicsize == Point3D.__basicsize__
+    assert report.base_basicsize == Point.__basicsize__
+    assert report.added_size == Point3D.__basicsize__ - Point.__basicsize__ > 0
+    assert report.dict_offset == report.weakref_offset == 0
+    assert report.redundant_slots == report.hidden_slots == ()
+
+    report = slotted.layout_report(Redeclared)
+    assert report.added_size == slotted.layout_report(Point3D).added_size
+    assert report.redundant_slots == ("x",)
+
+    class HiddenWeakref(set, slotted.Slotted):
+        __slots__ = ()
+
+    report = slotted.layout_report(HiddenWeakref)
+    assert report.weakref_offset > 0
+    assert report.hidden_slots == ("__weakref__",)
+
+
+if __name__ == "__main__":
+    pytest.main()
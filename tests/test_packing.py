@@ -0,0 +1,98 @@
+# type: ignore
+
+import pytest
+
+import slotted
+
+
+class Record(slotted.Slotted, init=True, eq=True):
+    __slots__ = ("id", "value", "__valid")
+    id: int
+    value: float
+    __valid: bool
+
+
+class Untyped(slotted.Slotted):
+    __slots__ = ("id", "name")
+    id: int
+
+
+def test_struct():
+    records = slotted.SlottedStruct(Record)
+    assert records.cls is Record
+    assert records.format == "<qd?"
+    assert records.size == 17
+
+    record = Record(1, 0.5, True)
+    data = records.pack(record)
+    assert len(data) == records.size
+    assert records.unpack(data) == record
+
+    buffer = records.pack_many(Record(i, i * 0.5, i % 2 == 0) for i in range(4))
+    assert records.count(buffer) == 4
+    decoded = records.unpack_many(memoryview(buffer))
+    assert all(type(r) is Record for r in decoded)
+    assert decoded == [Record(i, i * 0.5, i % 2 == 0) for i in range(4)]
+    assert records.unpack(buffer, -1) == Record(3, 1.5, False)
+    with pytest.raises(IndexError):
+        records.unpack(buffer, 4)
+    with pytest.raises(ValueError):
+        records.unpack_many(buffer[:-1])
+
+
+def test_struct_views():
+    records = slotted.SlottedStruct(Record)
+    buffer = records.pack_many([Record(1, 0.5, True), Record(2, 1.5, False)])
+
+    view = records.view(memoryview(buffer), 1)
+    assert isinstance(view, Record)
+    assert (view.id, view.value, view._Record__valid) == (2, 1.5, False)
+    with pytest.raises(AttributeError):
+        view.id = 3
+
+    # Views read the buffer on access.
+    buffer[: records.size] = records.pack(Record(3, 2.5, True))
+    assert [v.id for v in records.views(buffer)] == [3, 2]
+
+
+class Frozen(
+    slotted.Slotted, frozen=True, init=True, eq=True, repr=True, track_instances=True
+):
+    __slots__ = ("x", "y")
+    x: int
+    y: float
+
+
+def test_struct_frozen_views():
+    records = slotted.SlottedStruct(Frozen)
+    buffer = records.pack_many([Frozen(1, 0.5), Frozen(2, 1.5)])
+    view, other = records.views(buffer)
+    assert view == records.view(buffer, 0)
+    assert hash(view) == hash(records.view(buffer, 0))
+    assert view != other
+    assert records.unpack(buffer, 0) == Frozen(1, 0.5)
+    assert repr(records.view(buffer, 1)) == "FrozenView(x=2, y=1.5)"
+    with pytest.raises(AttributeError):
+        view.x = 3
+
+    del view, other
+    (entry,) = [e for e in slotted.census() if e.cls is Frozen]
+    assert entry.live == 0
+    assert not [e for e in slotted.census() if e.cls.__name__ == "FrozenView"]
+
+
+def test_struct_chunks():
+    records = slotted.SlottedStruct(Record)
+    batch = [Record(i, i * 0.5, i % 3 == 0) for i in range(1000)]
+    buffer = records.pack_many(batch)
+    assert bytes(buffer) == b"".join(records.pack(r) for r in batch)
+    assert records.unpack_many(buffer) == batch
+
+
+def test_struct_untyped():
+    with pytest.raises(TypeError):
+        slotted.SlottedStruct(Untyped)
+
+
+if __name__ == "__main__":
+    pytest.main()
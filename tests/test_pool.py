@@ -0,0 +1,146 @@
+# type: ignore
+
+import threading
+
+import pytest
+
+import slotted
+
+
+class Message(slotted.Slotted, init=True, pool=2):
+    __slots__ = ("topic", "payload")
+
+
+class SubMessage(Message):
+    __slots__ = ("extra",)
+
+
+def test_pool():
+    pool = slotted.get_pool(Message)
+    pool.clear()
+    assert pool.size == 2
+    assert pool.cls is Message
+
+    message = Message("topic", "payload")
+    assert (pool.hits, pool.misses) == (0, 1)
+    slotted.release(message)
+    assert len(pool) == 1
+    assert not hasattr(message, "topic")
+
+    reused = Message("other", "payload")
+    assert reused is message
+    assert reused.topic == "other"
+    assert (pool.hits, pool.misses) == (1, 1)
+
+
+def test_pool_bounded():
+    pool = slotted.get_pool(Message)
+    pool.clear()
+    for message in [Message(i, i) for i in range(5)]:
+        slotted.release(message)
+    assert len(pool) == 2
+
+
+def test_pool_double_release():
+    pool = slotted.get_pool(Message)
+    pool.clear()
+    message = Message("topic", "payload")
+    slotted.release(message)
+    with pytest.raises(ValueError):
+        slotted.release(message)
+    assert len(pool) == 1
+    assert Message("topic", "payload") is message
+    assert Message("topic", "payload") is not message
+
+
+class Point(slotted.Slotted, pool=2):
+    x: int = 0
+    y: int = 0
+
+    def __init__(self, x):
+        self.x = x
+
+
+class Point3D(Point, pool=2):
+    z: int = 0
+
+
+def test_pool_defaults():
+    point = Point(1)
+    slotted.release(point)
+    reused = Point(2)
+    assert reused is point
+    assert (reused.x, reused.y) == (2, 0)
+
+    point = Point3D(1)
+    point.y = point.z = 3
+    slotted.release(point)
+    reused = Point3D(2)
+    assert reused is point
+    assert (reused.x, reused.y, reused.z) == (2, 0, 0)
+
+
+class FrozenMessage(slotted.Slotted, init=True, frozen=True, pool=2):
+    __slots__ = ("topic", "payload")
+
+
+def test_pool_frozen():
+    # The cached hash slot is unset, clearing it doesn't fail.
+    message = FrozenMessage("topic", "payload")
+    slotted.release(message)
+    reused = FrozenMessage("other", "payload")
+    assert reused is message
+    assert reused.topic == "other"
+    hash(reused)
+    slotted.release(reused)
+    assert FrozenMessage("third", "payload") is message
+    assert hash(message) == hash(FrozenMessage("third", "payload"))
+
+
+def test_pooled():
+    pool = slotted.get_pool(Message)
+    pool.clear()
+    with slotted.pooled(Message, "topic", "payload") as message:
+        assert message.topic == "topic"
+    assert len(pool) == 1
+    assert Message("topic", "payload") is message
+
+
+def test_pool_subclass():
+    assert slotted.get_pool(SubMessage) is not slotted.get_pool(Message)
+    message = SubMessage("topic", "payload")
+    assert type(message) is SubMessage
+    with pytest.raises(TypeError):
+        slotted.get_pool(Message).release(message)
+    slotted.release(message)
+    assert SubMessage("topic", "payload") is message
+
+
+def test_no_pool():
+    with pytest.raises(TypeError):
+        slotted.release(slotted.Slotted())
+
+
+def test_pool_threads():
+    pool = slotted.get_pool(Message)
+    pool.clear()
+    errors = []
+
+    def worker():
+        for i in range(1000):
+            message = Message(threading.current_thread(), i)
+            if message.topic is not threading.current_thread() or message.payload != i:
+                errors.append(message)
+            slotted.release(message)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert pool.hits + pool.misses == 4000
+
+
+if __name__ == "__main__":
+    pytest.main()
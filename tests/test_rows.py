@@ -0,0 +1,140 @@
+# type: ignore
+
+import gc
+import weakref
+
+import pytest
+
+import slotted
+
+
+class Point(slotted.Slotted, init=True):
+    __slots__ = ("x", "y", "__z")
+
+
+class Frozen(slotted.Slotted, init=True, frozen=True):
+    __slots__ = ("x", "y")
+
+
+class Tracked(slotted.Slotted, track_instances=True):
+    __slots__ = ("x",)
+
+
+def test_from_rows():
+    points = slotted.from_rows(Point, [(1, 2, 3), (4, 5, 6)])
+    assert [(p.x, p.y, p._Point__z) for p in points] == [(1, 2, 3), (4, 5, 6)]
+    assert all(type(p) is Point for p in points)
+    assert slotted.from_rows(Point, []) == []
+
+
+def test_from_rows_fields():
+    rows = (r for r in [(1, 2), (3, 4)])
+    points = slotted.from_rows(Point, rows, fields=("y", "z"))
+    assert [(p.y, p._Point__z) for p in points] == [(1, 2), (3, 4)]
+    assert not hasattr(points[0], "x")
+
+    with pytest.raises(TypeError):
+        slotted.from_rows(Point, [(1,)], fields=("w",))
+    with pytest.raises(ValueError):
+        slotted.from_rows(Point, [(1, 2)])
+
+
+def test_from_rows_frozen():
+    frozen = slotted.from_rows(Frozen, [(1, 2)])[0]
+    assert frozen == Frozen(1, 2)
+    assert hash(frozen) == hash(Frozen(1, 2))
+
+
+def test_from_rows_new():
+    slotted.from_rows(Tracked, [(1,), (2,)])
+    entry = next(e for e in slotted.census() if e.cls is Tracked)
+    assert entry.created == 2
+
+
+def test_from_rows_collect():
+    class Temporary(slotted.Slotted):
+        __slots__ = ("x",)
+
+    assert slotted.from_rows(Temporary, [(1,)])[0].x == 1
+    ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert ref() is None
+
+
+class Line(slotted.Slotted, init=True):
+    __slots__ = ("start", "end", "points")
+
+
+def test_as_tuple():
+    point = Point(1, 2, 3)
+    assert slotted.as_tuple(point) == (1, 2, 3)
+    assert slotted.as_tuples([point, Point(4, 5, 6)]) == [(1, 2, 3), (4, 5, 6)]
+    assert slotted.as_tuples(iter([])) == []
+
+    line = Line(point, Point(4, 5, 6), [point])
+    assert slotted.as_tuple(line)[0] is point
+    assert slotted.as_tuple(line, recurse=True) == ((1, 2, 3), (4, 5, 6), [(1, 2, 3)])
+
+    # Instances of other classes use their own functions.
+    assert slotted.as_tuples([point, Frozen(1, 2)]) == [(1, 2, 3), (1, 2)]
+
+    with pytest.raises(AttributeError):
+        slotted.as_tuple(slotted.from_dict(Point, {"x": 1}))
+
+
+def test_as_dict():
+    point = Point(1, 2, 3)
+    assert slotted.as_dict(point) == {"x": 1, "y": 2, "z": 3}
+    assert list(slotted.as_dict(point)) == ["x", "y", "z"]
+
+    line = Line(point, point, {"a": (point,)})
+    assert slotted.as_dicts([line], recurse=True) == [
+        {
+            "start": {"x": 1, "y": 2, "z": 3},
+            "end": {"x": 1, "y": 2, "z": 3},
+            "points": {"a": ({"x": 1, "y": 2, "z": 3},)},
+        }
+    ]
+
+    partial = slotted.from_dict(Point, {"x": 1})
+    with pytest.raises(AttributeError):
+        slotted.as_dict(partial)
+    assert slotted.as_dict(partial, omit_unset=True) == {"x": 1}
+    assert slotted.as_dicts([partial, point], omit_unset=True) == [
+        {"x": 1},
+        {"x": 1, "y": 2, "z": 3},
+    ]
+
+
+def test_from_dict():
+    point = slotted.from_dict(Point, {"x": 1, "y": 2, "z": 3})
+    assert slotted.as_tuple(point) == (1, 2, 3)
+    points = slotted.from_dicts(Point, [{"x": 1, "y": 2, "z": 3}, {"y": 4}])
+    assert [slotted.as_dict(p, omit_unset=True) for p in points] == [
+        {"x": 1, "y": 2, "z": 3},
+        {"y": 4},
+    ]
+
+    frozen = slotted.from_dict(Frozen, {"x": 1, "y": 2})
+    assert frozen == Frozen(1, 2)
+
+    with pytest.raises(TypeError):
+        slotted.from_dict(Point, {"x": 1, "w": 2})
+
+
+def test_conversions_collect():
+    class Temporary(slotted.Slotted):
+        __slots__ = ("x",)
+
+    objs = slotted.from_dicts(Temporary, [{"x": 1}, {"x": 2}])
+    assert slotted.as_dicts(objs, recurse=True) == [{"x": 1}, {"x": 2}]
+    assert slotted.as_tuples(objs) == [(1,), (2,)]
+    ref = weakref.ref(Temporary)
+    del Temporary, objs
+    gc.collect()
+    assert ref() is None
+
+
+if __name__ == "__main__":
+    pytest.main()
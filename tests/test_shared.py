@@ -0,0 +1,129 @@
+# type: ignore
+
+import concurrent.futures
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+import slotted
+
+shared_memory = pytest.importorskip("multiprocessing.shared_memory")
+
+
+class Record(slotted.Slotted, init=True, eq=True):
+    __slots__ = ("id", "value", "__valid", "name")
+    id: int
+    value: float
+    __valid: bool
+
+
+def _records(count):
+    return [Record(i, i * 0.5, i % 2 == 0, "r{}".format(i)) for i in range(count)]
+
+
+def _load(batch):
+    return batch.load()
+
+
+def test_lazy_import():
+    code = "\n".join(
+        (
+            "import sys",
+            "import slotted",
+            "assert 'slotted._shared' not in sys.modules",
+            "assert 'multiprocessing' not in sys.modules",
+            "assert slotted.SharedBatch",
+            "assert 'slotted._shared' in sys.modules",
+        )
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+def test_shared_batch():
+    records = _records(10)
+    with slotted.SharedBatch(Record, records) as batch:
+        assert batch.cls is Record
+        assert len(batch) == 10
+        assert batch.load() == records
+
+        handle = pickle.loads(pickle.dumps(batch))
+        assert len(pickle.dumps(batch)) < 1024
+        assert handle.load() == records
+        handle.close()  # handles don't own the block
+        assert batch.load() == records
+
+        with batch.open() as rows:
+            assert len(rows) == 10
+            assert rows[-1].id == 9
+            assert [r.value for r in rows] == [r.value for r in records]
+            assert rows[2]._Record__valid is True
+            assert rows[3].name == "r3"
+            with pytest.raises(TypeError):
+                rows[0].id = 1
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(batch.name)
+    batch.close()
+
+
+def test_shared_batch_split():
+    records = _records(10000)
+    with slotted.SharedBatch(Record, records) as batch:
+        parts = batch.split(3)
+        assert [len(p) for p in parts] == [3333, 3333, 3334]
+        assert sum((p.load() for p in parts), []) == records
+        assert len(parts[1].split(2)[1]) == 1667
+        with slotted.SharedBatch(Record, records[:2]) as small:
+            assert [len(p) for p in small.split(4)] == [1, 1]
+        with pytest.raises(ValueError):
+            batch.split(0)
+
+
+def test_shared_batch_values():
+    # Values that don't match the annotations are pickled.
+    records = [Record(2**70, None, True, None), Record(1, 0.5, "yes", ())]
+    with slotted.SharedBatch(Record, records) as batch:
+        assert batch.load() == records
+        with batch.open() as rows:
+            assert rows[1]._Record__valid == "yes"
+
+    # Values must have the exact type to be unboxed (1.0 == 1 and True == 1).
+    records = [Record(True, 1, 1, None), Record(2, 0.5, False, None)]
+    with slotted.SharedBatch(Record, records) as batch:
+        loaded = batch.load()
+        assert loaded == records
+        assert [type(r.id) for r in loaded] == [bool, int]
+        assert [type(r.value) for r in loaded] == [int, float]
+        assert [type(r._Record__valid) for r in loaded] == [int, bool]
+        with batch.open() as rows:
+            assert type(rows[0].value) is int
+            assert type(rows[1].value) is float
+
+    with slotted.SharedBatch(Record, []) as batch:
+        assert batch.load() == []
+
+    with pytest.raises(AttributeError):
+        slotted.SharedBatch(Record, [Record.__new__(Record)])
+
+
+def test_shared_batch_gc():
+    batch = slotted.SharedBatch(Record, _records(1))
+    name = batch.name
+    del batch
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name)
+
+
+def test_shared_batch_process_pool():
+    records = _records(1000)
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        with slotted.SharedBatch(Record, records) as batch:
+            loaded = list(executor.map(_load, batch.split(4)))
+            assert sum(loaded, []) == records
+            assert batch.load() == records
+
+
+if __name__ == "__main__":
+    pytest.main()
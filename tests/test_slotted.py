@@ -1,5 +1,11 @@
 # type: ignore
 
+import copy
+import pickle
+import threading
+import typing
+from typing import ClassVar
+
 import pytest
 import six
 
@@ -46,6 +52,565 @@ def test_slots():
     assert slotted.slots(ForcedFooBar, mangled=True) == {"foo", "_FooBar__foobar"}
 
 
+def test_slot_layout():
+    layout = slotted.slot_layout(ForcedFooBar)
+    assert [i.name for i in layout] == ["foo", "__foobar"]
+    assert [i.mangled_name for i in layout] == ["foo", "_FooBar__foobar"]
+    assert [i.owner for i in layout] == [Foo, FooBar]
+    assert layout[1].descriptor is FooBar.__dict__["_FooBar__foobar"]
+    assert slotted.slot_layout(ForcedFooBar) is layout
+
+    class Redeclared(ForcedBar):
+        __slots__ = ("foo", "baz")
+
+    layout = slotted.slot_layout(Redeclared)
+    assert [i.name for i in layout] == ["foo", "bar", "baz"]
+    assert layout[0].owner is Redeclared
+
+
+def test_slots_cached():
+    assert slotted.slot_layout(ForcedBar) is slotted.slot_layout(ForcedBar)
+    assert slotted.slot_layout(Bar) is slotted.slot_layout(Bar)
+
+    # Callers get a copy they can mutate.
+    names = slotted.slots(Bar)
+    names.add("baz")
+    assert slotted.slots(Bar) == {"foo", "bar"}
+    assert "__slotted_layout__" not in Bar.__dict__
+
+
+def test_init():
+    class Point(slotted.Slotted, init=True):
+        __slots__ = ("x", "__y")
+
+    class Point3D(Point, init=True, defaults={"z": 0}):
+        __slots__ = ("z", "__weakref__")
+
+    point = Point3D(1, 2)
+    assert (point.x, point._Point__y, point.z) == (1, 2, 0)
+    point = Point3D(1, y=2, z=3)
+    assert (point.x, point._Point__y, point.z) == (1, 2, 3)
+    with pytest.raises(TypeError):
+        Point3D(1)
+
+
+def test_init_errors():
+    with pytest.raises(TypeError):
+
+        class NonDefaultAfterDefault(slotted.Slotted, init=True, defaults={"x": 0}):
+            __slots__ = ("x", "y")
+
+    with pytest.raises(TypeError):
+
+        class NotASlot(slotted.Slotted, defaults={"y": 0}):
+            __slots__ = ("x",)
+
+    with pytest.raises(TypeError):
+
+        class AlreadyDefined(slotted.Slotted, init=True):
+            __slots__ = ("x",)
+
+            def __init__(self, x):
+                self.x = x
+
+
+def test_annotations():
+    class Point(slotted.Slotted):
+        x: int
+        y: int = 0
+        __label: str = "point"
+        dimensions: typing.ClassVar[int] = 2
+        origin: "ClassVar[Point]"
+
+        def __init__(self, x):
+            self.x = x
+
+    assert Point.__slots__ == ("x", "y", "__label")
+    assert Point.dimensions == 2
+    assert not isinstance(Point.__dict__["y"], int)
+
+    point = Point(1)
+    assert (point.x, point.y, point._Point__label) == (1, 0, "point")
+    with pytest.raises(AttributeError):
+        point.z = 3
+
+    # Annotations of inherited slots don't add slots again.
+    class Point3D(Point, init=True):
+        x: float
+        z: int = 0
+
+    assert Point3D.__slots__ == ("z",)
+    point = Point3D(1, 2)
+    assert (point.x, point.y, point._Point__label, point.z) == (1, 2, "point", 0)
+
+
+def test_class_level_defaults():
+    class Point(slotted.Slotted, init=True, defaults={"y": 1}):
+        __slots__ = ("x", "y")
+        x = 0
+        y = 0
+
+    assert (Point().x, Point().y) == (0, 1)
+
+    class Frozen(slotted.Slotted, frozen=True):
+        x: int = 0
+
+    assert Frozen().x == 0
+    assert Frozen() == Frozen()
+
+    # Values of annotated slots of the bases override their defaults.
+    class Base(slotted.Slotted):
+        x: int = 0
+        __y: int = 0
+
+    class Child(Base):
+        x: int = 5
+        _Base__y: int = 6
+
+    assert "x" not in Child.__dict__
+    child = Child()
+    assert (child.x, child._Base__y) == (5, 6)
+    child.x = 3
+    assert child.x == 3
+    assert Base().x == 0
+
+    class InitChild(Base, init=True):
+        x: int = 5
+
+    assert InitChild().x == 5
+    assert InitChild(1).x == 1
+
+    # Mutable defaults would be shared by all instances.
+    for value in ([], {}, set()):
+        with pytest.raises(ValueError):
+
+            class Mutable(slotted.Slotted):
+                x: object = value
+
+
+class PickleBase(slotted.Slotted, init=True, reduce=True):
+    __slots__ = ("x", "__y", "__weakref__")
+
+
+class PickleChild(PickleBase):
+    __slots__ = ("z",)
+
+
+def test_reduce():
+    obj = PickleChild(1, bytearray(b"y"))
+    obj.z = 3
+    state = obj.__reduce_ex__(2)[2]
+    assert state == (1, bytearray(b"y"), 3)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(obj, protocol))
+        assert type(loaded) is PickleChild
+        assert (loaded.x, loaded._PickleBase__y, loaded.z) == (1, bytearray(b"y"), 3)
+    copied = copy.deepcopy(obj)
+    assert (copied.x, copied._PickleBase__y, copied.z) == (1, bytearray(b"y"), 3)
+
+
+def test_reduce_unset():
+    obj = PickleChild(1, 2)
+    assert obj.__reduce_ex__(2)[2] == (1, 2, slotted._generate.UNSET)
+    loaded = pickle.loads(pickle.dumps(obj))
+    assert not hasattr(loaded, "z")
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="requires protocol 5")
+def test_reduce_out_of_band():
+    for value in (bytearray(b"buffer"), b"buffer"):
+        obj = PickleBase(1, value)
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        loaded = pickle.loads(data, buffers=buffers)
+        assert type(loaded._PickleBase__y) is type(value)
+        assert loaded._PickleBase__y == value
+
+
+class CopyBase(slotted.Slotted, init=True, copy=True):
+    __slots__ = ("x", "__y", "__weakref__")
+
+
+class CopyChild(CopyBase):
+    __slots__ = ("z",)
+
+
+def test_copy():
+    obj = CopyChild(1, [2])
+    copied = copy.copy(obj)
+    assert type(copied) is CopyChild
+    assert copied.x == 1
+    assert copied._CopyBase__y is obj._CopyBase__y
+    assert not hasattr(copied, "z")
+
+    obj.z = obj
+    deep_copied = copy.deepcopy(obj)
+    assert deep_copied._CopyBase__y == [2]
+    assert deep_copied._CopyBase__y is not obj._CopyBase__y
+    assert deep_copied.z is deep_copied
+
+
+def test_replace():
+    obj = CopyChild(1, 2)
+    replaced = obj.replace(y=3, z=4)
+    assert (replaced.x, replaced._CopyBase__y, replaced.z) == (1, 3, 4)
+    assert (obj.x, obj._CopyBase__y) == (1, 2)
+    assert not hasattr(obj, "z")
+    with pytest.raises(TypeError):
+        obj.replace(w=1)
+
+
+class FrozenBase(slotted.Slotted, init=True, frozen=True, reduce=True, copy=True):
+    __slots__ = ("x", "__y")
+
+
+class FrozenChild(FrozenBase):
+    __slots__ = ("z",)
+
+
+def test_frozen():
+    obj = FrozenBase(1, [2])
+    with pytest.raises(AttributeError):
+        obj.x = 2
+    with pytest.raises(AttributeError):
+        del obj.x
+    assert obj.x == 1
+
+    assert obj == FrozenBase(1, [2])
+    assert obj != FrozenBase(1, [3])
+    assert obj != FrozenChild(1, [2])
+    assert slotted.slots(FrozenBase) == {"x", "__y"}
+    assert slotted.slots(FrozenBase, hidden=True) == {"x", "__y", "__slotted_hash__"}
+    assert slotted.slots(FrozenChild, hidden=True) == {
+        "x",
+        "__y",
+        "__slotted_hash__",
+        "z",
+    }
+
+    with pytest.raises(TypeError):
+
+        class Unfrozen(FrozenBase, frozen=False):
+            pass
+
+
+def test_frozen_hash():
+    obj = FrozenBase(1, (2,))
+    assert not hasattr(obj, "__slotted_hash__")
+    assert hash(obj) == hash((1, (2,)))
+    assert obj.__slotted_hash__ == hash(obj)
+    assert {obj: 1}[FrozenBase(1, (2,))] == 1
+    with pytest.raises(TypeError):
+        hash(FrozenBase(1, [2]))
+
+    child = FrozenChild(1, 2)
+    assert hash(child) == hash((1, 2, slotted._generate.UNSET))
+
+
+def test_frozen_pickle_copy():
+    obj = FrozenChild(1, (2,))
+    hash(obj)
+    assert obj.__reduce_ex__(2)[2] == (1, (2,), slotted._generate.UNSET)
+    for loaded in (
+        pickle.loads(pickle.dumps(obj)),
+        copy.copy(obj),
+        copy.deepcopy(obj),
+    ):
+        assert type(loaded) is FrozenChild
+        assert loaded == obj
+        assert not hasattr(loaded, "__slotted_hash__")
+        assert hash(loaded) == hash(obj)
+
+    replaced = obj.replace(z=3)
+    assert (replaced.x, replaced._FrozenBase__y, replaced.z) == (1, (2,), 3)
+
+
+class PlainFrozen(slotted.Slotted, init=True, frozen=True):
+    __slots__ = ("x", "__y", "__weakref__")
+
+
+def test_frozen_pickle_copy_default():
+    obj = PlainFrozen(1, (2,))
+    hash(obj)
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(obj, protocol))
+        assert type(loaded) is PlainFrozen
+        assert loaded == obj
+        assert not hasattr(loaded, "__slotted_hash__")
+    for copied in (copy.copy(obj), copy.deepcopy(obj)):
+        assert type(copied) is PlainFrozen
+        assert (copied.x, copied._PlainFrozen__y) == (1, (2,))
+        assert hash(copied) == hash(obj)
+        with pytest.raises(AttributeError):
+            copied.x = 2
+
+
+class Record(slotted.Slotted, init=True, eq=True, order=True, repr=True):
+    __slots__ = ("x", "__y", "note")
+
+
+class RecordExcluded(Record, exclude=("note",)):
+    pass
+
+
+def test_eq():
+    assert Record(1, 2, 3) == Record(1, 2, 3)
+    assert Record(1, 2, 3) != Record(1, 2, 4)
+    assert Record(1, 2, 3) != RecordExcluded(1, 2, 3)
+    assert Record.__hash__ is None
+    assert Record.__new__(Record) == Record.__new__(Record)
+    assert RecordExcluded(1, 2, 3) == RecordExcluded(1, 2, 4)
+
+    nan = Record(float("nan"), 2, 3)
+    assert nan == nan
+    assert not nan != nan
+    assert nan != Record(float("nan"), 2, 3)
+
+
+def test_eq_own_hash():
+    class Hashed(slotted.Slotted, init=True, eq=True):
+        __slots__ = ("x",)
+
+        def __hash__(self):
+            return 42
+
+    assert Hashed(1) == Hashed(1)
+    assert hash(Hashed(1)) == 42
+
+
+def test_order():
+    records = [Record(2, 0, 0), Record(1, 2, 0), Record(1, 1, 5), Record(1, 1, 4)]
+    assert sorted(records) == sorted(records, key=lambda r: (r.x, r._Record__y, r.note))
+    assert Record(1, 1, 1) <= Record(1, 1, 1)
+    assert Record(1, 1, 2) > Record(1, 1, 1)
+    assert Record(1, 1, 1) >= Record(1, 1, 1)
+    assert not RecordExcluded(1, 1, 2) > RecordExcluded(1, 1, 1)
+    with pytest.raises(TypeError):
+        assert Record(1, 1, 1) < RecordExcluded(1, 1, 1)
+
+
+def test_repr():
+    assert repr(Record(1, "2", None)) == "Record(x=1, y='2', note=None)"
+    assert repr(RecordExcluded(1, 2, 3)) == "RecordExcluded(x=1, y=2)"
+    assert repr(Record.__new__(Record)) == "Record(x=UNSET, y=UNSET, note=UNSET)"
+
+    record = Record(1, 2, None)
+    record.note = [record]
+    assert repr(record) == "Record(x=1, y=2, note=[...])"
+
+
+def test_exclude_errors():
+    with pytest.raises(TypeError):
+
+        class NotASlot(slotted.Slotted, eq=True, exclude=("y",)):
+            __slots__ = ("x",)
+
+    with pytest.raises(TypeError):
+
+        class AlreadyDefined(slotted.Slotted, repr=True):
+            def __repr__(self):
+                return ""
+
+
+def _census_entry(cls):
+    return next(e for e in slotted.census() if e.cls is cls)
+
+
+def test_track_instances():
+    class Tracked(slotted.Slotted, init=True, track_instances=True):
+        __slots__ = ("x",)
+
+    deleted = []
+
+    class TrackedChild(Tracked):
+        def __del__(self):
+            deleted.append(self.x)
+
+    objs = [Tracked(i) for i in range(3)]
+    del objs[:2]
+    assert _census_entry(Tracked) == (Tracked, 1, 3, 3)
+
+    child = TrackedChild(4)
+    assert _census_entry(TrackedChild) == (TrackedChild, 1, 1, 1)
+    del child
+    assert deleted == [4]
+    assert _census_entry(TrackedChild) == (TrackedChild, 0, 1, 1)
+    assert _census_entry(Tracked).live == 1
+
+    assert "__del__" not in slotted.Slotted.__dict__
+    assert all(e.cls is not CopyBase for e in slotted.census())
+
+
+def test_track_instances_pool():
+    class TrackedPooled(slotted.Slotted, init=True, track_instances=True, pool=1):
+        __slots__ = ("x",)
+
+    obj = TrackedPooled(1)
+    slotted.release(obj)
+    assert TrackedPooled(2) is obj
+    assert _census_entry(TrackedPooled) == (TrackedPooled, 1, 1, 1)
+
+
+def test_track_instances_threads():
+    class TrackedThreaded(slotted.Slotted, track_instances=True):
+        __slots__ = ()
+
+    def work():
+        for _ in range(1000):
+            TrackedThreaded()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    entry = _census_entry(TrackedThreaded)
+    assert (entry.live, entry.created) == (0, 8000)
+
+
+class TrackedRow(slotted.Slotted, init=True, copy=True, track_instances=True):
+    __slots__ = ("x", "y")
+    x: int
+
+
+def test_track_instances_library():
+    # Instances made by the library without calling the class are counted too.
+    obj = TrackedRow(1, "a")
+    objs = [
+        copy.copy(obj),
+        copy.deepcopy(obj),
+        pickle.loads(pickle.dumps(obj)),
+        slotted.from_rows(TrackedRow, [(2, "b")])[0],
+    ]
+    array = slotted.SlottedArray(TrackedRow)
+    array.append(obj)
+    objs.extend((array[0], array.materialize(0)))
+    slotted.memory_report(TrackedRow)
+    assert _census_entry(TrackedRow).live == 1 + len(objs)
+    del obj, objs, array
+    assert _census_entry(TrackedRow).live == 0
+
+
+def test_cached_slot_property():
+    calls = []
+
+    class Circle(slotted.Slotted, init=True, eq=True, repr=True):
+        __slots__ = ("radius",)
+
+        @slotted.cached_slot_property
+        def area(self):
+            """Area."""
+            calls.append(self.radius)
+            return 3 * self.radius**2
+
+    circle = Circle(2)
+    assert circle.area == circle.area == 12
+    assert calls == [2]
+    del circle.area
+    circle.radius = 1
+    assert circle.area == 3
+    assert calls == [2, 1]
+    circle.area = 0
+    assert circle.area == 0
+    assert Circle.area.__doc__ == "Area."
+
+    assert slotted.slots(Circle) == frozenset(("radius",))
+    assert "__slotted_cached_area__" in slotted.slots(Circle, hidden=True)
+    assert repr(circle) == "Circle(radius=1)"
+    assert circle == Circle(1)
+
+    class Frozen(slotted.Slotted, init=True, frozen=True):
+        __slots__ = ("x",)
+
+        @slotted.cached_slot_property
+        def double(self):
+            return self.x * 2
+
+    frozen = Frozen(2)
+    assert frozen.double == 4
+    assert hash(frozen) == hash(Frozen(2))
+
+    class Redefined(Circle):
+        @slotted.cached_slot_property
+        def area(self):
+            return 0
+
+    assert Redefined.__slots__ == ()
+    assert Redefined(2).area == 0
+
+    with pytest.raises(ValueError):
+
+        class Conflict(slotted.Slotted):
+            __slots__ = ("value",)
+
+            @slotted.cached_slot_property
+            def value(self):
+                return 1
+
+    class NotSlotted(object):
+        @slotted.cached_slot_property
+        def value(self):
+            return 1
+
+    with pytest.raises(TypeError):
+        _ = NotSlotted().value
+
+
+class Cached(slotted.Slotted, init=True, reduce=True, copy=True, pool=1):
+    __slots__ = ("x",)
+
+    @slotted.cached_slot_property
+    def double(self):
+        return [self.x * 2]
+
+
+def test_cached_slot_property_pickle_copy():
+    obj = Cached(1)
+    double = obj.double
+    for other in (pickle.loads(pickle.dumps(obj)), copy.deepcopy(obj)):
+        assert other.double == double
+        assert other.double is not double
+    assert copy.copy(obj).double is double
+    assert obj.replace(x=2).double == [4]
+
+    unset = pickle.loads(pickle.dumps(Cached(3)))
+    assert unset.double == [6]
+
+    slotted.release(obj)
+    assert Cached(5).double == [10]
+
+
+def test_strict():
+    class StrictBase(slotted.Slotted, strict=True):
+        __slots__ = ("x", "y")
+
+    with pytest.raises(TypeError):
+
+        class Redeclared(StrictBase):
+            __slots__ = ("x", "z")
+
+    with pytest.raises(TypeError):
+
+        class Repeated(slotted.Slotted, strict=True):
+            __slots__ = ("x", "x")
+
+    with pytest.raises(TypeError):
+
+        class HiddenWeakref(set, slotted.Slotted, strict=True):
+            __slots__ = ()
+
+    class Dropped(StrictBase, strict="drop"):
+        __slots__ = ("x", "z")
+
+    assert Dropped.__slots__ == ("z",)
+    assert slotted.slots(Dropped) == frozenset(("x", "y", "z"))
+    assert slotted.layout_report(Dropped).redundant_slots == ()
+    assert slotted.layout_report(Dropped).added_size == (
+        slotted.layout_report(StrictBase).added_size // 2
+    )
+
+
 def test_non_object():
     class NonObject:
         pass